@@ -6,9 +6,13 @@ from respx import MockRouter
 from respx import mock as respx_mock
 from toggl_python.api import ROOT_URL
 from toggl_python.auth import TokenAuth
-from toggl_python.entities.report_time_entry import REPORT_ROOT_URL, ReportTimeEntry
-from toggl_python.entities.user import CurrentUser
-from toggl_python.entities.workspace import Workspace
+from toggl_python.entities.report_time_entry import (
+    REPORT_ROOT_URL,
+    AsyncReportTimeEntry,
+    ReportTimeEntry,
+)
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.entities.workspace import AsyncWorkspace, Workspace
 
 from tests.responses.me_get import FAKE_TOKEN
 
@@ -47,3 +51,29 @@ def authed_report_time_entry() -> ReportTimeEntry:
     auth = TokenAuth(token=FAKE_TOKEN)
 
     return ReportTimeEntry(auth=auth)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def async_authed_current_user() -> AsyncCurrentUser:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    return AsyncCurrentUser(auth=auth)
+
+
+@pytest.fixture
+def async_authed_workspace() -> AsyncWorkspace:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    return AsyncWorkspace(auth=auth)
+
+
+@pytest.fixture
+def async_authed_report_time_entry() -> AsyncReportTimeEntry:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    return AsyncReportTimeEntry(auth=auth)
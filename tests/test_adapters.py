@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import List
+
+import pytest
+from httpx import MockTransport, Response
+from pydantic import ValidationError
+from toggl_python.adapters import (
+    ResponseDecoder,
+    ValidationMode,
+    construct_json,
+    decode_json,
+    encode_json,
+    get_type_adapter,
+    select_fields,
+)
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.workspace import Workspace
+from toggl_python.schemas.base import BulkEditOperation, BulkEditOperations
+from toggl_python.schemas.current_user import (
+    UpdateMePasswordRequest,
+    UpdateMePreferencesRequest,
+)
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.report_time_entry import (
+    ReportTimeEntryItem,
+    SearchReportTimeEntriesResponse,
+)
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+def test_get_type_adapter__is_cached() -> None:
+    first_adapter = get_type_adapter(List[ProjectResponse])
+    second_adapter = get_type_adapter(List[ProjectResponse])
+
+    assert first_adapter is second_adapter
+    assert first_adapter is not get_type_adapter(ProjectResponse)
+
+
+def test_decode_json__list_of_models() -> None:
+    content = json.dumps([PROJECT_RESPONSE, PROJECT_RESPONSE]).encode()
+    expected_result = [ProjectResponse.model_validate(PROJECT_RESPONSE)] * 2
+
+    result = decode_json(content, List[ProjectResponse])
+
+    assert result == expected_result
+
+
+def test_encode_json__model_with_excluded_fields() -> None:
+    request_schema = UpdateMePreferencesRequest(date_format="YYYY-MM-DD", duration_format=None)
+
+    result = encode_json(request_schema, exclude_none=True, exclude_unset=True)
+
+    assert result == b'{"date_format":"YYYY-MM-DD"}'
+
+
+def test_encode_json__secrets_are_revealed() -> None:
+    request_schema = UpdateMePasswordRequest(
+        current_password="paSsw0rd", new_password="neW_passw0rd"
+    )
+
+    result = encode_json(request_schema)
+
+    assert json.loads(result) == {"current_password": "paSsw0rd", "password": "neW_passw0rd"}
+
+
+def test_encode_json__list_with_explicit_schema() -> None:
+    operations = [
+        BulkEditOperation(
+            operation=BulkEditOperations.change, field_name="billable", field_value=True
+        )
+    ]
+
+    result = encode_json(operations, List[BulkEditOperation], exclude_none=True)
+
+    assert json.loads(result) == [{"op": "replace", "path": "/billable", "value": True}]
+
+
+def test_construct_json__nested_models_are_built_without_validation() -> None:
+    content = json.dumps([SEARCH_REPORT_TIME_ENTRY_RESPONSE]).encode()
+    time_entry = SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]
+
+    result = construct_json(content, List[SearchReportTimeEntriesResponse])
+
+    assert isinstance(result[0], SearchReportTimeEntriesResponse)
+    assert isinstance(result[0].time_entries[0], ReportTimeEntryItem)
+    assert result[0].time_entries[0].id == time_entry["id"]
+    assert result[0].time_entries[0].start == time_entry["start"]
+    assert result[0].task_id is None
+
+
+def test_response_decoder__trusted_mode_skips_validation() -> None:
+    content = json.dumps([{"id": "not an integer"}]).encode()
+    decoder = ResponseDecoder(mode="trusted")
+
+    result = decoder(content, List[ProjectResponse])
+
+    assert isinstance(result[0], ProjectResponse)
+    assert result[0].id == "not an integer"
+
+
+def test_response_decoder__full_mode_raises_validation_error() -> None:
+    content = json.dumps({"id": "not an integer"}).encode()
+    decoder = ResponseDecoder()
+
+    with pytest.raises(ValidationError):
+        _ = decoder(content, ProjectResponse)
+
+
+def test_response_decoder__sampled_mode_logs_drift(caplog: pytest.LogCaptureFixture) -> None:
+    valid_content = json.dumps(PROJECT_RESPONSE).encode()
+    invalid_content = json.dumps({**PROJECT_RESPONSE, "id": "not an integer"}).encode()
+    decoder = ResponseDecoder(mode=ValidationMode.sampled, sample_rate=2)
+
+    with caplog.at_level(logging.WARNING, logger="toggl_python.adapters"):
+        first_result = decoder(invalid_content, ProjectResponse)
+        second_result = decoder(invalid_content, ProjectResponse)
+        third_result = decoder(valid_content, ProjectResponse)
+
+    assert first_result.id == "not an integer"
+    assert second_result.id == "not an integer"
+    assert third_result == ProjectResponse.model_validate(PROJECT_RESPONSE)
+    assert len(caplog.records) == 1
+    assert "ProjectResponse" in caplog.records[0].getMessage()
+
+
+def test_response_decoder__invalid_sample_rate() -> None:
+    with pytest.raises(ValueError, match="Sample rate must be at least 1"):
+        _ = ResponseDecoder(mode=ValidationMode.sampled, sample_rate=0)
+
+
+def test_api_wrapper__trusted_responses() -> None:
+    transport = MockTransport(lambda _: Response(status_code=200, json=[PROJECT_RESPONSE]))
+    workspace = Workspace(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, validate_responses="trusted"
+    )
+
+    result = workspace.get_projects(workspace_id=PROJECT_RESPONSE["workspace_id"])
+
+    assert result[0].id == PROJECT_RESPONSE["id"]
+    assert result[0].created_at == PROJECT_RESPONSE["created_at"]
+
+
+def test_select_fields__projection_model_is_cached() -> None:
+    projection = select_fields(ProjectResponse, ["name", "id"])
+
+    assert projection is select_fields(ProjectResponse, ("id", "name", "id"))
+    assert list(projection.model_fields) == ["id", "name"]
+    assert select_fields(ProjectResponse, None) is ProjectResponse
+
+
+def test_select_fields__unknown_field() -> None:
+    with pytest.raises(ValueError, match="ProjectResponse has no fields: unknown"):
+        _ = select_fields(ProjectResponse, ["id", "unknown"])
+
+
+def test_decode_json__projection_skips_other_fields() -> None:
+    content = json.dumps([{**PROJECT_RESPONSE, "created_at": "invalid datetime"}]).encode()
+    projection = select_fields(ProjectResponse, ["id", "name", "active"])
+
+    result = decode_json(content, List[projection])
+
+    assert result[0].model_dump() == {
+        "id": PROJECT_RESPONSE["id"],
+        "name": PROJECT_RESPONSE["name"],
+        "active": PROJECT_RESPONSE["active"],
+    }
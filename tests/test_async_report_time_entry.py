@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import Response
+from toggl_python.reports import ReportOutput
+from toggl_python.schemas.report_time_entry import SearchReportTimeEntriesResponse
+
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.report_time_entry import AsyncReportTimeEntry
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_search_report_time_entries__with_page_number(
+    response_report_mock: MockRouter,
+    async_authed_report_time_entry: AsyncReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    request_body = {"user_ids": [123], "page_size": 10, "first_row_number": 21}
+    mocked_route = response_report_mock.post(uri, json=request_body).mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = [
+        SearchReportTimeEntriesResponse.model_validate(SEARCH_REPORT_TIME_ENTRY_RESPONSE)
+    ]
+
+    result = await async_authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, user_ids=[123], page_size=10, page_number=2
+    )
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_search_report_time_entries__without_page_number(
+    response_report_mock: MockRouter,
+    async_authed_report_time_entry: AsyncReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    mocked_route = response_report_mock.post(uri, json={"project_ids": [1]}).mock(
+        return_value=Response(status_code=200, json=[]),
+    )
+
+    result = await async_authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, project_ids=[1]
+    )
+
+    assert mocked_route.called is True
+    assert result == []
+
+
+async def test_search_report_time_entries__rows_output(
+    response_report_mock: MockRouter,
+    async_authed_report_time_entry: AsyncReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    mocked_route = response_report_mock.post(uri).mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+
+    result = await async_authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, project_ids=[1], output=ReportOutput.rows
+    )
+
+    assert mocked_route.called is True
+    assert result[0].username == SEARCH_REPORT_TIME_ENTRY_RESPONSE["username"]
+
+
+async def test_search_iter__follows_next_row_number(
+    response_report_mock: MockRouter,
+    async_authed_report_time_entry: AsyncReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    request_body = {"start_date": "2024-07-01"}
+    _ = response_report_mock.post(uri, json=request_body).mock(
+        return_value=Response(
+            status_code=200,
+            json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE],
+            headers={"X-Next-Row-Number": "2"},
+        ),
+    )
+    _ = response_report_mock.post(uri, json={**request_body, "first_row_number": 2}).mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = [
+        SearchReportTimeEntriesResponse.model_validate(SEARCH_REPORT_TIME_ENTRY_RESPONSE)
+    ] * 2
+
+    result = [
+        group
+        async for group in async_authed_report_time_entry.search_iter(
+            workspace_id=fake_workspace_id, start_date="2024-07-01"
+        )
+    ]
+
+    assert result == expected_result
+
+
+async def test_search_iter__columns_output(
+    async_authed_report_time_entry: AsyncReportTimeEntry,
+) -> None:
+    with pytest.raises(ValueError, match="Columns output is not supported by `search_iter`"):
+        _ = async_authed_report_time_entry.search_iter(
+            workspace_id=123, start_date="2024-07-01", output=ReportOutput.columns
+        )
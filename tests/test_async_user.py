@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Type
+
+import pytest
+from httpx import Response
+from toggl_python.exceptions import BadRequest
+from toggl_python.schemas.current_user import (
+    DateFormat,
+    MeFeaturesResponse,
+    MePreferencesResponse,
+    MeResponse,
+    MeResponseWithRelatedData,
+    UpdateMeResponse,
+)
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import (
+    MeTimeEntryResponse,
+    MeTimeEntryWithMetaResponse,
+    MeWebTimerResponse,
+)
+
+from tests.responses.me_get import (
+    ME_FEATURES_RESPONSE,
+    ME_PREFERENCES_RESPONSE,
+    ME_RESPONSE,
+    ME_RESPONSE_WITH_RELATED_DATA,
+    ME_WEB_TIMER_RESPONSE,
+)
+from tests.responses.me_put import UPDATE_ME_RESPONSE
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE, ME_TIME_ENTRY_WITH_META_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.user import AsyncCurrentUser
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_logged__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/logged").mock(
+        return_value=Response(status_code=200),
+    )
+
+    result = await async_authed_current_user.logged()
+
+    assert mocked_route.called is True
+    assert result is True
+
+
+async def test_logged__exception_is_raised(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/logged").mock(
+        return_value=Response(status_code=403),
+    )
+
+    with pytest.raises(BadRequest):
+        _ = await async_authed_current_user.logged()
+
+    assert mocked_route.called is True
+
+
+@pytest.mark.parametrize(
+    argnames=("with_related_data", "response_body", "response_schema"),
+    argvalues=[
+        (False, ME_RESPONSE, MeResponse),
+        (True, ME_RESPONSE_WITH_RELATED_DATA, MeResponseWithRelatedData),
+    ],
+    ids=("short", "with_related_data"),
+)
+async def test_me__ok(
+    response_mock: MockRouter,
+    async_authed_current_user: AsyncCurrentUser,
+    with_related_data: bool,
+    response_body: Dict,
+    response_schema: Type[MeResponse],
+) -> None:
+    mocked_route = response_mock.get("/me").mock(
+        return_value=Response(status_code=200, json=response_body),
+    )
+    expected_result = response_schema.model_validate(response_body)
+
+    result = await async_authed_current_user.me(with_related_data=with_related_data)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_update_me__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.put("/me", json={"fullname": "New User"}).mock(
+        return_value=Response(status_code=200, json=UPDATE_ME_RESPONSE),
+    )
+    expected_result = UpdateMeResponse.model_validate(UPDATE_ME_RESPONSE)
+
+    result = await async_authed_current_user.update_me(fullname="New User")
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_change_password__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.put(
+        "/me", json={"current_password": "paSsw0rd", "password": "neW_passw0rd"}
+    ).mock(
+        return_value=Response(status_code=200),
+    )
+
+    result = await async_authed_current_user.change_password(
+        current_password="paSsw0rd",
+        new_password="neW_passw0rd",
+    )
+
+    assert mocked_route.called is True
+    assert result is True
+
+
+async def test_features__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/features").mock(
+        return_value=Response(status_code=200, json=ME_FEATURES_RESPONSE),
+    )
+    expected_result = [MeFeaturesResponse.model_validate(ME_FEATURES_RESPONSE[0])]
+
+    result = await async_authed_current_user.features()
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_preferences__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/preferences").mock(
+        return_value=Response(status_code=200, json=ME_PREFERENCES_RESPONSE),
+    )
+    expected_result = MePreferencesResponse.model_validate(ME_PREFERENCES_RESPONSE)
+
+    result = await async_authed_current_user.preferences()
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_update_preferences__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.post(
+        "/me/preferences", json={"date_format": DateFormat.ymd_dash.value}
+    ).mock(
+        return_value=Response(status_code=200),
+    )
+
+    result = await async_authed_current_user.update_preferences(date_format=DateFormat.ymd_dash)
+
+    assert mocked_route.called is True
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    argnames=("meta", "response_body", "response_schema"),
+    argvalues=[
+        (False, ME_TIME_ENTRY_RESPONSE, MeTimeEntryResponse),
+        (True, ME_TIME_ENTRY_WITH_META_RESPONSE, MeTimeEntryWithMetaResponse),
+    ],
+    ids=("without_meta", "with_meta"),
+)
+async def test_get_time_entry__ok(
+    response_mock: MockRouter,
+    async_authed_current_user: AsyncCurrentUser,
+    meta: bool,
+    response_body: Dict,
+    response_schema: Type[MeTimeEntryResponse],
+) -> None:
+    time_entry_id = 123
+    mocked_route = response_mock.get(f"/me/time_entries/{time_entry_id}").mock(
+        return_value=Response(status_code=200, json=response_body),
+    )
+    expected_result = response_schema.model_validate(response_body)
+
+    result = await async_authed_current_user.get_time_entry(time_entry_id, meta=meta)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_current_time_entry__no_current_entry(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/time_entries/current").mock(
+        return_value=Response(status_code=200, json={}),
+    )
+
+    result = await async_authed_current_user.get_current_time_entry()
+
+    assert mocked_route.called is True
+    assert result is None
+
+
+async def test_get_current_time_entry__null_response(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    _ = response_mock.get("/me/time_entries/current").mock(
+        return_value=Response(status_code=200, content=b"null"),
+    )
+
+    result = await async_authed_current_user.get_current_time_entry()
+
+    assert result is None
+
+
+async def test_get_time_entries__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/time_entries").mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = [MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)]
+
+    result = await async_authed_current_user.get_time_entries()
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_web_timer__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/web-timer").mock(
+        return_value=Response(status_code=200, json=ME_WEB_TIMER_RESPONSE),
+    )
+    expected_result = MeWebTimerResponse.model_validate(ME_WEB_TIMER_RESPONSE)
+
+    result = await async_authed_current_user.get_web_timer()
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_projects__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/projects", params={"include_archived": True}).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    expected_result = [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+    result = await async_authed_current_user.get_projects(include_archived=True)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_paginated_projects__ok(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    query_params = {"start_project_id": 123, "per_page": 10}
+    mocked_route = response_mock.get("/me/projects/paginated", params=query_params).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    expected_result = [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+    result = await async_authed_current_user.get_paginated_projects(**query_params)
+
+    assert mocked_route.called is True
+    assert result == expected_result
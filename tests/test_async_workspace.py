@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import Response
+from toggl_python.exceptions import BadRequest
+from toggl_python.schemas.base import BulkEditOperation, BulkEditOperations, BulkEditResponse
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse
+from toggl_python.schemas.workspace import WorkspaceResponse
+
+from tests.conftest import fake
+from tests.factories.base import bulk_edit_response_factory
+from tests.factories.project import project_request_factory, project_response_factory
+from tests.factories.time_entry import time_entry_request_factory, time_entry_response_factory
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE
+from tests.responses.workspace_get import WORKSPACE_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.workspace import AsyncWorkspace
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_get_workspace_by_id(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    mocked_route = response_mock.get(f"/workspaces/{workspace_id}").mock(
+        return_value=Response(status_code=200, json=WORKSPACE_RESPONSE),
+    )
+    expected_result = WorkspaceResponse.model_validate(WORKSPACE_RESPONSE)
+
+    result = await async_authed_workspace.get(workspace_id=workspace_id)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_workspace_by_id__not_found(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    error_message = "Incorrect workspace_id"
+    mocked_route = response_mock.get(f"/workspaces/{workspace_id}").mock(
+        return_value=Response(status_code=404, text=error_message),
+    )
+
+    with pytest.raises(BadRequest, match=error_message):
+        _ = await async_authed_workspace.get(workspace_id=workspace_id)
+
+    assert mocked_route.called is True
+
+
+async def test_get_workspaces(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    mocked_route = response_mock.get("/workspaces").mock(
+        return_value=Response(status_code=200, json=[WORKSPACE_RESPONSE]),
+    )
+    expected_result = [WorkspaceResponse.model_validate(WORKSPACE_RESPONSE)]
+
+    result = await async_authed_workspace.list()
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_update_workspace(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    new_name = "New workspace name"
+    fake_response = {**WORKSPACE_RESPONSE, "name": new_name}
+    mocked_route = response_mock.put(f"/workspaces/{workspace_id}", json={"name": new_name}).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = WorkspaceResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.update(workspace_id, name=new_name)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_create_project(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    request_body = project_request_factory()
+    fake_response = project_response_factory(workspace_id)
+    mocked_route = response_mock.post(
+        f"/workspaces/{workspace_id}/projects", json=request_body
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = ProjectResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.create_project(workspace_id, **request_body)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_project_by_id(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    project_id = 123
+    mocked_route = response_mock.get(f"/workspaces/{workspace_id}/projects/{project_id}").mock(
+        return_value=Response(status_code=200, json=PROJECT_RESPONSE),
+    )
+    expected_result = ProjectResponse.model_validate(PROJECT_RESPONSE)
+
+    result = await async_authed_workspace.get_project(workspace_id, project_id)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_get_projects(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    mocked_route = response_mock.get(
+        f"/workspaces/{workspace_id}/projects", params={"active": False}
+    ).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    expected_result = [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+    result = await async_authed_workspace.get_projects(workspace_id, active=False)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_update_project(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    project_id = fake.random_int()
+    request_body = project_request_factory()
+    fake_response = project_response_factory(workspace_id)
+    mocked_route = response_mock.put(
+        f"/workspaces/{workspace_id}/projects/{project_id}", json=request_body
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = ProjectResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.update_project(workspace_id, project_id, **request_body)
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_bulk_edit_projects(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    project_ids = [fake.random_int(), fake.random_int()]
+    project_ids_repr = ",".join(str(item) for item in project_ids)
+    edit_operation = BulkEditOperation(
+        operation=BulkEditOperations.change, field_name="name", field_value=str(fake.uuid4())
+    )
+    fake_response = bulk_edit_response_factory()
+    mocked_route = response_mock.patch(
+        f"/workspaces/{workspace_id}/projects/{project_ids_repr}"
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = BulkEditResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.bulk_edit_projects(
+        workspace_id, project_ids, operations=[edit_operation]
+    )
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_delete_project(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    project_id = fake.random_int()
+    mocked_route = response_mock.delete(f"/workspaces/{workspace_id}/projects/{project_id}").mock(
+        return_value=Response(status_code=200),
+    )
+
+    result = await async_authed_workspace.delete_project(workspace_id, project_id)
+
+    assert mocked_route.called is True
+    assert result is True
+
+
+async def test_create_time_entry(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    request_body = time_entry_request_factory(workspace_id)
+    fake_response = time_entry_response_factory(workspace_id, request_body["start"])
+    mocked_route = response_mock.post(
+        f"/workspaces/{workspace_id}/time_entries", json=request_body
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = MeTimeEntryResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.create_time_entry(
+        workspace_id,
+        start_datetime=request_body["start"],
+        created_with=request_body["created_with"],
+    )
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_update_time_entry(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    time_entry_id = 98765
+    description = "New description"
+    fake_response = {**ME_TIME_ENTRY_RESPONSE, "description": description}
+    mocked_route = response_mock.put(
+        f"/workspaces/{workspace_id}/time_entries/{time_entry_id}",
+        json={"description": description},
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = MeTimeEntryResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.update_time_entry(
+        workspace_id, time_entry_id, description=description
+    )
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_delete_time_entry(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    time_entry_id = 98765
+    mocked_route = response_mock.delete(
+        f"/workspaces/{workspace_id}/time_entries/{time_entry_id}"
+    ).mock(
+        return_value=Response(status_code=200),
+    )
+
+    result = await async_authed_workspace.delete_time_entry(workspace_id, time_entry_id)
+
+    assert mocked_route.called is True
+    assert result is True
+
+
+async def test_bulk_edit_time_entries(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = fake.random_int()
+    time_entry_ids = [fake.random_int(), fake.random_int()]
+    time_entry_ids_repr = ",".join(str(item) for item in time_entry_ids)
+    edit_operation = BulkEditOperation(
+        operation=BulkEditOperations.add, field_name="billable", field_value=True
+    )
+    fake_response = bulk_edit_response_factory()
+    mocked_route = response_mock.patch(
+        f"/workspaces/{workspace_id}/time_entries/{time_entry_ids_repr}"
+    ).mock(
+        return_value=Response(status_code=200, json=fake_response),
+    )
+    expected_result = BulkEditResponse.model_validate(fake_response)
+
+    result = await async_authed_workspace.bulk_edit_time_entries(
+        workspace_id, time_entry_ids, operations=[edit_operation]
+    )
+
+    assert mocked_route.called is True
+    assert result == expected_result
+
+
+async def test_stop_time_entry(
+    response_mock: MockRouter, async_authed_workspace: AsyncWorkspace
+) -> None:
+    workspace_id = 123
+    time_entry_id = 98765
+    mocked_route = response_mock.patch(
+        f"/workspaces/{workspace_id}/time_entries/{time_entry_id}/stop"
+    ).mock(
+        return_value=Response(status_code=200, json=ME_TIME_ENTRY_RESPONSE),
+    )
+    expected_result = MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)
+
+    result = await async_authed_workspace.stop_time_entry(workspace_id, time_entry_id)
+
+    assert mocked_route.called is True
+    assert result == expected_result
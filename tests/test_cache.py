@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Dict, List
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.cache import ValidatorCache
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.exceptions import ClientError
+from toggl_python.schemas.current_user import MePreferencesResponse, MeResponse
+
+from tests.responses.me_get import FAKE_TOKEN, ME_PREFERENCES_RESPONSE, ME_RESPONSE
+
+
+ETAG = '"abc"'
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def conditional_transport(requests: List[Request], headers: Dict[str, str]) -> MockTransport:
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        if (
+            request.headers.get("If-None-Match") == ETAG
+            or request.headers.get("If-Modified-Since") == LAST_MODIFIED
+        ):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return Response(status_code=HTTPStatus.OK, json=ME_RESPONSE, headers=headers)
+
+    return MockTransport(handler)
+
+
+def build_user(
+    requests: List[Request], headers: Dict[str, str], cache: ValidatorCache
+) -> CurrentUser:
+    return CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=conditional_transport(requests, headers),
+        validator_cache=cache,
+    )
+
+
+def test_me__etag__cached_model_is_returned_on_not_modified() -> None:
+    requests: List[Request] = []
+    cache = ValidatorCache()
+    user = build_user(requests, {"ETag": ETAG}, cache)
+
+    first_result = user.me()
+    second_result = user.me()
+
+    assert isinstance(first_result, MeResponse)
+    assert second_result is first_result
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == ETAG
+    assert len(cache) == 1
+
+
+def test_me__last_modified__cached_model_is_returned_on_not_modified() -> None:
+    requests: List[Request] = []
+    user = build_user(requests, {"Last-Modified": LAST_MODIFIED}, ValidatorCache())
+
+    first_result = user.me()
+    second_result = user.me()
+
+    assert second_result is first_result
+    assert requests[1].headers["If-Modified-Since"] == LAST_MODIFIED
+    assert "If-None-Match" not in requests[1].headers
+
+
+def test_me__without_validators__response_is_not_cached() -> None:
+    requests: List[Request] = []
+    cache = ValidatorCache()
+    user = build_user(requests, {}, cache)
+
+    first_result = user.me()
+    second_result = user.me()
+
+    assert second_result == first_result
+    assert second_result is not first_result
+    assert "If-None-Match" not in requests[1].headers
+    assert len(cache) == 0
+
+
+def test_me__without_cache__conditional_headers_are_not_sent() -> None:
+    requests: List[Request] = []
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=conditional_transport(requests, {"ETag": ETAG})
+    )
+
+    first_result = user.me()
+    second_result = user.me()
+
+    assert second_result is not first_result
+    assert "If-None-Match" not in requests[1].headers
+
+
+def test_cache_key__depends_on_url_params_and_schema() -> None:
+    key = ValidatorCache.make_key("/me", {"with_related_data": False}, MeResponse)
+
+    assert key == ValidatorCache.make_key("/me", {"with_related_data": False}, MeResponse)
+    assert key != ValidatorCache.make_key("/me", {"with_related_data": True}, MeResponse)
+    assert key != ValidatorCache.make_key(
+        "/me", {"with_related_data": False}, MePreferencesResponse
+    )
+    assert key != ValidatorCache.make_key("/me/preferences", None, MeResponse)
+
+
+def test_cache__error_response_is_raised() -> None:
+    cache = ValidatorCache()
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=MockTransport(lambda _: Response(status_code=HTTPStatus.FORBIDDEN)),
+        validator_cache=cache,
+    )
+
+    with pytest.raises(ClientError):
+        _ = user.me()
+
+    assert len(cache) == 0
+
+
+def test_validator_cache__least_recently_used_entry_is_evicted() -> None:
+    cache = ValidatorCache(max_size=2)
+    response = Response(status_code=HTTPStatus.OK, headers={"ETag": ETAG})
+    first_key = cache.make_key("/first", None, MeResponse)
+    second_key = cache.make_key("/second", None, MeResponse)
+    third_key = cache.make_key("/third", None, MeResponse)
+
+    cache.store(first_key, response, "first")
+    cache.store(second_key, response, "second")
+    _ = cache.get(first_key)
+    cache.store(third_key, response, "third")
+
+    assert cache.get(second_key) is None
+    assert cache.get(first_key) is not None
+    assert cache.get(third_key) is not None
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_async_preferences__etag__cached_model_is_returned_on_not_modified() -> None:
+    requests: List[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return Response(status_code=HTTPStatus.NOT_MODIFIED)
+
+        return Response(
+            status_code=HTTPStatus.OK, json=ME_PREFERENCES_RESPONSE, headers={"ETag": ETAG}
+        )
+
+    user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=MockTransport(handler),
+        validator_cache=ValidatorCache(),
+    )
+
+    first_result = await user.preferences()
+    second_result = await user.preferences()
+
+    assert isinstance(first_result, MePreferencesResponse)
+    assert second_result is first_result
+    assert requests[1].headers["If-None-Match"] == ETAG
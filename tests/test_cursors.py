@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+from typing import List, Optional
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.exceptions import ServerError
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.project_get import PROJECT_RESPONSE
+
+
+DEFAULT_PER_PAGE = 3
+PROJECT_IDS = list(range(2, 21, 2))
+
+
+class PaginatedProjectsServer:
+    """Serve Projects ordered by id starting from `start_project_id`."""
+
+    def __init__(self, inclusive: bool = True, failed_cursor: Optional[int] = None) -> None:
+        self.inclusive = inclusive
+        self.failed_cursor = failed_cursor
+        self.cursors: List[Optional[int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        cursor = request.url.params.get("start_project_id")
+        cursor = None if cursor is None else int(cursor)
+        per_page = int(request.url.params.get("per_page", DEFAULT_PER_PAGE))
+        with self._lock:
+            self.cursors.append(cursor)
+        if cursor is not None and cursor == self.failed_cursor:
+            return Response(status_code=500)
+
+        project_ids = [
+            project_id
+            for project_id in PROJECT_IDS
+            if cursor is None or project_id > cursor or (self.inclusive and project_id == cursor)
+        ]
+        page = [{**PROJECT_RESPONSE, "id": project_id} for project_id in project_ids[:per_page]]
+
+        return Response(status_code=200, json=page)
+
+
+def make_current_user(server: PaginatedProjectsServer) -> CurrentUser:
+    return CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+
+@pytest.mark.parametrize(argnames="inclusive", argvalues=(True, False))
+@pytest.mark.parametrize(argnames="prefetch", argvalues=(True, False))
+@pytest.mark.parametrize(argnames="per_page", argvalues=(None, 4, 10))
+def test_iter_paginated_projects(inclusive: bool, prefetch: bool, per_page: int) -> None:
+    server = PaginatedProjectsServer(inclusive=inclusive)
+    projects = make_current_user(server).iter_paginated_projects(
+        per_page=per_page, prefetch=prefetch
+    )
+
+    result = [project.id for project in projects]
+
+    assert result == PROJECT_IDS
+    assert projects.cursor == PROJECT_IDS[-1]
+    assert server.cursors[0] is None
+
+
+def test_iter_paginated_projects__resume_from_cursor() -> None:
+    server = PaginatedProjectsServer()
+    projects = make_current_user(server).iter_paginated_projects(fields=["name"])
+    iterator = iter(projects)
+    _ = [next(iterator) for _ in range(4)]
+    iterator.close()
+
+    resumed_projects = make_current_user(server).iter_paginated_projects(
+        start_project_id=projects.cursor
+    )
+    result = [project.id for project in resumed_projects]
+
+    # The 4th project may be unprocessed, because the next one was not requested
+    assert projects.cursor == PROJECT_IDS[2]
+    assert result == PROJECT_IDS[3:]
+
+
+def test_iter_paginated_projects__error() -> None:
+    server = PaginatedProjectsServer(inclusive=False, failed_cursor=PROJECT_IDS[5])
+    projects = make_current_user(server).iter_paginated_projects(prefetch=True)
+    iterator = iter(projects)
+    result = [next(iterator).id for _ in range(6)]
+
+    with pytest.raises(ServerError):
+        _ = next(iterator)
+
+    # Cursor points to the last yielded project, so iteration can be resumed
+    assert result == PROJECT_IDS[:6]
+    assert projects.cursor == PROJECT_IDS[5]
+
+
+def test_iter_paginated_projects__too_old_since_value() -> None:
+    current_user = make_current_user(PaginatedProjectsServer())
+
+    with pytest.raises(ValueError, match="Since cannot be older than 3 months"):
+        _ = current_user.iter_paginated_projects(since=1)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(argnames="prefetch", argvalues=(True, False))
+async def test_async_iter_paginated_projects(prefetch: bool) -> None:
+    server = PaginatedProjectsServer(inclusive=False)
+    current_user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+    projects = current_user.iter_paginated_projects(
+        start_project_id=PROJECT_IDS[1], per_page=4, prefetch=prefetch
+    )
+
+    result = [project.id async for project in projects]
+
+    assert result == PROJECT_IDS[2:]
+    assert projects.cursor == PROJECT_IDS[-1]
+
+
+@pytest.mark.anyio
+async def test_async_iter_paginated_projects__error() -> None:
+    server = PaginatedProjectsServer(failed_cursor=PROJECT_IDS[2])
+    current_user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+    projects = current_user.iter_paginated_projects(prefetch=True)
+
+    with pytest.raises(ServerError):
+        _ = [project async for project in projects]
+
+    assert projects.cursor == PROJECT_IDS[2]
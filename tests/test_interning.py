@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.report_time_entry import ReportTimeEntry
+from toggl_python.entities.user import CurrentUser
+from toggl_python.interning import MAX_LIST_LENGTH, InternPool
+from toggl_python.reports import ReportOutput
+from toggl_python.schemas.project import ProjectResponse
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+def json_transport(content: object) -> MockTransport:
+    def handler(_: Request) -> Response:
+        return Response(status_code=HTTPStatus.OK, json=content)
+
+    return MockTransport(handler)
+
+
+def test_intern_pool__equal_strings_are_shared() -> None:
+    pool = InternPool()
+    first_value = "test user"
+    # Decoding creates a new equal string object
+    second_value = first_value.encode().decode()
+
+    first_result = pool.intern(first_value)
+    second_result = pool.intern(second_value)
+
+    assert second_result is first_result
+    assert pool.hits == 1
+    assert pool.saved_bytes > 0
+    assert len(pool) == 1
+
+
+def test_intern_pool__small_lists_are_shared() -> None:
+    pool = InternPool()
+
+    first_result = pool.intern({"tag_ids": [1, 2]})
+    second_result = pool.intern({"tag_ids": [1, 2]})
+
+    assert second_result["tag_ids"] is first_result["tag_ids"]
+
+
+def test_intern_pool__equal_values_of_different_types_are_not_mixed() -> None:
+    pool = InternPool()
+
+    int_result = pool.intern([1])
+    bool_result = pool.intern([True])
+
+    assert bool_result is not int_result
+    assert bool_result[0] is True
+
+
+def test_intern_pool__long_lists_are_not_pooled() -> None:
+    pool = InternPool()
+    value = list(range(MAX_LIST_LENGTH + 1))
+
+    first_result = pool.intern(value)
+    second_result = pool.intern(list(value))
+
+    assert second_result is not first_result
+    assert len(pool) == 0
+
+
+def test_intern_pool__tuples_are_rebuilt() -> None:
+    pool = InternPool()
+
+    first_result = pool.intern((1, "a"))
+    second_result = pool.intern((1, "a"))
+    nested_result = pool.intern(([1], [1]))
+
+    assert second_result is first_result
+    assert nested_result[0] is nested_result[1]
+
+
+def test_intern_pool__only_repeated_fields_are_pooled() -> None:
+    pool = InternPool()
+
+    first_result = pool.intern({"username": "test user", "at": "2024-07-30T08:16:38+00:00"})
+    second_result = pool.intern({"username": "test user", "at": "2024-07-30T08:16:38+00:00"})
+
+    assert second_result["username"] is first_result["username"]
+    assert len(pool) == 1
+
+
+def test_intern_pool__custom_fields() -> None:
+    pool = InternPool(fields=["api_token"])
+
+    _ = pool.intern({"api_token": "token", "username": "test user"})
+
+    assert len(pool) == 1
+
+
+def test_intern_pool__max_size() -> None:
+    pool = InternPool(max_size=1)
+    first_value = "first"
+    second_value = "second"
+
+    _ = pool.intern(first_value)
+    _ = pool.intern(second_value)
+
+    assert pool.intern(first_value.encode().decode()) is first_value
+    assert pool.intern(second_value.encode().decode()) is not second_value
+    assert len(pool) == 1
+
+
+def test_intern_pool__clear() -> None:
+    pool = InternPool()
+    _ = pool.intern("value")
+
+    pool.clear()
+
+    assert len(pool) == 0
+
+
+def test_intern_pool__models_share_values_between_responses() -> None:
+    pool = InternPool()
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=json_transport([PROJECT_RESPONSE]),
+        intern_pool=pool,
+    )
+
+    first_result = user.get_projects()
+    second_result = user.get_projects()
+
+    assert first_result == [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+    assert second_result[0].name is first_result[0].name
+    assert len(pool) > 0
+
+
+def test_intern_pool__report_rows_share_values() -> None:
+    pool = InternPool()
+    report_time_entry = ReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=json_transport([SEARCH_REPORT_TIME_ENTRY_RESPONSE] * 2),
+        intern_pool=pool,
+    )
+
+    result = report_time_entry.search(
+        workspace_id=123, start_date="2024-07-30", output=ReportOutput.rows
+    )
+
+    assert result[1].username is result[0].username
+    assert result[1].tag_ids is result[0].tag_ids
+    assert result[1].time_entries[0] == result[0].time_entries[0]
+
+
+def test_intern_pool__streamed_list_shares_values() -> None:
+    pool = InternPool()
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=MockTransport(
+            lambda _: Response(
+                status_code=HTTPStatus.OK, content=json.dumps([PROJECT_RESPONSE] * 2).encode()
+            )
+        ),
+        intern_pool=pool,
+    )
+
+    result = list(user.iter_projects())
+
+    assert result[1].color is result[0].color
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List
+
+import pytest
+from httpx import Response
+from toggl_python.lazy import (
+    defer_datetimes,
+    filter_by_datetime,
+    get_lazy_model,
+    sort_by_datetime,
+    utc_sort_key,
+)
+from toggl_python.schemas.report_time_entry import SearchReportTimeEntriesResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse
+
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.report_time_entry import ReportTimeEntry
+    from toggl_python.entities.user import CurrentUser
+
+
+def make_time_entries(starts: List[str]) -> List[MeTimeEntryResponse]:
+    model = get_lazy_model(MeTimeEntryResponse)
+
+    return [model.model_validate({**ME_TIME_ENTRY_RESPONSE, "start": start}) for start in starts]
+
+
+def test_defer_datetimes__disabled() -> None:
+    result = defer_datetimes(MeTimeEntryResponse, enabled=False)
+
+    assert result is MeTimeEntryResponse
+
+
+def test_lazy_model__dump_round_trip() -> None:
+    lazy_model = defer_datetimes(MeTimeEntryResponse, enabled=True)
+    expected_result = MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)
+
+    time_entry = lazy_model.model_validate(ME_TIME_ENTRY_RESPONSE)
+    dumped = time_entry.model_dump()
+
+    assert not [key for key in dumped if key.startswith("raw_")]
+    assert dumped == expected_result.model_dump()
+    assert time_entry.model_dump(by_alias=True) == expected_result.model_dump(by_alias=True)
+    assert lazy_model.model_validate(dumped).model_dump() == dumped
+    assert MeTimeEntryResponse.model_validate(dumped) == expected_result
+    assert lazy_model.model_validate_json(time_entry.model_dump_json()).model_dump() == dumped
+
+
+def test_get_time_entries__lazy_datetimes(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    _ = response_mock.get("/me/time_entries").mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)
+
+    result = authed_current_user.get_time_entries(lazy_datetimes=True)
+
+    assert result[0].raw_start == ME_TIME_ENTRY_RESPONSE["start"]
+    assert "start" not in result[0].__dict__
+    assert result[0].start == expected_result.start
+    assert result[0].stop == expected_result.stop
+    assert result[0].server_deleted_at is None
+    assert result[0].id == expected_result.id
+
+
+def test_search_report_time_entries__lazy_datetimes(
+    response_report_mock: MockRouter, authed_report_time_entry: ReportTimeEntry
+) -> None:
+    fake_workspace_id = 123
+    _ = response_report_mock.post(f"/{fake_workspace_id}/search/time_entries").mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = SearchReportTimeEntriesResponse.model_validate(
+        SEARCH_REPORT_TIME_ENTRY_RESPONSE
+    )
+
+    result = authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, start_date="2024-07-30", lazy_datetimes=True
+    )
+
+    time_entry = result[0].time_entries[0]
+    assert time_entry.raw_at_tz == SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]["at_tz"]
+    assert time_entry.at_tz == expected_result.time_entries[0].at_tz
+    assert result[0].tag_ids == expected_result.tag_ids
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected_result"),
+    argvalues=(
+        ("2024-07-29T12:28:33+00:00", "2024-07-29T12:28:33"),
+        ("2024-07-29T12:28:33Z", "2024-07-29T12:28:33"),
+        ("2024-07-29T15:28:33+03:00", "2024-07-29T12:28:33"),
+        ("2024-07-29T12:28:33.500+00:00", "2024-07-29T12:28:33.5"),
+        ("2024-07-29T12:28:33.000+00:00", "2024-07-29T12:28:33"),
+        ("2024-07-29T12:28:33", "2024-07-29T12:28:33"),
+    ),
+)
+def test_utc_sort_key(value: str, expected_result: str) -> None:
+    result = utc_sort_key(value)
+
+    assert result == expected_result
+
+
+def test_sort_by_datetime__different_offsets() -> None:
+    time_entries = make_time_entries(
+        ["2024-07-29T12:00:00+00:00", "2024-07-29T13:30:00+03:00", "2024-07-29T11:00:00Z"]
+    )
+
+    result = sort_by_datetime(time_entries, "start")
+
+    assert [time_entry.start for time_entry in result] == sorted(
+        time_entry.start for time_entry in time_entries
+    )
+
+
+def test_sort_by_datetime__missing_values_are_last() -> None:
+    time_entries = make_time_entries(["2024-07-29T12:00:00Z"] * 2)
+    time_entries[0].raw_stop = None
+
+    result = sort_by_datetime(time_entries, "stop")
+
+    assert result[-1] is time_entries[0]
+
+
+def test_filter_by_datetime() -> None:
+    time_entries = make_time_entries(
+        ["2024-07-29T10:00:00Z", "2024-07-29T15:00:00+03:00", "2024-07-29T14:00:00+00:00"]
+    )
+
+    result = filter_by_datetime(
+        time_entries,
+        "start",
+        since=datetime(2024, 7, 29, 12, tzinfo=timezone.utc),
+        until=datetime(2024, 7, 29, 16, tzinfo=timezone(timedelta(hours=3))),
+    )
+
+    assert result == [time_entries[1]]
+
+
+def test_filter_by_datetime__missing_values_are_skipped() -> None:
+    time_entries = make_time_entries(["2024-07-29T10:00:00Z"])
+    time_entries[0].raw_stop = None
+
+    result = filter_by_datetime(time_entries, "stop")
+
+    assert result == []
@@ -104,6 +104,21 @@ def test_get_projects__without_query_params(
     assert result == expected_result
 
 
+def test_get_projects__with_fields(
+    response_mock: MockRouter, authed_workspace: Workspace
+) -> None:
+    workspace_id = 123
+    mocked_route = response_mock.get(f"/workspaces/{workspace_id}/projects").mock(
+        return_value=HttpxResponse(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    expected_result = {"id": PROJECT_RESPONSE["id"], "name": PROJECT_RESPONSE["name"]}
+
+    result = authed_workspace.get_projects(workspace_id=workspace_id, fields=["id", "name"])
+
+    assert mocked_route.called is True
+    assert result[0].model_dump() == expected_result
+
+
 @patch("toggl_python.schemas.base.datetime")
 def test_get_projects__too_old_since_value(
     mocked_datetime: Mock, authed_workspace: Workspace
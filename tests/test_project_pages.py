@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+from typing import Dict, List
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.workspace import AsyncWorkspace, Workspace
+from toggl_python.exceptions import ServerError
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.project_get import PROJECT_RESPONSE
+
+
+DEFAULT_PER_PAGE = 3
+
+
+class ProjectsServer:
+    """Serve `projects_count` Projects sorted by `sort_order`, optionally with total count.
+
+    Page size is capped by `max_per_page` like API does.
+    """
+
+    def __init__(
+        self,
+        projects_count: int,
+        with_total: bool,
+        failed_page: int = 0,
+        max_per_page: int = 200,
+    ) -> None:
+        self.projects_count = projects_count
+        self.with_total = with_total
+        self.failed_page = failed_page
+        self.max_per_page = max_per_page
+        self.requested_pages: List[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        page = int(request.url.params["page"])
+        per_page = min(
+            int(request.url.params.get("per_page", DEFAULT_PER_PAGE)), self.max_per_page
+        )
+        with self._lock:
+            self.requested_pages.append(page)
+        if page == self.failed_page:
+            return Response(status_code=500)
+
+        project_ids = list(range(1, self.projects_count + 1))
+        if request.url.params.get("sort_order") == "DESC":
+            project_ids.reverse()
+        page_ids = project_ids[(page - 1) * per_page : page * per_page]
+        headers: Dict[str, str] = {}
+        if self.with_total:
+            headers["X-Total-Count"] = str(self.projects_count)
+
+        return Response(
+            status_code=200,
+            json=[{**PROJECT_RESPONSE, "id": project_id} for project_id in page_ids],
+            headers=headers,
+        )
+
+
+@pytest.mark.parametrize(argnames="with_total", argvalues=(True, False))
+@pytest.mark.parametrize(argnames="per_page", argvalues=(None, 2, 7))
+def test_iter_all_projects__all_pages(with_total: bool, per_page: int) -> None:
+    server = ProjectsServer(projects_count=7, with_total=with_total)
+    workspace = Workspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    result = workspace.iter_all_projects(
+        workspace_id=123, per_page=per_page, sort_field="name", sort_order="DESC"
+    )
+
+    assert [project.id for project in result] == list(range(7, 0, -1))
+    assert len(server.requested_pages) == len(set(server.requested_pages))
+
+
+@pytest.mark.parametrize(argnames="with_total", argvalues=(True, False))
+def test_iter_all_projects__capped_page_size(with_total: bool) -> None:
+    server = ProjectsServer(projects_count=1000, with_total=with_total, max_per_page=200)
+    workspace = Workspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    result = [
+        project.id for project in workspace.iter_all_projects(workspace_id=123, per_page=500)
+    ]
+
+    assert result == list(range(1, 1001))
+
+
+def test_iter_all_projects__sequential_pages_stop_on_short_page() -> None:
+    server = ProjectsServer(projects_count=6, with_total=False)
+    workspace = Workspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    result = list(workspace.iter_all_projects(workspace_id=123))
+
+    assert len(result) == server.projects_count
+    # The last page is full, so only an empty page shows the end
+    assert server.requested_pages == [1, 2, 3]
+
+
+def test_iter_all_projects__empty_workspace() -> None:
+    server = ProjectsServer(projects_count=0, with_total=True)
+    workspace = Workspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    result = list(workspace.iter_all_projects(workspace_id=123))
+
+    assert result == []
+    assert server.requested_pages == [1]
+
+
+def test_iter_all_projects__page_error() -> None:
+    server = ProjectsServer(projects_count=100, with_total=True, failed_page=2)
+    workspace = Workspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    with pytest.raises(ServerError):
+        _ = list(workspace.iter_all_projects(workspace_id=123, per_page=1, max_workers=2))
+
+    # Only `max_workers` pages after the first one are requested ahead
+    assert len(server.requested_pages) <= 3  # noqa: PLR2004
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(argnames="with_total", argvalues=(True, False))
+async def test_async_iter_all_projects__all_pages(with_total: bool) -> None:
+    server = ProjectsServer(projects_count=8, with_total=with_total)
+    workspace = AsyncWorkspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    result = [
+        project.id
+        async for project in workspace.iter_all_projects(
+            workspace_id=123, per_page=3, max_workers=2
+        )
+    ]
+
+    assert result == list(range(1, 9))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(argnames="with_total", argvalues=(True, False))
+async def test_async_iter_all_projects__capped_page_size(with_total: bool) -> None:
+    server = ProjectsServer(projects_count=25, with_total=with_total, max_per_page=10)
+    workspace = AsyncWorkspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+    projects = workspace.iter_all_projects(workspace_id=123, per_page=20)
+
+    result = [project.id async for project in projects]
+
+    assert result == list(range(1, 26))
+
+
+@pytest.mark.anyio
+async def test_async_iter_all_projects__page_error() -> None:
+    server = ProjectsServer(projects_count=100, with_total=True, failed_page=2)
+    workspace = AsyncWorkspace(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+    projects = workspace.iter_all_projects(workspace_id=123, per_page=1, max_workers=2)
+
+    with pytest.raises(ServerError):
+        _ = [project async for project in projects]
+
+    assert len(server.requested_pages) <= 3  # noqa: PLR2004 - first page and 2 prefetched ones
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import Response
+from toggl_python.queries import MAX_PARAM_AGE
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse
+from toggl_python.schemas.workspace import WorkspaceResponse
+
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE
+from tests.responses.workspace_get import WORKSPACE_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+    from toggl_python.entities.workspace import Workspace
+
+
+def test_prepare_time_entries__executed_many_times(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    since = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    mocked_route = response_mock.get(
+        "/me/time_entries", params={"meta": False, "since": int(since.timestamp())}
+    ).mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = [MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)]
+
+    calls_count = 2
+
+    query = authed_current_user.prepare_time_entries(since=since)
+    with patch("toggl_python.entities.user.MeTimeEntryQueryParams") as mocked_params:
+        results = [query() for _ in range(calls_count)]
+
+    assert results == [expected_result] * calls_count
+    assert mocked_route.call_count == calls_count
+    mocked_params.assert_not_called()
+    assert query.expires_at == pytest.approx((since + MAX_PARAM_AGE).timestamp())
+
+
+@patch("toggl_python.queries.time")
+def test_prepared_query__expired(mocked_time: Mock, authed_current_user: CurrentUser) -> None:
+    start_date = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    query = authed_current_user.prepare_time_entries(
+        start_date=start_date, end_date=start_date + timedelta(days=1)
+    )
+    mocked_time.time.return_value = (start_date + MAX_PARAM_AGE).timestamp() + 1
+
+    with pytest.raises(ValueError, match="Prepared query params must not be older than 3 months"):
+        _ = query()
+
+
+def test_prepare_projects__without_datetime_params(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    _ = response_mock.get("/me/projects", params={"include_archived": True}).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+
+    query = authed_current_user.prepare_projects(include_archived=True, fields=["id"])
+    result = query()
+
+    assert query.expires_at is None
+    assert result[0].id == PROJECT_RESPONSE["id"]
+
+
+def test_workspace_prepare_queries(response_mock: MockRouter, authed_workspace: Workspace) -> None:
+    workspace_id = 123
+    _ = response_mock.get("/workspaces").mock(
+        return_value=Response(status_code=200, json=[WORKSPACE_RESPONSE]),
+    )
+    _ = response_mock.get(f"/workspaces/{workspace_id}/projects", params={"active": True}).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+
+    workspaces = authed_workspace.prepare_list()()
+    projects = authed_workspace.prepare_projects(workspace_id, active=True)()
+
+    assert workspaces == [WorkspaceResponse.model_validate(WORKSPACE_RESPONSE)]
+    assert projects == [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+
+@pytest.mark.anyio
+async def test_async_prepare_time_entries(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    _ = response_mock.get("/me/time_entries", params={"meta": True}).mock(
+        return_value=Response(status_code=200, json=[]),
+    )
+    query = async_authed_current_user.prepare_time_entries(meta=True)
+
+    result = await query()
+
+    assert result == []
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import BasicAuth, TokenAuth
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.rate_limit import RateLimiter, get_rate_limiter
+from toggl_python.session import TogglSession
+
+from tests.responses.me_get import FAKE_TOKEN
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ok_handler(_: Request) -> Response:
+    return Response(status_code=200)
+
+
+def test_rate_limiter__burst_is_not_delayed() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=3, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(3)]
+
+    assert delays == [0, 0, 0]
+
+
+def test_rate_limiter__requests_over_burst_are_spread() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=1, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays == [0, 0.5, 1.0, 1.5]
+
+
+def test_rate_limiter__tokens_are_refilled() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, burst=2, clock=clock)
+    _ = [limiter.reserve() for _ in range(2)]
+
+    clock.now = 10
+
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 1.0]
+
+
+@pytest.mark.parametrize(
+    argnames=("rate", "burst"),
+    argvalues=[(0, 1), (-1, 1), (1, 0)],
+    ids=("zero rate", "negative rate", "zero burst"),
+)
+def test_rate_limiter__invalid_params(rate: float, burst: int) -> None:
+    error_message = "Rate must be positive and burst must be at least 1"
+
+    with pytest.raises(ValueError, match=error_message):
+        _ = RateLimiter(rate=rate, burst=burst)
+
+
+def test_get_rate_limiter__shared_by_same_token() -> None:
+    first_limiter = get_rate_limiter(TokenAuth(token=FAKE_TOKEN))
+    second_limiter = get_rate_limiter(TokenAuth(token=FAKE_TOKEN))
+    other_limiter = get_rate_limiter(BasicAuth(username="username", password="pass"))
+
+    assert first_limiter is second_limiter
+    assert first_limiter is not other_limiter
+
+
+def test_get_rate_limiter__different_rate_is_raised() -> None:
+    auth = TokenAuth(token="different_rate_token_1234567890")
+    _ = get_rate_limiter(auth, rate=2)
+    error_message = "already created with rate=2 and burst=1"
+
+    with pytest.raises(ValueError, match=error_message):
+        _ = get_rate_limiter(auth, rate=100)
+
+    with pytest.raises(ValueError, match=error_message):
+        _ = get_rate_limiter(auth, rate=2, burst=5)
+
+
+def test_get_rate_limiter__credentials_are_not_kept() -> None:
+    token = "hashed_limiter_token_12345678901"  # noqa: S105 - fake token
+
+    with patch.dict("toggl_python.rate_limit._limiters", clear=True) as limiters:
+        _ = get_rate_limiter(TokenAuth(token=token))
+
+        assert len(limiters) == 1
+        assert not [key for key in limiters if token in key or "Basic" in key]
+
+
+@patch("toggl_python.rate_limit.time.sleep")
+def test_api_wrapper__requests_are_rate_limited(mocked_sleep: Mock) -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4, burst=1, clock=clock)
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(ok_handler), rate_limit=limiter
+    )
+
+    results = [user.logged() for _ in range(3)]
+
+    assert results == [True, True, True]
+    sleep_calls: List[float] = [call.args[0] for call in mocked_sleep.call_args_list]
+    assert sleep_calls == [0.25, 0.5]
+
+
+@patch("toggl_python.rate_limit.time.sleep")
+def test_session__entities_share_rate_limiter(mocked_sleep: Mock) -> None:
+    auth = TokenAuth(token="shared_limiter_token_12345678901")
+
+    with TogglSession(auth=auth, transport=MockTransport(ok_handler), rate_limit=1) as session:
+        _ = session.current_user.logged()
+        _ = session.workspace.delete_project(workspace_id=1, project_id=2)
+
+    assert mocked_sleep.call_count == 1
+
+
+@pytest.mark.anyio
+@patch("toggl_python.rate_limit.asyncio.sleep")
+async def test_async_api_wrapper__requests_are_rate_limited(mocked_sleep: Mock) -> None:
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=1, clock=clock)
+    user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(ok_handler), rate_limit=limiter
+    )
+
+    results = [await user.logged() for _ in range(2)]
+
+    assert results == [True, True]
+    mocked_sleep.assert_awaited_once_with(0.5)
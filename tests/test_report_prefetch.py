@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Dict, List, Optional
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.report_time_entry import AsyncReportTimeEntry, ReportTimeEntry
+from toggl_python.exceptions import ServerError
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+class ReportServer:
+    """Serve report of `rows_count` groups, next row number header is shifted by `header_shift`."""
+
+    def __init__(self, rows_count: int, header_shift: int = 0, failed_row: int = 0) -> None:
+        self.rows_count = rows_count
+        self.header_shift = header_shift
+        self.failed_row = failed_row
+        self.requested_rows: List[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        body = json.loads(request.content)
+        first_row_number = body.get("first_row_number", 1)
+        with self._lock:
+            self.requested_rows.append(first_row_number)
+        if first_row_number == self.failed_row:
+            return Response(status_code=500)
+
+        last_row_number = min(first_row_number + body["page_size"], self.rows_count + 1)
+        groups = [
+            {**SEARCH_REPORT_TIME_ENTRY_RESPONSE, "row_number": row_number}
+            for row_number in range(first_row_number, last_row_number)
+        ]
+        headers: Dict[str, str] = {}
+        if last_row_number <= self.rows_count:
+            headers["X-Next-Row-Number"] = str(last_row_number + self.header_shift)
+
+        return Response(status_code=200, json=groups, headers=headers)
+
+
+def make_report(server: ReportServer) -> ReportTimeEntry:
+    return ReportTimeEntry(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+
+def row_numbers(report: ReportTimeEntry, prefetch: int, page_size: Optional[int] = 2) -> List[int]:
+    rows = report.search_iter(
+        workspace_id=123,
+        start_date="2024-07-01",
+        page_size=page_size,
+        output="rows",
+        prefetch=prefetch,
+    )
+
+    return [row.row_number for row in rows]
+
+
+@pytest.mark.parametrize(argnames="prefetch", argvalues=(1, 2, 5))
+def test_search_pages__prefetch(prefetch: int) -> None:
+    server = ReportServer(rows_count=7)
+
+    result = row_numbers(make_report(server), prefetch)
+
+    assert result == list(range(1, 8))
+    assert sorted(set(server.requested_rows))[:4] == [1, 3, 5, 7]
+
+
+def test_search_pages__prefetch_keeps_sequential_order_on_header_mismatch() -> None:
+    server = ReportServer(rows_count=5, header_shift=-1)
+
+    result = row_numbers(make_report(server), prefetch=3)
+
+    # Pages overlap, because API returns next row number before the end of the page
+    assert result == [1, 2, 2, 3, 3, 4, 4, 5]
+
+
+def test_search_pages__prefetch_error() -> None:
+    server = ReportServer(rows_count=10, failed_row=5)
+
+    with pytest.raises(ServerError):
+        _ = row_numbers(make_report(server), prefetch=2)
+
+
+def test_search_pages__prefetch_closed_early() -> None:
+    server = ReportServer(rows_count=100)
+    pages = make_report(server).search_pages(
+        workspace_id=123, start_date="2024-07-01", page_size=2, prefetch=3
+    )
+
+    first_page = next(pages)
+    pages.close()
+
+    assert [group.row_number for group in first_page] == [1, 2]
+    assert len(server.requested_rows) <= 4  # noqa: PLR2004 - first page and 3 prefetched ones
+
+
+def test_search_pages__negative_prefetch() -> None:
+    report = make_report(ReportServer(rows_count=1))
+
+    with pytest.raises(ValueError, match="Prefetch must not be negative"):
+        _ = report.search_pages(workspace_id=123, start_date="2024-07-01", prefetch=-1)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(argnames="header_shift", argvalues=(0, -1))
+async def test_async_search_pages__prefetch(header_shift: int) -> None:
+    server = ReportServer(rows_count=5, header_shift=header_shift)
+    report = AsyncReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+    sequential_result = row_numbers(
+        make_report(ReportServer(rows_count=5, header_shift=header_shift)), prefetch=0
+    )
+
+    rows = report.search_iter(
+        workspace_id=123, start_date="2024-07-01", page_size=2, output="rows", prefetch=3
+    )
+    result = [row.row_number async for row in rows]
+
+    assert result == sequential_result
+
+
+@pytest.mark.anyio
+async def test_async_search_pages__prefetch_error() -> None:
+    server = ReportServer(rows_count=10, failed_row=3)
+    report = AsyncReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+    pages = report.search_pages(workspace_id=123, start_date="2024-07-01", page_size=2, prefetch=3)
+
+    with pytest.raises(ServerError):
+        _ = [page async for page in pages]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Union
 import pytest
 from httpx import Response
 from pydantic import ValidationError
+from toggl_python.reports import ReportColumns, ReportOutput, ReportRow
 from toggl_python.schemas.report_time_entry import SearchReportTimeEntriesResponse
 
 from tests.conftest import fake
@@ -103,3 +104,99 @@ def test_search_report_time_entries__with_all_params(
 
     assert mocked_route.called is True
     assert result == expected_result
+
+
+def test_search_report_time_entries__rows_output(
+    response_report_mock: MockRouter,
+    authed_report_time_entry: ReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    mocked_route = response_report_mock.post(uri).mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+    expected_result = [
+        SearchReportTimeEntriesResponse.model_validate(SEARCH_REPORT_TIME_ENTRY_RESPONSE)
+    ]
+
+    result = authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, start_date="2024-07-30", output="rows"
+    )
+
+    assert mocked_route.called is True
+    assert isinstance(result[0], ReportRow)
+    assert [row.to_model() for row in result] == expected_result
+
+
+def test_search_report_time_entries__columns_output(
+    response_report_mock: MockRouter,
+    authed_report_time_entry: ReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    mocked_route = response_report_mock.post(uri).mock(
+        return_value=Response(status_code=200, json=[SEARCH_REPORT_TIME_ENTRY_RESPONSE]),
+    )
+    expected_ids = [item["id"] for item in SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"]]
+
+    result = authed_report_time_entry.search(
+        workspace_id=fake_workspace_id, start_date="2024-07-30", output=ReportOutput.columns
+    )
+
+    assert mocked_route.called is True
+    assert isinstance(result, ReportColumns)
+    assert result.id.tolist() == expected_ids
+
+
+def test_search_iter__follows_next_row_number(
+    response_report_mock: MockRouter,
+    authed_report_time_entry: ReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    uri = f"/{fake_workspace_id}/search/time_entries"
+    request_body = {"start_date": "2024-07-01", "page_size": 2}
+    groups = [{**SEARCH_REPORT_TIME_ENTRY_RESPONSE, "row_number": number} for number in (1, 2, 3)]
+    first_page_route = response_report_mock.post(uri, json=request_body).mock(
+        return_value=Response(
+            status_code=200, json=groups[:2], headers={"X-Next-Row-Number": "3"}
+        ),
+    )
+    last_page_route = response_report_mock.post(
+        uri, json={**request_body, "first_row_number": 3}
+    ).mock(
+        return_value=Response(status_code=200, json=groups[2:]),
+    )
+
+    result = authed_report_time_entry.search_iter(
+        workspace_id=fake_workspace_id, start_date="2024-07-01", page_size=2, output="rows"
+    )
+
+    assert [row.row_number for row in result] == [1, 2, 3]
+    assert first_page_route.call_count == 1
+    assert last_page_route.call_count == 1
+
+
+def test_search_pages__stops_on_empty_page(
+    response_report_mock: MockRouter,
+    authed_report_time_entry: ReportTimeEntry,
+) -> None:
+    fake_workspace_id = 123
+    _ = response_report_mock.post(f"/{fake_workspace_id}/search/time_entries").mock(
+        return_value=Response(status_code=200, json=[], headers={"X-Next-Row-Number": "1"}),
+    )
+
+    result = list(
+        authed_report_time_entry.search_pages(
+            workspace_id=fake_workspace_id, start_date="2024-07-01", output=ReportOutput.columns
+        )
+    )
+
+    assert len(result) == 1
+    assert len(result[0]) == 0
+
+
+def test_search_iter__columns_output(authed_report_time_entry: ReportTimeEntry) -> None:
+    with pytest.raises(ValueError, match="Columns output is not supported by `search_iter`"):
+        _ = authed_report_time_entry.search_iter(
+            workspace_id=123, start_date="2024-07-01", output=ReportOutput.columns
+        )
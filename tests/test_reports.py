@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from toggl_python.reports import (
+    MISSING,
+    ReportColumns,
+    ReportTimeEntryRow,
+    parse_report_rows,
+    parse_timestamp,
+)
+from toggl_python.schemas.report_time_entry import (
+    ReportTimeEntryItem,
+    SearchReportTimeEntriesResponse,
+)
+
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+def test_parse_timestamp__utc_offset_is_kept() -> None:
+    value = datetime(2024, 7, 30, 11, 13, 46, tzinfo=timezone(timedelta(hours=3)))
+
+    result = parse_timestamp(value.isoformat())
+
+    assert result == (int(value.timestamp()), timedelta(hours=3).total_seconds())
+
+
+def test_parse_timestamp__zulu_suffix() -> None:
+    value = datetime(2024, 7, 30, 8, 14, 38, tzinfo=timezone.utc)
+
+    result = parse_timestamp("2024-07-30T08:14:38Z")
+
+    assert result == (int(value.timestamp()), 0)
+
+
+def test_parse_timestamp__naive_value() -> None:
+    with pytest.raises(ValueError, match="Timezone is missing"):
+        _ = parse_timestamp("2024-07-30T08:14:38")
+
+
+def test_parse_report_rows__round_trip_to_models() -> None:
+    content = json.dumps([SEARCH_REPORT_TIME_ENTRY_RESPONSE]).encode()
+    expected_result = SearchReportTimeEntriesResponse.model_validate(
+        SEARCH_REPORT_TIME_ENTRY_RESPONSE
+    )
+
+    result = parse_report_rows(content)
+
+    assert result[0].tag_ids == tuple(SEARCH_REPORT_TIME_ENTRY_RESPONSE["tag_ids"])
+    assert result[0].to_model() == expected_result
+
+
+def test_report_time_entry_row__to_model_keeps_offsets() -> None:
+    item = SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]
+
+    row = ReportTimeEntryRow.from_json(item)
+    result = row.to_model()
+
+    assert result == ReportTimeEntryItem.model_validate(item)
+    assert result.at_tz.isoformat() == item["at_tz"]
+    assert result.start.isoformat() == item["start"]
+
+
+def test_report_columns__pages_are_flattened() -> None:
+    second_group = {
+        **SEARCH_REPORT_TIME_ENTRY_RESPONSE,
+        "project_id": None,
+        "description": None,
+        "row_number": 2,
+    }
+    item = SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]
+    start, utc_offset = parse_timestamp(item["start"])
+
+    columns = ReportColumns.from_json(json.dumps([SEARCH_REPORT_TIME_ENTRY_RESPONSE]).encode())
+    columns.extend_json(json.dumps([second_group, second_group]).encode())
+
+    assert len(columns) == len([SEARCH_REPORT_TIME_ENTRY_RESPONSE, second_group, second_group])
+    assert columns.row_number.tolist() == [1, 2, 2]
+    assert columns.project_id.tolist() == [
+        SEARCH_REPORT_TIME_ENTRY_RESPONSE["project_id"],
+        *[MISSING] * 2,
+    ]
+    assert columns.start.tolist() == [start] * 3
+    assert columns.utc_offset.tolist() == [utc_offset] * 3
+    assert columns.billable.tolist() == [False] * 3
+    assert columns.usernames.strings == [SEARCH_REPORT_TIME_ENTRY_RESPONSE["username"]]
+    assert columns.username.tolist() == [0] * 3
+    assert [columns.descriptions.get(index) for index in columns.description] == [
+        SEARCH_REPORT_TIME_ENTRY_RESPONSE["description"],
+        None,
+        None,
+    ]
+
+
+def test_report_columns__to_numpy_without_numpy() -> None:
+    columns = ReportColumns()
+
+    with patch.dict(sys.modules, {"numpy": None}), pytest.raises(ImportError, match="NumPy"):
+        _ = columns.to_numpy()
+
+
+def test_report_columns__to_numpy_copies_columns() -> None:
+    fake_numpy = SimpleNamespace(
+        int64=int, array=lambda value, dtype: [dtype(item) for item in value]
+    )
+    content = json.dumps([SEARCH_REPORT_TIME_ENTRY_RESPONSE]).encode()
+    columns = ReportColumns.from_json(content)
+
+    with patch.dict(sys.modules, {"numpy": fake_numpy}):
+        result = columns.to_numpy()
+
+    # Columns do not export their buffers, so they can be extended
+    columns.extend_json(content)
+
+    assert set(result) == {*ReportColumns.INT_COLUMNS, "billable"}
+    assert result["id"] == columns.id.tolist()[:1]
+    assert result["billable"] == [False]
+    assert len(columns) == 2  # noqa: PLR2004 - two pages
+
+
+def test_report_columns__to_numpy() -> None:
+    np = pytest.importorskip("numpy")
+    content = json.dumps([SEARCH_REPORT_TIME_ENTRY_RESPONSE]).encode()
+    columns = ReportColumns.from_json(content)
+
+    result = columns.to_numpy()
+    columns.extend_json(content)
+
+    assert result["seconds"].dtype == np.int64
+    assert (
+        result["seconds"].sum() == SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]["seconds"]
+    )
+    assert result["billable"].tolist() == [False]
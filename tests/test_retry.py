@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http import HTTPStatus
+from typing import Callable, List, Type, Union
+from unittest.mock import Mock, patch
+
+import pytest
+from httpx import ConnectError, MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.report_time_entry import ReportTimeEntry
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.entities.workspace import Workspace
+from toggl_python.exceptions import BadRequest, ClientError, ServerError, TooManyRequests
+from toggl_python.retry import RetryPolicy, parse_retry_after
+
+from tests.responses.me_get import FAKE_TOKEN
+
+
+ResponseFactory = Union[Response, Exception]
+
+
+def sequence_transport(responses: List[ResponseFactory], requests: List[Request]) -> MockTransport:
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    return MockTransport(handler)
+
+
+def no_jitter() -> float:
+    return 1.0
+
+
+def build_policy(**kwargs: Union[int, bool, Callable[[], float]]) -> RetryPolicy:
+    return RetryPolicy(jitter=no_jitter, **kwargs)
+
+
+def test_retry_policy__exponential_backoff_is_capped() -> None:
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=no_jitter)
+
+    delays = [policy.get_delay(attempt) for attempt in range(5)]
+
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_retry_policy__jitter_is_applied() -> None:
+    policy = RetryPolicy(backoff_factor=1, jitter=lambda: 0.25)
+
+    assert policy.get_delay(attempt=2) == 1
+
+
+@pytest.mark.parametrize(
+    argnames=("header_value", "expected_result"),
+    argvalues=[
+        ("3", 3.0),
+        ("-3", 0.0),
+        ("invalid", None),
+        (format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True), 0.0),
+    ],
+    ids=("seconds", "negative seconds", "invalid", "date in the past"),
+)
+def test_parse_retry_after(header_value: str, expected_result: float) -> None:
+    response = Response(status_code=429, headers={"Retry-After": header_value})
+
+    assert parse_retry_after(response) == expected_result
+
+
+def test_parse_retry_after__future_date() -> None:
+    retry_at = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+    response = Response(status_code=503, headers={"Retry-After": format_datetime(retry_at)})
+
+    result = parse_retry_after(response)
+
+    assert result is not None
+    assert 0 < result <= timedelta(seconds=30).total_seconds()
+
+
+def test_parse_retry_after__without_header() -> None:
+    assert parse_retry_after(Response(status_code=429)) is None
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__get_is_retried_until_success(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [Response(status_code=502), Response(status_code=503), Response(status_code=200)],
+        requests,
+    )
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy())
+
+    result = user.logged()
+
+    assert result is True
+    assert [request.url.path for request in requests] == ["/api/v9/me/logged"] * 3
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == [0.5, 1.0]
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__retry_after_is_honored(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [Response(status_code=429, headers={"Retry-After": "7"}), Response(status_code=200)],
+        requests,
+    )
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy())
+
+    result = user.logged()
+
+    assert result is True
+    mocked_sleep.assert_called_once_with(7.0)
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__long_retry_after_is_raised(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [Response(status_code=429, headers={"Retry-After": "3600"}), Response(status_code=200)],
+        requests,
+    )
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=transport,
+        retry=build_policy(max_retry_after=60),
+    )
+
+    with pytest.raises(TooManyRequests) as exception_info:
+        _ = user.logged()
+
+    assert exception_info.value.retry_after == timedelta(hours=1).total_seconds()
+    assert len(requests) == 1
+    mocked_sleep.assert_not_called()
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__connection_errors_are_retried(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [ConnectError("Connection refused"), Response(status_code=200)], requests
+    )
+    workspace = Workspace(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy()
+    )
+
+    result = workspace.delete_project(workspace_id=1, project_id=2)
+
+    assert result is True
+    assert [request.method for request in requests] == ["DELETE", "DELETE"]
+    mocked_sleep.assert_called_once_with(0.5)
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__connection_error_is_raised_when_retries_are_exhausted(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport([ConnectError("Connection refused")] * 2, requests)
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy(max_retries=1)
+    )
+
+    with pytest.raises(ConnectError):
+        _ = user.logged()
+
+    assert [request.method for request in requests] == ["GET", "GET"]
+    mocked_sleep.assert_called_once_with(0.5)
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__server_error_is_raised_when_retries_are_exhausted(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    error_message = "Service is unavailable"
+    transport = sequence_transport([Response(status_code=503, text=error_message)] * 3, requests)
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy(max_retries=2)
+    )
+
+    with pytest.raises(ServerError, match=error_message) as exception_info:
+        _ = user.logged()
+
+    assert exception_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert [request.method for request in requests] == ["GET"] * 3
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == [0.5, 1.0]
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__post_is_not_retried_by_default(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport([Response(status_code=502)], requests)
+    report_time_entry = ReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy()
+    )
+
+    with pytest.raises(ServerError):
+        _ = report_time_entry.search(workspace_id=1, project_ids=[1])
+
+    assert len(requests) == 1
+    mocked_sleep.assert_not_called()
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__post_is_retried_if_enabled(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [Response(status_code=502), Response(status_code=200, json=[])], requests
+    )
+    report_time_entry = ReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=transport,
+        retry=build_policy(retry_post=True),
+    )
+
+    result = report_time_entry.search(workspace_id=1, project_ids=[1])
+
+    assert result == []
+    assert requests[0].content == requests[1].content
+    mocked_sleep.assert_called_once_with(0.5)
+
+
+@patch("toggl_python.retry.time.sleep")
+def test_retry__client_errors_are_not_retried(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport([Response(status_code=404)], requests)
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy())
+
+    with pytest.raises(ClientError):
+        _ = user.logged()
+
+    assert len(requests) == 1
+    mocked_sleep.assert_not_called()
+
+
+@pytest.mark.anyio
+@patch("toggl_python.retry.asyncio.sleep")
+async def test_async_retry__get_is_retried_until_success(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport(
+        [ConnectError("Connection refused"), Response(status_code=500), Response(status_code=200)],
+        requests,
+    )
+    user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy()
+    )
+
+    result = await user.logged()
+
+    assert result is True
+    assert [call.args[0] for call in mocked_sleep.await_args_list] == [0.5, 1.0]
+
+
+@pytest.mark.anyio
+@patch("toggl_python.retry.asyncio.sleep")
+async def test_async_retry__connection_error_is_raised(mocked_sleep: Mock) -> None:
+    requests: List[Request] = []
+    transport = sequence_transport([ConnectError("Connection refused")], requests)
+    user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=transport, retry=build_policy(max_retries=0)
+    )
+
+    with pytest.raises(ConnectError):
+        _ = await user.logged()
+
+    mocked_sleep.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    argnames=("status_code", "exception_class"),
+    argvalues=[
+        (302, BadRequest),
+        (400, ClientError),
+        (429, TooManyRequests),
+        (500, ServerError),
+    ],
+)
+def test_raise_for_status__typed_exceptions(
+    status_code: int, exception_class: Type[BadRequest]
+) -> None:
+    transport = MockTransport(lambda _: Response(status_code=status_code, text="Error"))
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=transport)
+
+    with pytest.raises(exception_class) as exception_info:
+        _ = user.logged()
+
+    assert type(exception_info.value) is exception_class
+    assert exception_info.value.status_code == status_code
+
+
+def test_raise_for_status__too_many_requests_contains_retry_after() -> None:
+    transport = MockTransport(
+        lambda _: Response(status_code=429, headers={"Retry-After": "12"}, text="Slow down")
+    )
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=transport)
+
+    with pytest.raises(TooManyRequests, match="Slow down") as exception_info:
+        _ = user.logged()
+
+    assert exception_info.value.retry_after == timedelta(seconds=12).total_seconds()
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING, List
+from unittest.mock import patch
+
+import pytest
+from httpx import (
+    AsyncHTTPTransport,
+    HTTPTransport,
+    Limits,
+    MockTransport,
+    Request,
+    Response,
+    Timeout,
+)
+from toggl_python.api import DEFAULT_LIMITS, DEFAULT_TIMEOUT, ROOT_URL
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.report_time_entry import AsyncReportTimeEntry, ReportTimeEntry
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.entities.workspace import AsyncWorkspace, Workspace
+from toggl_python.exceptions import ClientError
+from toggl_python.schemas.workspace import WorkspaceResponse
+from toggl_python.session import AsyncTogglSession, TogglSession
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.workspace_get import WORKSPACE_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+
+
+PROXY_URL = "http://proxy.local:3128"
+PROXY_ENV_VARIABLES = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+@pytest.fixture(autouse=True)
+def clear_proxy_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in PROXY_ENV_VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+class RecordingTransport(MockTransport):
+    def __init__(self) -> None:
+        super().__init__(self.record)
+        self.requested_urls: List[str] = []
+        self.is_closed = False
+
+    def record(self, request: Request) -> Response:
+        self.requested_urls.append(str(request.url))
+
+        return Response(status_code=200)
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+def test_session__entities_share_transport() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = RecordingTransport()
+
+    with TogglSession(auth=auth, transport=transport) as session:
+        entities = (session.current_user, session.workspace, session.report_time_entry)
+        _ = session.current_user.logged()
+        _ = session.workspace.delete_project(workspace_id=1, project_id=2)
+
+        assert isinstance(entities[0], CurrentUser)
+        assert isinstance(entities[1], Workspace)
+        assert isinstance(entities[2], ReportTimeEntry)
+        assert session.workspace is entities[1]
+
+    assert transport.requested_urls == [
+        f"{ROOT_URL}/me/logged",
+        f"{ROOT_URL}/workspaces/1/projects/2",
+    ]
+    assert transport.is_closed is True
+
+
+def test_session__default_transport() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with TogglSession(auth=auth) as session:
+        assert isinstance(session.transport, HTTPTransport)
+
+
+def test_session__request_through_shared_pool(response_mock: MockRouter) -> None:
+    workspace_id = 123
+    mocked_route = response_mock.get(f"/workspaces/{workspace_id}").mock(
+        return_value=Response(status_code=200, json=WORKSPACE_RESPONSE),
+    )
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with TogglSession(auth=auth) as session:
+        result = session.workspace.get(workspace_id)
+
+    assert mocked_route.called is True
+    assert result == WorkspaceResponse.model_validate(WORKSPACE_RESPONSE)
+
+
+@pytest.mark.anyio
+async def test_async_session__entities_share_transport() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    async with AsyncTogglSession(auth=auth) as session:
+        entities = (session.current_user, session.workspace, session.report_time_entry)
+
+        assert isinstance(session.transport, AsyncHTTPTransport)
+        assert isinstance(entities[0], AsyncCurrentUser)
+        assert isinstance(entities[1], AsyncWorkspace)
+        assert isinstance(entities[2], AsyncReportTimeEntry)
+        assert session.current_user is entities[0]
+
+
+def test_api_wrapper__context_manager_closes_client() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with Workspace(auth=auth) as workspace:
+        assert workspace.client.is_closed is False
+
+    assert workspace.client.is_closed is True
+
+
+@pytest.mark.anyio
+async def test_async_api_wrapper__context_manager_closes_client() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    async with AsyncWorkspace(auth=auth) as workspace:
+        assert workspace.client.is_closed is False
+
+    assert workspace.client.is_closed is True
+
+
+def test_session__closing_entity_keeps_shared_transport_open() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = RecordingTransport()
+
+    with TogglSession(auth=auth, transport=transport) as session:
+        with session.workspace as workspace:
+            _ = workspace.delete_project(workspace_id=1, project_id=2)
+
+        assert transport.is_closed is False
+        _ = session.current_user.logged()
+
+    assert transport.is_closed is True
+
+
+def test_api_wrapper__injected_transport_is_not_closed() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = RecordingTransport()
+
+    with Workspace(auth=auth, transport=transport) as workspace:
+        _ = workspace.delete_project(workspace_id=1, project_id=2)
+
+    assert transport.is_closed is False
+    assert workspace.client.is_closed is False
+
+
+@pytest.mark.anyio
+async def test_async_session__closing_entity_keeps_shared_transport_open() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    async with AsyncTogglSession(auth=auth) as session:
+        async with session.workspace:
+            pass
+
+        assert session.current_user.client.is_closed is False
+        assert session.workspace.client.is_closed is False
+
+
+def test_api_wrapper__environment_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", PROXY_URL)
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with patch("toggl_python.api.HTTPTransport", wraps=HTTPTransport) as transport_mock:
+        _ = CurrentUser(auth=auth)
+
+    transport_mock.assert_called_once_with(http2=True, limits=DEFAULT_LIMITS, proxy=PROXY_URL)
+
+
+def test_api_wrapper__environment_proxy__no_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", PROXY_URL)
+    monkeypatch.setenv("NO_PROXY", "api.track.toggl.com")
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with patch("toggl_python.api.AsyncHTTPTransport", wraps=AsyncHTTPTransport) as transport_mock:
+        _ = AsyncReportTimeEntry(auth=auth)
+
+    transport_mock.assert_called_once_with(http2=True, limits=DEFAULT_LIMITS, proxy=None)
+
+
+def test_session__environment_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HTTPS_PROXY", PROXY_URL)
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with patch("toggl_python.session.HTTPTransport", wraps=HTTPTransport) as transport_mock:
+        session = TogglSession(auth=auth)
+
+    with session:
+        transport_mock.assert_called_once_with(http2=True, limits=DEFAULT_LIMITS, proxy=PROXY_URL)
+
+
+def test_api_wrapper__default_limits_and_timeout() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+
+    with patch("toggl_python.api.HTTPTransport", wraps=HTTPTransport) as transport_mock:
+        workspace = Workspace(auth=auth)
+
+    transport_mock.assert_called_once_with(http2=True, limits=DEFAULT_LIMITS, proxy=None)
+    assert workspace.client.timeout == DEFAULT_TIMEOUT
+
+
+def test_api_wrapper__custom_limits_and_timeout() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    limits = Limits(max_connections=50, max_keepalive_connections=50, keepalive_expiry=30)
+    timeout = Timeout(10, connect=2)
+
+    with patch("toggl_python.api.HTTPTransport", wraps=HTTPTransport) as transport_mock:
+        workspace = Workspace(auth=auth, limits=limits, timeout=timeout)
+
+    transport_mock.assert_called_once_with(http2=True, limits=limits, proxy=None)
+    assert workspace.client.timeout == timeout
+
+
+def test_api_wrapper__timeout_in_seconds() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    seconds = 30
+
+    workspace = Workspace(auth=auth, timeout=seconds)
+
+    assert workspace.client.timeout == Timeout(seconds)
+
+
+def test_session__limits_and_timeout() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    limits = Limits(max_connections=50, max_keepalive_connections=50)
+    timeout = Timeout(10, read=60)
+
+    with patch("toggl_python.session.HTTPTransport", wraps=HTTPTransport) as transport_mock:
+        session = TogglSession(auth=auth, limits=limits, timeout=timeout)
+
+    with session:
+        assert session.report_time_entry.client.timeout == timeout
+
+    transport_mock.assert_called_once_with(http2=True, limits=limits, proxy=None)
+
+
+@pytest.mark.anyio
+async def test_async_session__limits_and_timeout() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    limits = Limits(max_connections=50, max_keepalive_connections=50)
+    seconds = 15
+
+    with patch(
+        "toggl_python.session.AsyncHTTPTransport", wraps=AsyncHTTPTransport
+    ) as transport_mock:
+        session = AsyncTogglSession(auth=auth, limits=limits, timeout=seconds)
+
+    async with session:
+        assert session.workspace.client.timeout == Timeout(seconds)
+
+    transport_mock.assert_called_once_with(http2=True, limits=limits, proxy=None)
+
+
+def test_session__warmup__connects_once_per_origin() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = RecordingTransport()
+
+    with TogglSession(auth=auth, transport=transport) as session:
+        session.warmup()
+
+    assert transport.requested_urls == [f"{ROOT_URL}/"]
+
+
+def test_session__warmup__validate_auth() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = RecordingTransport()
+
+    with TogglSession(auth=auth, transport=transport) as session:
+        session.warmup(validate_auth=True)
+
+    assert transport.requested_urls == [f"{ROOT_URL}/me/logged"]
+
+
+def test_session__warmup__invalid_auth_is_raised() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = MockTransport(lambda _: Response(status_code=HTTPStatus.FORBIDDEN))
+
+    with TogglSession(auth=auth, transport=transport) as session, pytest.raises(ClientError):
+        session.warmup(validate_auth=True)
+
+
+def test_api_wrapper__warmup__response_status_is_ignored() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    transport = MockTransport(lambda _: Response(status_code=HTTPStatus.NOT_FOUND))
+
+    with ReportTimeEntry(auth=auth, transport=transport) as report_time_entry:
+        report_time_entry.warmup()
+
+
+@pytest.mark.anyio
+async def test_async_session__warmup() -> None:
+    auth = TokenAuth(token=FAKE_TOKEN)
+    requests: List[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+
+        return Response(status_code=HTTPStatus.OK)
+
+    async with AsyncTogglSession(auth=auth, transport=MockTransport(handler)) as session:
+        await session.warmup()
+        await session.warmup(validate_auth=True)
+
+    assert [request.method for request in requests] == ["HEAD", "GET"]
+    assert str(requests[1].url) == f"{ROOT_URL}/me/logged"
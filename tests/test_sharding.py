@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import date, timedelta
+from typing import Any, Dict, List, Union
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.report_time_entry import AsyncReportTimeEntry, ReportTimeEntry
+from toggl_python.exceptions import ServerError
+from toggl_python.reports import ReportOutput, ReportRow
+from toggl_python.schemas.report_time_entry import SearchReportTimeEntriesResponse
+from toggl_python.sharding import ShardSize, bisect_date_range, merge_shards, split_date_range
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+FIRST_DAY = date(2024, 1, 1)
+LAST_DAY = date(2024, 3, 10)
+USER_IDS = (1, 2)
+
+
+def make_time_entry(day: date) -> Dict[str, Any]:
+    item = SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"][0]
+    start = f"{day.isoformat()}T10:00:00+00:00"
+
+    return {**item, "id": day.toordinal(), "start": start, "stop": start, "at": start}
+
+
+def make_group(user_id: int, time_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        **SEARCH_REPORT_TIME_ENTRY_RESPONSE,
+        "user_id": user_id,
+        "billable_amount_in_cents": len(time_entries),
+        "time_entries": time_entries,
+    }
+
+
+class ShardedReportServer:
+    """Serve one row with one time entry per day, days alternate between users."""
+
+    def __init__(self, failed_date: Union[date, None] = None) -> None:
+        self.failed_date = failed_date
+        self.requests_count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: Request) -> Response:
+        body = json.loads(request.content)
+        start, end = date.fromisoformat(body["start_date"]), date.fromisoformat(body["end_date"])
+        with self._lock:
+            self.requests_count += 1
+        if self.failed_date and start <= self.failed_date <= end:
+            return Response(status_code=500)
+
+        groups = get_expected_groups(start, end)
+        first_row_number = body.get("first_row_number", 1)
+        page_size = body.get("page_size", 50)
+        page = groups[first_row_number - 1 : first_row_number - 1 + page_size]
+        headers = {}
+        if first_row_number - 1 + page_size < len(groups):
+            headers["X-Next-Row-Number"] = str(first_row_number + page_size)
+
+        return Response(status_code=200, json=page, headers=headers)
+
+
+def get_expected_groups(start: date, end: date) -> List[Dict[str, Any]]:
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    groups = [
+        {
+            **make_group(USER_IDS[day.toordinal() % 2], [make_time_entry(day)]),
+            "description": day.isoformat(),
+        }
+        for day in days
+    ]
+
+    return [{**group, "row_number": row_number} for row_number, group in enumerate(groups, 1)]
+
+
+@pytest.mark.parametrize(
+    argnames=("shard_size", "expected_result"),
+    argvalues=(
+        (ShardSize.day, [(date(2024, 1, 30), date(2024, 1, 30)), (date(2024, 1, 31),) * 2]),
+        (
+            ShardSize.week,
+            [(date(2024, 1, 30), date(2024, 2, 4)), (date(2024, 2, 5), date(2024, 2, 5))],
+        ),
+        (
+            ShardSize.month,
+            [(date(2024, 1, 30), date(2024, 1, 31)), (date(2024, 2, 1), date(2024, 2, 5))],
+        ),
+    ),
+)
+def test_split_date_range(shard_size: ShardSize, expected_result: List[Any]) -> None:
+    end_date = date(2024, 1, 31) if shard_size == ShardSize.day else date(2024, 2, 5)
+
+    result = split_date_range("2024-01-30", end_date, shard_size)
+
+    assert result == expected_result
+
+
+def test_split_date_range__invalid_range() -> None:
+    with pytest.raises(ValueError, match="Start date must not be later than end date"):
+        _ = split_date_range("2024-02-01", "2024-01-01", ShardSize.day)
+
+
+def test_bisect_date_range() -> None:
+    result = bisect_date_range((date(2024, 1, 1), date(2024, 1, 4)))
+
+    assert result == [(date(2024, 1, 1), date(2024, 1, 2)), (date(2024, 1, 3), date(2024, 1, 4))]
+
+
+def test_merge_shards__rows() -> None:
+    first_time_entry = make_time_entry(FIRST_DAY)
+    second_time_entry = make_time_entry(FIRST_DAY + timedelta(days=1))
+    first_group = ReportRow.from_json(make_group(1, [first_time_entry]))
+    same_group = ReportRow.from_json({**make_group(1, [second_time_entry]), "row_number": 2})
+    other_group = ReportRow.from_json({**make_group(2, []), "billable_amount_in_cents": None})
+    duplicated_group = ReportRow.from_json(
+        {**make_group(1, [first_time_entry, second_time_entry]), "billable_amount_in_cents": 10}
+    )
+
+    result = merge_shards(
+        [[first_group, same_group, other_group], [first_group, duplicated_group]]
+    )
+
+    # Rows with equal attributes are not merged, empty rows and duplicates are dropped
+    assert result == [first_group, same_group]
+
+
+def test_merge_shards__partly_duplicated_models() -> None:
+    first_time_entry = make_time_entry(FIRST_DAY)
+    second_time_entry = {**make_time_entry(FIRST_DAY + timedelta(days=1)), "seconds": 3}
+    first_group = SearchReportTimeEntriesResponse.model_validate(
+        {**make_group(1, [{**first_time_entry, "seconds": 1}]), "billable_amount_in_cents": 100}
+    )
+    second_group = SearchReportTimeEntriesResponse.model_validate(
+        {
+            **make_group(1, [{**first_time_entry, "seconds": 1}, second_time_entry]),
+            "billable_amount_in_cents": 400,
+            "row_number": 7,
+        }
+    )
+
+    result = merge_shards([[first_group], [second_group]])
+
+    assert [group.row_number for group in result] == [1, 2]
+    assert result[0] == first_group
+    assert [time_entry.id for time_entry in result[1].time_entries] == [second_time_entry["id"]]
+    assert result[1].billable_amount_in_cents == 300  # noqa: PLR2004 - 3 of 4 seconds are kept
+
+
+def test_merge_shards__same_shard_twice() -> None:
+    group = ReportRow.from_json(
+        {**make_group(1, [make_time_entry(FIRST_DAY)]), "billable_amount_in_cents": 100}
+    )
+
+    result = merge_shards([[group], [group]])
+
+    assert result == [group]
+
+
+@pytest.mark.parametrize(
+    argnames=("shard_size", "page_size"),
+    argvalues=(
+        (ShardSize.day, None),
+        (ShardSize.week, 1),
+        (ShardSize.month, None),
+        (ShardSize.auto, 1),
+    ),
+)
+def test_search_sharded(shard_size: ShardSize, page_size: Union[int, None]) -> None:
+    server = ShardedReportServer()
+    report = ReportTimeEntry(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+    expected_result = [
+        SearchReportTimeEntriesResponse.model_validate(group)
+        for group in get_expected_groups(FIRST_DAY, LAST_DAY)
+    ]
+
+    result = report.search_sharded(
+        workspace_id=123,
+        start_date=FIRST_DAY,
+        end_date=LAST_DAY,
+        shard_size=shard_size,
+        page_size=page_size,
+    )
+
+    assert result == expected_result
+
+
+def test_search_sharded__error() -> None:
+    server = ShardedReportServer(failed_date=date(2024, 2, 10))
+    report = ReportTimeEntry(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server))
+
+    with pytest.raises(ServerError):
+        _ = report.search_sharded(
+            workspace_id=123, start_date=FIRST_DAY, end_date=LAST_DAY, max_workers=1
+        )
+
+
+def test_search_sharded__columns_output() -> None:
+    report = ReportTimeEntry(auth=TokenAuth(token=FAKE_TOKEN))
+
+    with pytest.raises(ValueError, match="Columns output is not supported by `search_sharded`"):
+        _ = report.search_sharded(
+            workspace_id=123, start_date=FIRST_DAY, end_date=LAST_DAY, output="columns"
+        )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(argnames="shard_size", argvalues=(ShardSize.week, ShardSize.auto))
+async def test_async_search_sharded(shard_size: ShardSize) -> None:
+    server = ShardedReportServer()
+    report = AsyncReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+    expected_result = [
+        ReportRow.from_json(group) for group in get_expected_groups(FIRST_DAY, LAST_DAY)
+    ]
+
+    result = await report.search_sharded(
+        workspace_id=123,
+        start_date=FIRST_DAY,
+        end_date=LAST_DAY,
+        shard_size=shard_size,
+        page_size=1,
+        max_workers=2,
+        output=ReportOutput.rows,
+    )
+
+    assert result == expected_result
+
+
+@pytest.mark.anyio
+async def test_async_search_sharded__error() -> None:
+    server = ShardedReportServer(failed_date=date(2024, 1, 10))
+    report = AsyncReportTimeEntry(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(server)
+    )
+
+    with pytest.raises(ServerError):
+        _ = await report.search_sharded(
+            workspace_id=123, start_date=FIRST_DAY, end_date=LAST_DAY, shard_size="day"
+        )
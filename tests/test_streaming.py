@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Iterator, List
+
+import pytest
+from httpx import MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.user import CurrentUser
+from toggl_python.exceptions import ClientError, ServerError
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse, MeTimeEntryWithMetaResponse
+from toggl_python.streaming import JsonArraySplitter
+
+from tests.responses.me_get import FAKE_TOKEN
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE, ME_TIME_ENTRY_WITH_META_RESPONSE
+
+
+if TYPE_CHECKING:
+    from respx import MockRouter
+    from toggl_python.entities.user import AsyncCurrentUser
+    from toggl_python.entities.workspace import AsyncWorkspace, Workspace
+
+
+def split_all(content: bytes) -> List[bytes]:
+    splitter = JsonArraySplitter()
+    elements = splitter.feed(content)
+    splitter.close()
+
+    return elements
+
+
+def split_chunks(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start : start + chunk_size]
+
+
+@pytest.mark.parametrize(argnames="chunk_size", argvalues=(1, 3, 64, 4096))
+def test_json_array_splitter__elements_split_between_chunks(chunk_size: int) -> None:
+    elements = [
+        {"description": 'quoted \\" [brackets], {braces}', "tags": ["a", "b"]},
+        {"nested": [[1, 2], {"key": None}]},
+        "plain string",
+        -1.5,
+        True,
+        None,
+        [],
+    ]
+    content = f" \n{json.dumps(elements, indent=2)}\n".encode()
+    splitter = JsonArraySplitter()
+
+    result = [
+        element for chunk in split_chunks(content, chunk_size) for element in splitter.feed(chunk)
+    ]
+    splitter.close()
+
+    assert [json.loads(element) for element in result] == elements
+
+
+def test_json_array_splitter__empty_array() -> None:
+    result = split_all(b"[ ]")
+
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    argnames=("content", "error_message"),
+    argvalues=(
+        (b'{"id": 1}', "Response body is not a JSON array"),
+        (b"[1, 2", "Response body is not a complete JSON array"),
+        (b"", "Response body is not a complete JSON array"),
+        (b"[1] [2]", "Unexpected data after JSON array"),
+    ),
+)
+def test_json_array_splitter__invalid_body(content: bytes, error_message: str) -> None:
+    with pytest.raises(ValueError, match=error_message):
+        _ = split_all(content)
+
+
+def test_json_array_splitter__data_after_finished_array() -> None:
+    splitter = JsonArraySplitter()
+    _ = splitter.feed(b"[1]")
+
+    with pytest.raises(ValueError, match="Unexpected data after JSON array"):
+        _ = splitter.feed(b", 2")
+
+
+def test_iter_list__body_is_streamed_by_chunks() -> None:
+    content = json.dumps([PROJECT_RESPONSE] * 3).encode()
+    requests: List[Request] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+
+        return Response(status_code=200, content=split_chunks(content, 10))
+
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN), transport=MockTransport(handler))
+
+    result = list(user.iter_projects(include_archived=True))
+
+    assert result == [ProjectResponse.model_validate(PROJECT_RESPONSE)] * 3
+    assert requests[0].url.params["include_archived"] == "true"
+
+
+def test_iter_list__error_response(response_mock: MockRouter) -> None:
+    _ = response_mock.get("/me/projects").mock(
+        return_value=Response(status_code=403, text="Forbidden")
+    )
+    user = CurrentUser(auth=TokenAuth(token=FAKE_TOKEN))
+
+    with pytest.raises(ClientError, match="Forbidden"):
+        _ = list(user.iter_projects())
+
+
+def test_iter_time_entries__with_meta(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/time_entries", params={"meta": True}).mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_WITH_META_RESPONSE]),
+    )
+
+    result = list(authed_current_user.iter_time_entries(meta=True))
+
+    assert mocked_route.called is True
+    assert result == [MeTimeEntryWithMetaResponse.model_validate(ME_TIME_ENTRY_WITH_META_RESPONSE)]
+
+
+def test_workspace_iter_projects(response_mock: MockRouter, authed_workspace: Workspace) -> None:
+    workspace_id = 123
+    mocked_route = response_mock.get(
+        f"/workspaces/{workspace_id}/projects", params={"active": False}
+    ).mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+
+    result = list(authed_workspace.iter_projects(workspace_id, active=False))
+
+    assert mocked_route.called is True
+    assert result == [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+
+@pytest.mark.anyio
+async def test_async_iter_time_entries(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    _ = response_mock.get("/me/time_entries").mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_RESPONSE] * 2),
+    )
+
+    result = [time_entry async for time_entry in async_authed_current_user.iter_time_entries()]
+
+    assert result == [MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)] * 2
+
+
+@pytest.mark.anyio
+async def test_async_iter_projects(
+    response_mock: MockRouter,
+    async_authed_current_user: AsyncCurrentUser,
+    async_authed_workspace: AsyncWorkspace,
+) -> None:
+    workspace_id = 123
+    _ = response_mock.get("/me/projects").mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    _ = response_mock.get(f"/workspaces/{workspace_id}/projects").mock(
+        return_value=Response(status_code=200, json=[PROJECT_RESPONSE]),
+    )
+    expected_result = [ProjectResponse.model_validate(PROJECT_RESPONSE)]
+
+    user_result = [project async for project in async_authed_current_user.iter_projects()]
+    workspace_result = [
+        project async for project in async_authed_workspace.iter_projects(workspace_id)
+    ]
+
+    assert user_result == expected_result
+    assert workspace_result == expected_result
+
+
+@pytest.mark.anyio
+async def test_async_iter_list__error_response(
+    response_mock: MockRouter, async_authed_current_user: AsyncCurrentUser
+) -> None:
+    _ = response_mock.get("/me/projects").mock(return_value=Response(status_code=500))
+
+    with pytest.raises(ServerError):
+        _ = [project async for project in async_authed_current_user.iter_projects()]
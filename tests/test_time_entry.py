@@ -174,6 +174,19 @@ def test_get_current_time_entry__no_current_entry(
     assert result is None
 
 
+def test_get_current_time_entry__null_response(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    _ = response_mock.get("/me/time_entries/current").mock(
+        return_value=Response(status_code=200, content=b"null"),
+    )
+
+    result = authed_current_user.get_current_time_entry()
+
+    assert result is None
+    assert authed_current_user.last_transfer is not None
+
+
 def test_get_time_entries__without_query_params(
     response_mock: MockRouter, authed_current_user: CurrentUser
 ) -> None:
@@ -189,6 +202,21 @@ def test_get_time_entries__without_query_params(
     assert result == expected_result
 
 
+def test_get_time_entries__with_fields(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    mocked_route = response_mock.get("/me/time_entries").mock(
+        return_value=Response(status_code=200, json=[ME_TIME_ENTRY_RESPONSE]),
+    )
+    fields = ["id", "project_id", "start", "duration"]
+
+    result = authed_current_user.get_time_entries(fields=fields)
+
+    assert mocked_route.called is True
+    assert set(type(result[0]).model_fields) == set(fields)
+    assert result[0].duration == ME_TIME_ENTRY_RESPONSE["duration"]
+
+
 def test_get_time_entries__with_meta_query_param(
     response_mock: MockRouter, authed_current_user: CurrentUser
 ) -> None:
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from toggl_python.reports import ReportColumns
+from toggl_python.schemas.current_user import UpdateMeRequest
+from toggl_python.timezones import (
+    bucket_by_day,
+    get_available_timezones,
+    get_zone,
+    to_local_dates,
+    to_local_datetimes,
+)
+
+from tests.responses.report_time_entry_post import SEARCH_REPORT_TIME_ENTRY_RESPONSE
+
+
+# 2024-03-31 00:30 UTC, Berlin switches to summer time at 01:00 UTC on that day
+SPRING_FORWARD_EPOCH = 1711845000
+
+
+def test_get_available_timezones__loaded_once() -> None:
+    get_available_timezones.cache_clear()
+
+    with patch(
+        "toggl_python.timezones.zoneinfo.available_timezones", return_value={"Europe/Berlin"}
+    ) as available_timezones:
+        _ = UpdateMeRequest(timezone="Europe/Berlin")
+        _ = UpdateMeRequest(timezone="Europe/Berlin")
+
+    get_available_timezones.cache_clear()
+    available_timezones.assert_called_once_with()
+
+
+def test_get_zone__invalid_name() -> None:
+    with pytest.raises(ValueError, match="Specified timezone Mars/Olympus is invalid"):
+        _ = get_zone("Mars/Olympus")
+
+
+def test_to_local_datetimes() -> None:
+    aware_value = datetime(2024, 3, 31, 0, 30, tzinfo=timezone.utc)
+
+    result = to_local_datetimes([SPRING_FORWARD_EPOCH, aware_value], "Europe/Berlin")
+
+    assert result[0] == result[1] == aware_value
+    assert result[0].isoformat() == "2024-03-31T01:30:00+01:00"
+    assert result[0].tzinfo is get_zone("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    argnames=("epoch", "timezone_name", "expected_result"),
+    argvalues=(
+        (SPRING_FORWARD_EPOCH, "UTC", date(2024, 3, 31)),
+        # 2024-03-30 23:30 UTC is already the next day in Berlin
+        (SPRING_FORWARD_EPOCH - 3600, "Europe/Berlin", date(2024, 3, 31)),
+        (SPRING_FORWARD_EPOCH - 3600, "UTC", date(2024, 3, 30)),
+        # Day starts at 18:15 UTC in Kathmandu with +05:45 offset
+        (SPRING_FORWARD_EPOCH + 17 * 3600 + 45 * 60, "Asia/Kathmandu", date(2024, 4, 1)),
+        (SPRING_FORWARD_EPOCH + 17 * 3600 + 45 * 60 - 1, "Asia/Kathmandu", date(2024, 3, 31)),
+    ),
+)
+def test_to_local_dates(epoch: int, timezone_name: str, expected_result: date) -> None:
+    result = to_local_dates([epoch, epoch], timezone_name)
+
+    assert result == [expected_result, expected_result]
+
+
+def test_bucket_by_day__report_columns() -> None:
+    columns = ReportColumns()
+    columns.extend([SEARCH_REPORT_TIME_ENTRY_RESPONSE])
+    row_indexes = range(len(columns))
+
+    result = bucket_by_day(row_indexes, "Europe/Berlin", key=lambda index: columns.start[index])
+
+    expected_dates = {
+        datetime.fromisoformat(item["start"]).astimezone(get_zone("Europe/Berlin")).date()
+        for item in SEARCH_REPORT_TIME_ENTRY_RESPONSE["time_entries"]
+    }
+    assert set(result) == expected_dates
+    assert sum(len(indexes) for indexes in result.values()) == len(columns)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import gzip
+import json
+from http import HTTPStatus
+from typing import List
+
+import pytest
+from httpx import ByteStream, MockTransport, Request, Response
+from toggl_python.auth import TokenAuth
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.transfer import TransferStats
+
+from tests.responses.me_get import FAKE_TOKEN, ME_FEATURES_RESPONSE
+
+
+def compressed_transport(content: bytes) -> MockTransport:
+    def handler(_: Request) -> Response:
+        return Response(
+            status_code=HTTPStatus.OK,
+            stream=ByteStream(content),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    return MockTransport(handler)
+
+
+def test_transfer_stats__compressed_response() -> None:
+    content = json.dumps(ME_FEATURES_RESPONSE * 20).encode()
+    compressed_content = gzip.compress(content)
+    recorded_stats: List[TransferStats] = []
+    user = CurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN),
+        transport=compressed_transport(compressed_content),
+        on_transfer=recorded_stats.append,
+    )
+
+    _ = user.features()
+
+    expected_result = TransferStats(
+        method="GET",
+        url="https://api.track.toggl.com/api/v9/me/features",
+        content_encoding="gzip",
+        wire_bytes=len(compressed_content),
+        decoded_bytes=len(content),
+    )
+    assert user.last_transfer == expected_result
+    assert recorded_stats == [expected_result]
+    assert expected_result.saved_bytes == len(content) - len(compressed_content)
+    assert expected_result.compression_ratio > 1
+
+
+def test_transfer_stats__empty_body() -> None:
+    stats = TransferStats(
+        method="GET", url="/", content_encoding=None, wire_bytes=0, decoded_bytes=0
+    )
+
+    assert stats.saved_bytes == 0
+    assert stats.compression_ratio == 1
+
+
+@pytest.mark.anyio
+async def test_async_transfer_stats__compressed_response() -> None:
+    content = json.dumps(ME_FEATURES_RESPONSE).encode()
+    compressed_content = gzip.compress(content)
+    user = AsyncCurrentUser(
+        auth=TokenAuth(token=FAKE_TOKEN), transport=compressed_transport(compressed_content)
+    )
+
+    _ = await user.features()
+
+    assert user.last_transfer is not None
+    assert user.last_transfer.wire_bytes == len(compressed_content)
+    assert user.last_transfer.decoded_bytes == len(content)
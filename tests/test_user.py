@@ -18,6 +18,9 @@ from toggl_python.schemas.current_user import (
     TimeFormat,
     UpdateMeResponse,
 )
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse
+from toggl_python.schemas.workspace import WorkspaceResponse
 
 from tests.conftest import fake
 from tests.responses.me_get import (
@@ -28,6 +31,9 @@ from tests.responses.me_get import (
     ME_RESPONSE_WITH_RELATED_DATA,
 )
 from tests.responses.me_put import UPDATE_ME_RESPONSE
+from tests.responses.project_get import PROJECT_RESPONSE
+from tests.responses.time_entry_get import ME_TIME_ENTRY_RESPONSE
+from tests.responses.workspace_get import WORKSPACE_RESPONSE
 
 
 if TYPE_CHECKING:
@@ -98,6 +104,59 @@ def test_me__ok_with_related_data(
     assert result == expected_result
 
 
+def test_me__related_data_is_validated_on_access(
+    response_mock: MockRouter, authed_current_user: CurrentUser
+) -> None:
+    invalid_project = {**PROJECT_RESPONSE, "id": "not an integer"}
+    response_body = {
+        **ME_RESPONSE_WITH_RELATED_DATA,
+        "projects": [invalid_project],
+        "time_entries": [ME_TIME_ENTRY_RESPONSE],
+        "workspaces": [WORKSPACE_RESPONSE],
+    }
+    _ = response_mock.get("/me").mock(
+        return_value=httpx.Response(status_code=200, json=response_body),
+    )
+
+    result = authed_current_user.me(with_related_data=True)
+
+    assert result.workspaces == [WorkspaceResponse.model_validate(WORKSPACE_RESPONSE)]
+    assert result.workspaces is result.workspaces
+    assert result.time_entries == [MeTimeEntryResponse.model_validate(ME_TIME_ENTRY_RESPONSE)]
+    assert result.raw_projects == [invalid_project]
+    with pytest.raises(ValidationError):
+        _ = result.projects
+
+
+def test_me__related_data_model_dump_round_trip() -> None:
+    response_body = {
+        **ME_RESPONSE_WITH_RELATED_DATA,
+        "projects": [PROJECT_RESPONSE],
+        "workspaces": [WORKSPACE_RESPONSE],
+    }
+    model = MeResponseWithRelatedData.model_validate(response_body)
+
+    result = model.model_dump()
+    json_result = MeResponseWithRelatedData.model_validate_json(model.model_dump_json())
+
+    assert not any(key.startswith("raw_") for key in result)
+    assert result["projects"] == [ProjectResponse.model_validate(PROJECT_RESPONSE).model_dump()]
+    assert result["workspaces"] == [
+        WorkspaceResponse.model_validate(WORKSPACE_RESPONSE).model_dump()
+    ]
+    assert result["time_entries"] is None
+    assert MeResponseWithRelatedData.model_validate(result).model_dump() == result
+    assert json_result.model_dump() == result
+
+
+def test_me__related_data_without_optional_collections() -> None:
+    result = MeResponseWithRelatedData.model_validate(ME_RESPONSE_WITH_RELATED_DATA)
+
+    assert result.projects is None
+    assert result.time_entries is None
+    assert result.workspaces == []
+
+
 @pytest.mark.parametrize(
     argnames=("field_name", "field_value"),
     argvalues=[
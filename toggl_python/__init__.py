@@ -1,10 +1,10 @@
 __version__ = "0.3.0"
 
 from .auth import BasicAuth, TokenAuth
-from .entities.report_time_entry import ReportTimeEntry
-from .entities.user import CurrentUser
-from .entities.workspace import Workspace
-from .exceptions import BadRequest, TogglException
+from .entities.report_time_entry import AsyncReportTimeEntry, ReportTimeEntry
+from .entities.user import AsyncCurrentUser, CurrentUser
+from .entities.workspace import AsyncWorkspace, Workspace
+from .exceptions import BadRequest, ClientError, ServerError, TogglException, TooManyRequests
 from .schemas.current_user import MeResponse
 from .schemas.project import ProjectQueryParams, ProjectResponse
 from .schemas.report_time_entry import (
@@ -13,6 +13,7 @@ from .schemas.report_time_entry import (
 )
 from .schemas.time_entry import MeTimeEntryResponse, TimeEntryCreateRequest, TimeEntryRequest
 from .schemas.workspace import WorkspaceResponse
+from .session import AsyncTogglSession, TogglSession
 
 
 __all__ = (
@@ -21,6 +22,11 @@ __all__ = (
     "CurrentUser",
     "Workspace",
     "ReportTimeEntry",
+    "AsyncCurrentUser",
+    "AsyncWorkspace",
+    "AsyncReportTimeEntry",
+    "TogglSession",
+    "AsyncTogglSession",
     "SearchReportTimeEntriesResponse",
     "SearchReportTimeEntriesRequest",
     "WorkspaceResponse",
@@ -32,4 +38,7 @@ __all__ = (
     "MeResponse",
     "BadRequest",
     "TogglException",
+    "ClientError",
+    "TooManyRequests",
+    "ServerError",
 )
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import logging
+import sys
+from enum import Enum
+from functools import lru_cache
+from itertools import count
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+from pydantic_core import from_json
+
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    UNION_TYPES: Tuple[object, ...] = (Union, UnionType)
+else:
+    UNION_TYPES: Tuple[object, ...] = (Union,)
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+DEFAULT_SAMPLE_RATE: int = 100
+
+
+class ValidationMode(str, Enum):
+    full = "full"
+    # Validate every N-th response, construct the rest without validation
+    sampled = "sampled"
+    trusted = "trusted"
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(schema: Type[T]) -> TypeAdapter[T]:
+    """Build validator once per schema, e.g. `ProjectResponse` or `List[ProjectResponse]`.
+
+    `TypeAdapter` creation compiles pydantic-core validator, so it is too slow for each call.
+    """
+    return TypeAdapter(schema)
+
+
+def decode_json(content: bytes, schema: Type[T]) -> T:
+    """Parse and validate raw response body in single pydantic-core pass.
+
+    It avoids building intermediate dicts which are thrown away after `model_validate`.
+    """
+    return get_type_adapter(schema).validate_json(content)
+
+
+def encode_json(
+    value: T,
+    schema: Optional[Type[T]] = None,
+    exclude_none: bool = False,
+    exclude_unset: bool = False,
+) -> bytes:
+    """Serialize request body to bytes in single pydantic-core pass.
+
+    Pass `schema` if it cannot be inferred from value type, e.g. `List[BulkEditOperation]`.
+    """
+    adapter = get_type_adapter(schema or type(value))
+
+    return adapter.dump_json(value, exclude_none=exclude_none, exclude_unset=exclude_unset)
+
+
+@lru_cache(maxsize=None)
+def get_projection_model(schema: Type[ModelT], fields: Tuple[str, ...]) -> Type[ModelT]:
+    unknown_fields = set(fields) - set(schema.model_fields)
+    if unknown_fields:
+        error_message = f"{schema.__name__} has no fields: {', '.join(sorted(unknown_fields))}"
+        raise ValueError(error_message)
+
+    field_definitions = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields
+    }
+
+    return create_model(
+        f"{schema.__name__}Projection",
+        __config__=schema.model_config,
+        __module__=schema.__module__,
+        **field_definitions,
+    )
+
+
+def select_fields(schema: Type[ModelT], fields: Optional[Iterable[str]]) -> Type[ModelT]:
+    """Return slim model with requested fields only, other keys are skipped without validation.
+
+    Model validators of `schema` are not copied, so the projection contains only raw fields.
+    """
+    if fields is None:
+        return schema
+
+    return get_projection_model(schema, tuple(sorted(set(fields))))
+
+
+@lru_cache(maxsize=None)
+def get_model_fields(model: Type[BaseModel]) -> List[Tuple[str, Any]]:
+    """Return JSON key and annotation of every field, resolved once per model.
+
+    Annotations of models referencing classes declared below them stay `ForwardRef`
+    in `model_fields`, so they are resolved from type hints instead.
+    """
+    type_hints = get_type_hints(model)
+
+    return [
+        (field.alias or name, type_hints.get(name, field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+
+def construct_value(value: Any, annotation: Any) -> Any:  # noqa: ANN401 - any JSON value
+    """Build nested models from parsed JSON without validation.
+
+    Scalars keep their JSON types, e.g. datetimes remain ISO 8601 strings.
+    """
+    if value is None:
+        return value
+
+    origin = get_origin(annotation)
+    if origin in UNION_TYPES:
+        for argument in get_args(annotation):
+            if argument is not type(None):
+                return construct_value(value, argument)
+    if origin in (list, List) and isinstance(value, list):
+        (item_annotation,) = get_args(annotation) or (Any,)
+        return [construct_value(item, item_annotation) for item in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not isinstance(value, dict):
+            return value
+        fields = {
+            key: construct_value(value[key], field_annotation)
+            for key, field_annotation in get_model_fields(annotation)
+            if key in value
+        }
+        return annotation.model_construct(**fields)
+
+    return value
+
+
+def construct_json(content: bytes, schema: Type[T]) -> T:
+    """Parse response body and build models without validation, only for trusted payloads."""
+    return construct_value(from_json(content), schema)
+
+
+class ResponseDecoder:
+    """Decode responses according to `ValidationMode`.
+
+    In `sampled` mode every `sample_rate`-th response is validated. Validation errors
+    of sampled responses are logged as schema drift instead of failing the call.
+    """
+
+    def __init__(
+        self,
+        mode: Union[ValidationMode, str] = ValidationMode.full,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+    ) -> None:
+        if sample_rate < 1:
+            error_message = "Sample rate must be at least 1"
+            raise ValueError(error_message)
+
+        self.mode = ValidationMode(mode)
+        self.sample_rate = sample_rate
+        self._counter = count()
+
+    def __call__(self, content: bytes, schema: Type[T]) -> T:
+        if self.mode == ValidationMode.full:
+            return decode_json(content, schema)
+        if self.mode == ValidationMode.trusted:
+            return construct_json(content, schema)
+
+        if next(self._counter) % self.sample_rate:
+            return construct_json(content, schema)
+
+        try:
+            return decode_json(content, schema)
+        except ValidationError as error:
+            logger.warning("Response does not match %s schema: %s", schema, error)
+
+            return construct_json(content, schema)
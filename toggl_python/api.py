@@ -1,31 +1,379 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from http import HTTPStatus
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from httpx import Client, HTTPStatusError, Response
+from httpx import (
+    URL,
+    AsyncClient,
+    AsyncHTTPTransport,
+    Client,
+    HTTPStatusError,
+    HTTPTransport,
+    Limits,
+    Response,
+    Timeout,
+)
+from httpx._utils import URLPattern, get_environment_proxies
 
-from toggl_python.exceptions import BadRequest
+from toggl_python.adapters import DEFAULT_SAMPLE_RATE, ResponseDecoder, ValidationMode
+from toggl_python.exceptions import BadRequest, ClientError, ServerError, TooManyRequests
+from toggl_python.rate_limit import (
+    AsyncRateLimitTransport,
+    RateLimiter,
+    RateLimitTransport,
+    get_rate_limiter,
+)
+from toggl_python.retry import AsyncRetryTransport, RetryPolicy, RetryTransport, parse_retry_after
+from toggl_python.streaming import JsonArraySplitter
+from toggl_python.transfer import TransferStats
 
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
+    from httpx import AsyncBaseTransport, BaseTransport
+    from typing_extensions import Self
+
     from toggl_python.auth import BasicAuth, TokenAuth
+    from toggl_python.cache import CacheEntry, ValidatorCache
+    from toggl_python.interning import InternPool
+
+T = TypeVar("T")
 
 COMMON_HEADERS: dict[str, str] = {"content-type": "application/json"}
 ROOT_URL: str = "https://api.track.toggl.com/api/v9"
+# Same values as httpx defaults, explicit to be tuned per wrapper or session
+DEFAULT_LIMITS: Limits = Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+DEFAULT_TIMEOUT: Timeout = Timeout(5.0)
 
 
-class ApiWrapper:
-    def __init__(self, auth: BasicAuth | TokenAuth, base_url: str = ROOT_URL) -> None:
-        self.client = Client(
-            base_url=base_url,
-            auth=auth,
-            headers=COMMON_HEADERS,
-            http2=True,
-        )
+def get_environment_proxy(url: str) -> Optional[str]:
+    """Resolve `HTTP(S)_PROXY`, `ALL_PROXY` and `NO_PROXY` for `url` the same way as `Client`.
+
+    `Client` ignores environment proxies if transport is passed, so default transports
+    are created with resolved proxy explicitly.
+    """
+    patterns = sorted(
+        ((URLPattern(pattern), proxy) for pattern, proxy in get_environment_proxies().items()),
+        key=itemgetter(0),
+    )
+    target = URL(url)
+
+    return next((proxy for pattern, proxy in patterns if pattern.matches(target)), None)
+
+
+class BaseApiWrapper:
+    root_url: str = ROOT_URL
+    client: Union[Client, AsyncClient]
+    validator_cache: Optional[ValidatorCache] = None
+    on_transfer: Optional[Callable[[TransferStats], None]] = None
+    last_transfer: Optional[TransferStats] = None
+    response_decoder: ResponseDecoder
+    intern_pool: Optional[InternPool] = None
+    # Injected transport is shared, so it is closed by its owner only
+    owns_transport: bool = True
+
+    @property
+    def origin(self) -> Tuple[str, str, Optional[int]]:
+        base_url = self.client.base_url
+
+        return base_url.scheme, base_url.host, base_url.port
+
+    @staticmethod
+    def resolve_timeout(timeout: Union[float, Timeout, None]) -> Timeout:
+        if timeout is None:
+            return DEFAULT_TIMEOUT
+
+        return timeout if isinstance(timeout, Timeout) else Timeout(timeout)
+
+    @staticmethod
+    def resolve_rate_limiter(
+        auth: BasicAuth | TokenAuth, rate_limit: Union[float, RateLimiter, None]
+    ) -> Optional[RateLimiter]:
+        """Share limiter between wrappers with the same credentials if only rate is passed."""
+        if rate_limit is None or isinstance(rate_limit, RateLimiter):
+            return rate_limit
+
+        return get_rate_limiter(auth, rate=rate_limit)
+
+    def decode(self, response: Response, schema: Type[T]) -> T:
+        self.record_transfer(response)
+
+        return self.intern(self.response_decoder(response.content, schema))
+
+    def intern(self, value: T) -> T:
+        if self.intern_pool is None:
+            return value
+
+        return self.intern_pool.intern(value)
+
+    def record_transfer(self, response: Response) -> None:
+        """Expose compressed and decompressed body size of the last decoded response."""
+        self.last_transfer = TransferStats.from_response(response)
+        if self.on_transfer is not None:
+            self.on_transfer(self.last_transfer)
+
+    def lookup_cache(
+        self, url: str, params: Optional[Dict[str, object]], schema: Type[T]
+    ) -> Tuple[Optional[Hashable], Optional[CacheEntry[T]]]:
+        if self.validator_cache is None:
+            return None, None
+
+        key = self.validator_cache.make_key(f"{self.client.base_url}{url}", params, schema)
+
+        return key, self.validator_cache.get(key)
+
+    def decode_fetched(
+        self,
+        response: Response,
+        schema: Type[T],
+        key: Optional[Hashable],
+        entry: Optional[CacheEntry[T]],
+    ) -> T:
+        """Reuse cached model on `304 Not Modified`, skipping both download and validation."""
+        if entry is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            return entry.value
+
+        self.raise_for_status(response)
+        value = self.decode(response, schema)
+        if self.validator_cache is not None and key is not None:
+            self.validator_cache.store(key, response, value)
+
+        return value
 
     def raise_for_status(self, response: Response) -> None:
         """Disable exception chaining to avoid huge not informative traceback."""
         try:
             _ = response.raise_for_status()
         except HTTPStatusError as base_exception:
-            raise BadRequest(base_exception.response.text) from None
+            text = base_exception.response.text
+            status_code = response.status_code
+            if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                retry_after = parse_retry_after(response)
+                raise TooManyRequests(text, status_code, retry_after=retry_after) from None
+            if response.is_client_error:
+                raise ClientError(text, status_code) from None
+            if response.is_server_error:
+                raise ServerError(text, status_code) from None
+
+            raise BadRequest(text, status_code) from None
+
+
+class ApiWrapper(BaseApiWrapper):
+    def __init__(
+        self,
+        auth: BasicAuth | TokenAuth,
+        base_url: Optional[str] = None,
+        transport: Optional[BaseTransport] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry: Optional[RetryPolicy] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        limits: Optional[Limits] = None,
+        timeout: Union[float, Timeout, None] = None,
+        on_transfer: Optional[Callable[[TransferStats], None]] = None,
+        validate_responses: Union[ValidationMode, str] = ValidationMode.full,
+        validation_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        """Pass `transport` to share one connection pool between several wrappers.
+
+        Shared transport is not owned by the wrapper, so its owner (e.g. `TogglSession`)
+        is responsible for closing it. `close` and context manager exit do nothing then.
+
+        `rate_limit` is either max requests per second, shared by all wrappers
+        with the same credentials, or explicitly configured `RateLimiter`.
+
+        `retry` enables retries of transient failures, every attempt is rate limited.
+
+        `validator_cache` enables conditional GET requests for read endpoints, it may be
+        shared between wrappers as well.
+
+        `limits` configures pool size and keep-alive expiry of the default transport,
+        it is ignored if `transport` is passed. `timeout` is either total seconds
+        or `Timeout` with separate connect/read/write/pool phases.
+
+        `on_transfer` is called with `TransferStats` of every decoded response,
+        e.g. to aggregate savings of `br`/`zstd` compression.
+
+        `validate_responses` trades strictness for throughput: `sampled` validates every
+        `validation_sample_rate`-th response and `trusted` builds models without validation,
+        so their fields keep raw JSON types (e.g. datetimes are strings).
+
+        `intern_pool` deduplicates values of repeated fields of decoded responses,
+        share one pool between wrappers to deduplicate values of long-lived caches.
+        """
+        self.validator_cache = validator_cache
+        self.on_transfer = on_transfer
+        self.response_decoder = ResponseDecoder(validate_responses, validation_sample_rate)
+        self.intern_pool = intern_pool
+        self.owns_transport = transport is None
+        if transport is None:
+            transport = HTTPTransport(
+                http2=True,
+                limits=limits or DEFAULT_LIMITS,
+                proxy=get_environment_proxy(base_url or self.root_url),
+            )
+        rate_limiter = self.resolve_rate_limiter(auth, rate_limit)
+        if rate_limiter is not None:
+            transport = RateLimitTransport(transport, rate_limiter)
+        if retry is not None:
+            transport = RetryTransport(transport, retry)
+
+        self.client = Client(
+            base_url=base_url or self.root_url,
+            auth=auth,
+            headers=COMMON_HEADERS,
+            http2=True,
+            timeout=self.resolve_timeout(timeout),
+            transport=transport,
+        )
+
+    def warmup(self) -> None:
+        """Open connection in advance, so the first real request skips DNS, TCP and TLS setup.
+
+        Response status is ignored, only connection errors are raised.
+        """
+        _ = self.client.head(url="")
+
+    def fetch(self, url: str, schema: Type[T], params: Optional[Dict[str, object]] = None) -> T:
+        """Send GET request, conditional one if response is already cached."""
+        key, entry = self.lookup_cache(url, params, schema)
+        headers = entry.conditional_headers if entry is not None else None
+        response = self.client.get(url=url, params=params, headers=headers)
+
+        return self.decode_fetched(response, schema, key, entry)
+
+    def iter_list(
+        self, url: str, schema: Type[T], params: Optional[Dict[str, object]] = None
+    ) -> Iterator[T]:
+        """Stream JSON array from GET response and yield its elements validated one by one.
+
+        Body is not kept in memory, so `last_transfer` and `validator_cache` are not used.
+        """
+        with self.client.stream("GET", url=url, params=params) as response:
+            if response.is_error:
+                _ = response.read()
+                self.raise_for_status(response)
+
+            splitter = JsonArraySplitter()
+            for chunk in response.iter_bytes():
+                for element in splitter.feed(chunk):
+                    yield self.intern(self.response_decoder(element, schema))
+            splitter.close()
+
+    def close(self) -> None:
+        if self.owns_transport:
+            self.client.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class AsyncApiWrapper(BaseApiWrapper):
+    """Non-blocking twin of `ApiWrapper`, methods of its subclasses must be awaited."""
+
+    def __init__(
+        self,
+        auth: BasicAuth | TokenAuth,
+        base_url: Optional[str] = None,
+        transport: Optional[AsyncBaseTransport] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry: Optional[RetryPolicy] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        limits: Optional[Limits] = None,
+        timeout: Union[float, Timeout, None] = None,
+        on_transfer: Optional[Callable[[TransferStats], None]] = None,
+        validate_responses: Union[ValidationMode, str] = ValidationMode.full,
+        validation_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        self.validator_cache = validator_cache
+        self.on_transfer = on_transfer
+        self.response_decoder = ResponseDecoder(validate_responses, validation_sample_rate)
+        self.intern_pool = intern_pool
+        self.owns_transport = transport is None
+        if transport is None:
+            transport = AsyncHTTPTransport(
+                http2=True,
+                limits=limits or DEFAULT_LIMITS,
+                proxy=get_environment_proxy(base_url or self.root_url),
+            )
+        rate_limiter = self.resolve_rate_limiter(auth, rate_limit)
+        if rate_limiter is not None:
+            transport = AsyncRateLimitTransport(transport, rate_limiter)
+        if retry is not None:
+            transport = AsyncRetryTransport(transport, retry)
+
+        self.client = AsyncClient(
+            base_url=base_url or self.root_url,
+            auth=auth,
+            headers=COMMON_HEADERS,
+            http2=True,
+            timeout=self.resolve_timeout(timeout),
+            transport=transport,
+        )
+
+    async def warmup(self) -> None:
+        _ = await self.client.head(url="")
+
+    async def fetch(
+        self, url: str, schema: Type[T], params: Optional[Dict[str, object]] = None
+    ) -> T:
+        key, entry = self.lookup_cache(url, params, schema)
+        headers = entry.conditional_headers if entry is not None else None
+        response = await self.client.get(url=url, params=params, headers=headers)
+
+        return self.decode_fetched(response, schema, key, entry)
+
+    async def iter_list(
+        self, url: str, schema: Type[T], params: Optional[Dict[str, object]] = None
+    ) -> AsyncIterator[T]:
+        async with self.client.stream("GET", url=url, params=params) as response:
+            if response.is_error:
+                _ = await response.aread()
+                self.raise_for_status(response)
+
+            splitter = JsonArraySplitter()
+            async for chunk in response.aiter_bytes():
+                for element in splitter.feed(chunk):
+                    yield self.intern(self.response_decoder(element, schema))
+            splitter.close()
+
+    async def aclose(self) -> None:
+        if self.owns_transport:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
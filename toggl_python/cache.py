@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from httpx import QueryParams
+
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE: int = 256
+
+
+class CacheEntry(Generic[T]):
+    __slots__ = ("etag", "last_modified", "value")
+
+    def __init__(self, value: T, etag: Optional[str], last_modified: Optional[str]) -> None:
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class ValidatorCache:
+    """Thread-safe LRU storage of validated responses and their `ETag`/`Last-Modified`.
+
+    Cached models are returned as is on `304 Not Modified`, so they must not be mutated.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        url: str, params: Optional[Dict[str, object]], schema: Hashable
+    ) -> Tuple[str, str, Hashable]:
+        return url, str(QueryParams(params)), schema
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def store(self, key: Hashable, response: Response, value: T) -> None:
+        """Remember value only if response can be validated later."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag=etag, last_modified=last_modified)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
+
+
+class BaseCursorIterator(Generic[ModelT]):
+    """Iterate pages ordered by id, the last seen id is passed as cursor of the next request.
+
+    `cursor` moves to an item when the next one is requested, so it can be persisted and
+    passed back to resume iteration after a crash without skipping unprocessed items.
+    Items with id not greater than cursor are skipped, so nothing is repeated whether
+    API treats cursor as inclusive or not.
+    With `prefetch` the next page is requested before items of the current one are yielded.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[int]], Any],
+        cursor: Optional[int] = None,
+        per_page: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.cursor = cursor
+        self.per_page = per_page
+        self.prefetch = prefetch
+
+    def get_new_items(self, page: List[ModelT]) -> List[ModelT]:
+        if self.cursor is None:
+            return page
+
+        return [item for item in page if item.id > self.cursor]
+
+    def is_last_page(self, page: List[ModelT], new_items: List[ModelT]) -> bool:
+        # Page without new items means API ignored cursor, stop instead of looping forever
+        return not new_items or (self.per_page is not None and len(page) < self.per_page)
+
+
+class CursorIterator(BaseCursorIterator[ModelT]):
+    fetch_page: Callable[[Optional[int]], List[ModelT]]
+
+    def __iter__(self) -> Iterator[ModelT]:
+        next_page: Optional[Future[List[ModelT]]] = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                page = self.fetch_page(self.cursor)
+                while True:
+                    items = self.get_new_items(page)
+                    is_last_page = self.is_last_page(page, items)
+                    if self.prefetch and not is_last_page:
+                        next_page = executor.submit(self.fetch_page, items[-1].id)
+
+                    for item in items:
+                        yield item
+                        self.cursor = item.id
+
+                    if is_last_page:
+                        return
+                    page = next_page.result() if next_page else self.fetch_page(self.cursor)
+                    next_page = None
+            finally:
+                if next_page:
+                    _ = next_page.cancel()
+
+
+class AsyncCursorIterator(BaseCursorIterator[ModelT]):
+    fetch_page: Callable[[Optional[int]], Awaitable[List[ModelT]]]
+
+    async def __aiter__(self) -> AsyncIterator[ModelT]:
+        next_page: Optional[asyncio.Task[List[ModelT]]] = None
+        try:
+            page = await self.fetch_page(self.cursor)
+            while True:
+                items = self.get_new_items(page)
+                is_last_page = self.is_last_page(page, items)
+                if self.prefetch and not is_last_page:
+                    next_page = asyncio.ensure_future(self.fetch_page(items[-1].id))
+
+                for item in items:
+                    yield item
+                    self.cursor = item.id
+
+                if is_last_page:
+                    return
+                page = await next_page if next_page else await self.fetch_page(self.cursor)
+                next_page = None
+        finally:
+            if next_page:
+                _ = next_page.cancel()
+                # Retrieve exception of discarded request, so it is not logged as unhandled
+                _ = await asyncio.gather(next_page, return_exceptions=True)
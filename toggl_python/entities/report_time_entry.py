@@ -1,27 +1,136 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import chain, count
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from toggl_python.api import ApiWrapper
+from toggl_python.adapters import encode_json
+from toggl_python.api import ApiWrapper, AsyncApiWrapper, BaseApiWrapper
+from toggl_python.lazy import defer_datetimes
+from toggl_python.reports import (
+    ReportColumns,
+    ReportOutput,
+    ReportRow,
+    SearchResult,
+    parse_report_rows,
+)
 from toggl_python.schemas.report_time_entry import (
     SearchReportTimeEntriesRequest,
     SearchReportTimeEntriesResponse,
 )
+from toggl_python.sharding import (
+    DateRange,
+    ReportGroup,
+    ShardSize,
+    bisect_date_range,
+    merge_shards,
+    split_date_range,
+)
 
 
 if TYPE_CHECKING:
     from datetime import date
 
-    from toggl_python.auth import BasicAuth, TokenAuth
+    from httpx import Response
+
+    PayloadFactory = Callable[..., bytes]
+    SearchPage = Tuple[SearchResult, Optional[int]]
 
 REPORT_ROOT_URL: str = "https://api.track.toggl.com/reports/api/v3/workspace"
 DEFAULT_PAGE_SIZE: int = 50
+DEFAULT_SHARD_WORKERS: int = 4
+# Missing on the last page of report
+NEXT_ROW_NUMBER_HEADER: str = "X-Next-Row-Number"
+
+
+class BaseReportTimeEntry(BaseApiWrapper):
+    root_url: str = REPORT_ROOT_URL
+
+    @staticmethod
+    def build_search_payload(
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        first_row_number: Optional[int] = None,
+    ) -> bytes:
+        payload_schema = SearchReportTimeEntriesRequest(
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+            first_row_number=first_row_number,
+        )
+
+        return encode_json(payload_schema, exclude_none=True, exclude_unset=True)
+
+    @staticmethod
+    def get_first_row_number(
+        page_number: Optional[int], page_size: Optional[int]
+    ) -> Optional[int]:
+        # API does not support page number but allows to specify first row number on current page
+        # So pagination is achieved by changing its value
+        if not page_number:
+            return None
+
+        return page_number * (page_size or DEFAULT_PAGE_SIZE) + 1
+
+    @staticmethod
+    def check_prefetch(prefetch: int) -> None:
+        if prefetch < 0:
+            error_message = "Prefetch must not be negative"
+            raise ValueError(error_message)
+
+    @staticmethod
+    def get_next_row_number(response: Response) -> Optional[int]:
+        next_row_number = response.headers.get(NEXT_ROW_NUMBER_HEADER)
+
+        return int(next_row_number) if next_row_number else None
+
+    @staticmethod
+    def check_group_output(output: Union[ReportOutput, str], method_name: str) -> None:
+        if ReportOutput(output) == ReportOutput.columns:
+            error_message = (
+                f"Columns output is not supported by `{method_name}`, use `search_pages`"
+            )
+            raise ValueError(error_message)
 
+    def decode_search(
+        self,
+        response: Response,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool = False,
+    ) -> SearchResult:
+        output = ReportOutput(output)
+        if output == ReportOutput.rows:
+            self.record_transfer(response)
+            return self.intern(parse_report_rows(response.content))
+        if output == ReportOutput.columns:
+            self.record_transfer(response)
+            return ReportColumns.from_json(response.content)
+
+        schema = defer_datetimes(SearchReportTimeEntriesResponse, lazy_datetimes)
+
+        return self.decode(response, List[schema])
 
-class ReportTimeEntry(ApiWrapper):
-    def __init__(self, auth: Union[BasicAuth, TokenAuth]) -> None:
-        super().__init__(auth, base_url=REPORT_ROOT_URL)
 
+class ReportTimeEntry(BaseReportTimeEntry, ApiWrapper):
     def search(
         self,
         workspace_id: int,
@@ -31,31 +140,522 @@ class ReportTimeEntry(ApiWrapper):
         project_ids: Optional[List[int]] = None,
         page_size: Optional[int] = None,
         page_number: Optional[int] = None,
-    ) -> List[SearchReportTimeEntriesResponse]:
-        """Return TimeEntries grouped by common values."""
-        # API does not support page number but allows to specify first row number on current page
-        # So pagination is achieved by changing its value
-        if page_number:
-            current_page_size = page_size or DEFAULT_PAGE_SIZE
-            first_row_number = page_number * current_page_size + 1
-        else:
-            first_row_number = None
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+    ) -> SearchResult:
+        """Return TimeEntries grouped by common values.
 
-        payload_schema = SearchReportTimeEntriesRequest(
+        Pass `output="rows"` to get compact `ReportRow` tuples for large reports,
+        each row is converted to the model with `to_model()`.
+        Pass `output="columns"` to get `ReportColumns` arrays with a row per TimeEntry.
+        Pass `lazy_datetimes=True` to parse datetimes of models only when they are accessed.
+        """
+        payload = self.build_search_payload(
             start_date=start_date,
             end_date=end_date,
             user_ids=user_ids,
             project_ids=project_ids,
             page_size=page_size,
-            first_row_number=first_row_number,
+            first_row_number=self.get_first_row_number(page_number, page_size),
+        )
+        page, _ = self.search_page(workspace_id, payload, output, lazy_datetimes)
+
+        return page
+
+    def search_page(
+        self,
+        workspace_id: int,
+        payload: bytes,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+    ) -> SearchPage:
+        """Return page and first row number of the next page, it is `None` for the last page."""
+        response = self.client.post(url=f"/{workspace_id}/search/time_entries", content=payload)
+        self.raise_for_status(response)
+        page = self.decode_search(response, output, lazy_datetimes)
+
+        return page, self.get_next_row_number(response) if page else None
+
+    def search_pages(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+        prefetch: int = 0,
+    ) -> Iterator[SearchResult]:
+        """Yield every page of the report, pages are followed until the last one.
+
+        By default the next page is requested when the previous one is consumed.
+        Pass `prefetch` to keep that many page requests in flight in background threads,
+        so network latency overlaps with processing of the current page.
+        """
+        self.check_prefetch(prefetch)
+        make_payload = partial(
+            self.build_search_payload,
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+        )
+        if prefetch:
+            return self.prefetch_search_pages(
+                workspace_id, make_payload, page_size, prefetch, output, lazy_datetimes
+            )
+
+        return self.follow_search_pages(workspace_id, make_payload, output, lazy_datetimes)
+
+    def follow_search_pages(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+        first_row_number: Optional[int] = None,
+    ) -> Iterator[SearchResult]:
+        while True:
+            page, first_row_number = self.search_page(
+                workspace_id,
+                make_payload(first_row_number=first_row_number),
+                output,
+                lazy_datetimes,
+            )
+            yield page
+            if first_row_number is None:
+                return
+
+    def prefetch_search_pages(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        page_size: Optional[int],
+        prefetch: int,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+    ) -> Iterator[SearchResult]:
+        """Request pages ahead by row numbers computed from page size.
+
+        If row number from response headers differs, the rest is followed sequentially.
+        Requests of pages after the last one are cancelled or discarded.
+        """
+        page_numbers = count()
+        pending: Deque[Future[SearchPage]] = deque()
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+
+            def submit() -> None:
+                first_row_number = self.get_first_row_number(next(page_numbers), page_size)
+                payload = make_payload(first_row_number=first_row_number)
+                pending.append(
+                    executor.submit(
+                        self.search_page, workspace_id, payload, output, lazy_datetimes
+                    )
+                )
+
+            try:
+                for _ in range(prefetch):
+                    submit()
+                for page_number in count(1):
+                    page, next_row_number = pending.popleft().result()
+                    if next_row_number is None:
+                        yield page
+                        return
+                    if next_row_number != self.get_first_row_number(page_number, page_size):
+                        yield page
+                        yield from self.follow_search_pages(
+                            workspace_id, make_payload, output, lazy_datetimes, next_row_number
+                        )
+                        return
+                    submit()
+                    yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def search_sharded(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str],
+        end_date: Union[date, str],
+        shard_size: Union[ShardSize, str] = ShardSize.month,
+        max_workers: int = DEFAULT_SHARD_WORKERS,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+    ) -> List[ReportGroup]:
+        """Split date range into shards, search them concurrently and merge results in date order.
+
+        Shards are calendar days, ISO weeks or months. With `shard_size="auto"` a month
+        is split in halves while it does not fit in one page. See `merge_shards`.
+        """
+        self.check_group_output(output, "search_sharded")
+        date_ranges = split_date_range(start_date, end_date, shard_size)
+        split_dense = ShardSize(shard_size) == ShardSize.auto
+        make_payload = partial(
+            self.build_search_payload,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+        )
+        shards: Dict[DateRange, List[ReportGroup]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Dict[Future[Optional[List[ReportGroup]]], DateRange] = {}
+
+            def submit(date_range: DateRange) -> None:
+                future = executor.submit(
+                    self.search_shard,
+                    workspace_id,
+                    make_payload,
+                    date_range,
+                    output,
+                    lazy_datetimes,
+                    split_dense,
+                )
+                pending[future] = date_range
+
+            try:
+                for date_range in date_ranges:
+                    submit(date_range)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        date_range = pending.pop(future)
+                        groups = future.result()
+                        if groups is None:
+                            for half in bisect_date_range(date_range):
+                                submit(half)
+                        else:
+                            shards[date_range] = groups
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return merge_shards([shards[date_range] for date_range in sorted(shards)])
+
+    def search_shard(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        date_range: DateRange,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+        split_dense: bool,
+    ) -> Optional[List[ReportGroup]]:
+        """Return groups of all pages in date range, `None` if dense range should be split."""
+        start, end = date_range
+        make_range_payload = partial(make_payload, start_date=start, end_date=end)
+        page, next_row_number = self.search_page(
+            workspace_id, make_range_payload(), output, lazy_datetimes
+        )
+        if next_row_number is not None and split_dense and start < end:
+            return None
+
+        groups = list(page)
+        if next_row_number is not None:
+            pages = self.follow_search_pages(
+                workspace_id, make_range_payload, output, lazy_datetimes, next_row_number
+            )
+            for next_page in pages:
+                groups.extend(next_page)
+
+        return groups
+
+    def search_iter(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+        prefetch: int = 0,
+    ) -> Iterator[Union[SearchReportTimeEntriesResponse, ReportRow]]:
+        """Yield grouped TimeEntries of all pages, only fetched pages are kept in memory."""
+        self.check_group_output(output, "search_iter")
+        pages = self.search_pages(
+            workspace_id=workspace_id,
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+            output=output,
+            lazy_datetimes=lazy_datetimes,
+            prefetch=prefetch,
+        )
+
+        return chain.from_iterable(pages)
+
+
+class AsyncReportTimeEntry(BaseReportTimeEntry, AsyncApiWrapper):
+    async def search(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        page_number: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+    ) -> SearchResult:
+        """Return TimeEntries grouped by common values."""
+        payload = self.build_search_payload(
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+            first_row_number=self.get_first_row_number(page_number, page_size),
         )
-        payload = payload_schema.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+        page, _ = await self.search_page(workspace_id, payload, output, lazy_datetimes)
 
-        response = self.client.post(url=f"/{workspace_id}/search/time_entries", json=payload)
+        return page
+
+    async def search_page(
+        self,
+        workspace_id: int,
+        payload: bytes,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+    ) -> SearchPage:
+        """Return page and first row number of the next page, it is `None` for the last page."""
+        response = await self.client.post(
+            url=f"/{workspace_id}/search/time_entries", content=payload
+        )
         self.raise_for_status(response)
+        page = self.decode_search(response, output, lazy_datetimes)
+
+        return page, self.get_next_row_number(response) if page else None
+
+    def search_pages(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+        prefetch: int = 0,
+    ) -> AsyncIterator[SearchResult]:
+        """Yield every page of the report, pass `prefetch` to request pages ahead in tasks."""
+        self.check_prefetch(prefetch)
+        make_payload = partial(
+            self.build_search_payload,
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+        )
+        if prefetch:
+            return self.prefetch_search_pages(
+                workspace_id, make_payload, page_size, prefetch, output, lazy_datetimes
+            )
+
+        return self.follow_search_pages(workspace_id, make_payload, output, lazy_datetimes)
+
+    async def follow_search_pages(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+        first_row_number: Optional[int] = None,
+    ) -> AsyncIterator[SearchResult]:
+        while True:
+            page, first_row_number = await self.search_page(
+                workspace_id,
+                make_payload(first_row_number=first_row_number),
+                output,
+                lazy_datetimes,
+            )
+            yield page
+            if first_row_number is None:
+                return
+
+    async def prefetch_search_pages(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        page_size: Optional[int],
+        prefetch: int,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+    ) -> AsyncIterator[SearchResult]:
+        page_numbers = count()
+        pending: Deque[asyncio.Task[SearchPage]] = deque()
+
+        def submit() -> None:
+            first_row_number = self.get_first_row_number(next(page_numbers), page_size)
+            payload = make_payload(first_row_number=first_row_number)
+            pending.append(
+                asyncio.ensure_future(
+                    self.search_page(workspace_id, payload, output, lazy_datetimes)
+                )
+            )
+
+        try:
+            for _ in range(prefetch):
+                submit()
+            for page_number in count(1):
+                page, next_row_number = await pending.popleft()
+                if next_row_number is None:
+                    yield page
+                    return
+                if next_row_number != self.get_first_row_number(page_number, page_size):
+                    yield page
+                    pages = self.follow_search_pages(
+                        workspace_id, make_payload, output, lazy_datetimes, next_row_number
+                    )
+                    async for next_page in pages:
+                        yield next_page
+                    return
+                submit()
+                yield page
+        finally:
+            for task in pending:
+                _ = task.cancel()
+            # Retrieve exceptions of discarded requests, so they are not logged as unhandled
+            _ = await asyncio.gather(*pending, return_exceptions=True)
+
+    async def search_sharded(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str],
+        end_date: Union[date, str],
+        shard_size: Union[ShardSize, str] = ShardSize.month,
+        max_workers: int = DEFAULT_SHARD_WORKERS,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+    ) -> List[ReportGroup]:
+        """Split date range into shards, search them concurrently and merge results in date order.
+
+        At most `max_workers` shards are requested at the same time.
+        """
+        self.check_group_output(output, "search_sharded")
+        date_ranges = split_date_range(start_date, end_date, shard_size)
+        split_dense = ShardSize(shard_size) == ShardSize.auto
+        make_payload = partial(
+            self.build_search_payload,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+        )
+        semaphore = asyncio.Semaphore(max_workers)
+        shards: Dict[DateRange, List[ReportGroup]] = {}
+        pending: Dict[asyncio.Future[Optional[List[ReportGroup]]], DateRange] = {}
+
+        def submit(date_range: DateRange) -> None:
+            task = asyncio.ensure_future(
+                self.search_shard(
+                    workspace_id,
+                    make_payload,
+                    date_range,
+                    output,
+                    lazy_datetimes,
+                    split_dense,
+                    semaphore,
+                )
+            )
+            pending[task] = date_range
+
+        try:
+            for date_range in date_ranges:
+                submit(date_range)
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    date_range = pending.pop(task)
+                    groups = task.result()
+                    if groups is None:
+                        for half in bisect_date_range(date_range):
+                            submit(half)
+                    else:
+                        shards[date_range] = groups
+        finally:
+            for task in pending:
+                _ = task.cancel()
+            _ = await asyncio.gather(*pending, return_exceptions=True)
+
+        return merge_shards([shards[date_range] for date_range in sorted(shards)])
+
+    async def search_shard(
+        self,
+        workspace_id: int,
+        make_payload: PayloadFactory,
+        date_range: DateRange,
+        output: Union[ReportOutput, str],
+        lazy_datetimes: bool,
+        split_dense: bool,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[List[ReportGroup]]:
+        """Return groups of all pages in date range, `None` if dense range should be split."""
+        start, end = date_range
+        make_range_payload = partial(make_payload, start_date=start, end_date=end)
+        async with semaphore:
+            page, next_row_number = await self.search_page(
+                workspace_id, make_range_payload(), output, lazy_datetimes
+            )
+            if next_row_number is not None and split_dense and start < end:
+                return None
+
+            groups = list(page)
+            if next_row_number is not None:
+                pages = self.follow_search_pages(
+                    workspace_id, make_range_payload, output, lazy_datetimes, next_row_number
+                )
+                async for next_page in pages:
+                    groups.extend(next_page)
+
+        return groups
+
+    def search_iter(
+        self,
+        workspace_id: int,
+        start_date: Union[date, str, None] = None,
+        end_date: Union[date, str, None] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        page_size: Optional[int] = None,
+        output: Union[ReportOutput, str] = ReportOutput.models,
+        lazy_datetimes: bool = False,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Union[SearchReportTimeEntriesResponse, ReportRow]]:
+        """Yield grouped TimeEntries of all pages, only fetched pages are kept in memory."""
+        self.check_group_output(output, "search_iter")
+        pages = self.search_pages(
+            workspace_id=workspace_id,
+            start_date=start_date,
+            end_date=end_date,
+            user_ids=user_ids,
+            project_ids=project_ids,
+            page_size=page_size,
+            output=output,
+            lazy_datetimes=lazy_datetimes,
+            prefetch=prefetch,
+        )
+
+        return self.iter_groups(pages)
 
-        response_body = response.json()
-        return [
-            SearchReportTimeEntriesResponse.model_validate(report_time_entry_data)
-            for report_time_entry_data in response_body
-        ]
+    @staticmethod
+    async def iter_groups(
+        pages: AsyncIterator[SearchResult],
+    ) -> AsyncIterator[Union[SearchReportTimeEntriesResponse, ReportRow]]:
+        async for page in pages:
+            for item in page:
+                yield item
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
-from toggl_python.api import ApiWrapper
+from toggl_python.adapters import encode_json, select_fields
+from toggl_python.api import ApiWrapper, AsyncApiWrapper, BaseApiWrapper
+from toggl_python.cursors import AsyncCursorIterator, CursorIterator
+from toggl_python.lazy import defer_datetimes
+from toggl_python.queries import PreparedQuery
 from toggl_python.schemas.current_user import (
     DateFormat,
     DurationFormat,
@@ -32,12 +46,112 @@ from toggl_python.schemas.time_entry import (
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from httpx import Response
     from pydantic import EmailStr
 
 
-class CurrentUser(ApiWrapper):
+EMPTY_OBJECT: bytes = b"{}"
+
+
+class BaseCurrentUser(BaseApiWrapper):
     prefix: str = "/me"
 
+    @staticmethod
+    def build_time_entries_params(
+        meta: bool = False,
+        since: Union[int, datetime, None] = None,
+        before: Union[str, datetime, None] = None,
+        start_date: Union[str, datetime, None] = None,
+        end_date: Union[str, datetime, None] = None,
+    ) -> MeTimeEntryQueryParams:
+        """Validate query params shared by all TimeEntries list methods."""
+        return MeTimeEntryQueryParams(
+            meta=meta,
+            since=since,
+            before=before,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    def decode_current_time_entry(self, response: Response) -> Optional[MeTimeEntryResponse]:
+        """Decode `null` body to None, empty object is treated the same way."""
+        if response.content.strip() == EMPTY_OBJECT:
+            self.record_transfer(response)
+            return None
+
+        return self.decode(response, Optional[MeTimeEntryResponse])
+
+    def prepare_time_entries(
+        self,
+        meta: bool = False,
+        since: Union[int, datetime, None] = None,
+        before: Union[str, datetime, None] = None,
+        start_date: Union[str, datetime, None] = None,
+        end_date: Union[str, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+        lazy_datetimes: bool = False,
+    ) -> PreparedQuery[List[Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]]]:
+        """Validate `get_time_entries` params once for polling, see `PreparedQuery`."""
+        payload_schema = self.build_time_entries_params(
+            meta=meta,
+            since=since,
+            before=before,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return PreparedQuery.from_schema(
+            fetch=self.fetch,
+            url=f"{self.prefix}/time_entries",
+            params_schema=payload_schema,
+            schema=List[defer_datetimes(select_fields(response_schema, fields), lazy_datetimes)],
+        )
+
+    def prepare_projects(
+        self,
+        include_archived: Optional[bool] = None,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> PreparedQuery[List[ProjectResponse]]:
+        """Validate `get_projects` params once for polling, see `PreparedQuery`."""
+        payload_schema = MeProjectsQueryParams(include_archived=include_archived, since=since)
+
+        return PreparedQuery.from_schema(
+            fetch=self.fetch,
+            url=f"{self.prefix}/projects",
+            params_schema=payload_schema,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def make_paginated_projects_fetcher(
+        self,
+        since: Union[int, datetime, None],
+        per_page: Optional[int],
+        fields: Optional[Sequence[str]],
+    ) -> Callable[[Optional[int]], Any]:
+        """Validate `get_paginated_projects` params once and return page getter by cursor."""
+        query_params_schema = MePaginatedProjectsQueryParams(
+            since=since, start_project_id=None, per_page=per_page
+        )
+        query_params = query_params_schema.model_dump(mode="json", exclude_none=True)
+        # Cursor is taken from project id, so it is always requested
+        schema = List[select_fields(ProjectResponse, None if fields is None else [*fields, "id"])]
+
+        def fetch_page(start_project_id: Optional[int]) -> Any:  # noqa: ANN401 - list or awaitable
+            params = (
+                query_params
+                if start_project_id is None
+                else {**query_params, "start_project_id": start_project_id}
+            )
+            return self.fetch(
+                url=f"{self.prefix}/projects/paginated", params=params, schema=schema
+            )
+
+        return fetch_page
+
+
+class CurrentUser(BaseCurrentUser, ApiWrapper):
     def logged(self) -> bool:
         response = self.client.get(url=f"{self.prefix}/logged")
         self.raise_for_status(response)
@@ -47,15 +161,11 @@ class CurrentUser(ApiWrapper):
 
     def me(self, with_related_data: bool = False) -> MeResponse:
         response_schema = MeResponseWithRelatedData if with_related_data else MeResponse
-        response = self.client.get(
+        return self.fetch(
             url=self.prefix,
             params={"with_related_data": with_related_data},
+            schema=response_schema,
         )
-        self.raise_for_status(response)
-
-        response_body = response.json()
-
-        return response_schema.model_validate(response_body)
 
     def update_me(
         self,
@@ -78,13 +188,12 @@ class CurrentUser(ApiWrapper):
             fullname=fullname,
             timezone=timezone,
         )
-        payload = payload_schema.model_dump(mode="json", exclude_none=True, exclude_unset=True)
+        payload = encode_json(payload_schema, exclude_none=True, exclude_unset=True)
 
-        response = self.client.put(url=self.prefix, json=payload)
+        response = self.client.put(url=self.prefix, content=payload)
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return UpdateMeResponse.model_validate(response_body)
+        return self.decode(response, UpdateMeResponse)
 
     def change_password(self, current_password: str, new_password: str) -> bool:
         """Validate and change user password.
@@ -95,7 +204,7 @@ class CurrentUser(ApiWrapper):
         payload_schema = UpdateMePasswordRequest(
             current_password=current_password, new_password=new_password
         )
-        payload = payload_schema.model_dump_json()
+        payload = encode_json(payload_schema)
 
         response = self.client.put(url=self.prefix, content=payload)
         self.raise_for_status(response)
@@ -103,21 +212,10 @@ class CurrentUser(ApiWrapper):
         return response.is_success
 
     def features(self) -> List[MeFeaturesResponse]:
-        response = self.client.get(url=f"{self.prefix}/features")
-        self.raise_for_status(response)
-        response_body = response.json()
-
-        return [
-            MeFeaturesResponse.model_validate(workspace_features)
-            for workspace_features in response_body
-        ]
+        return self.fetch(url=f"{self.prefix}/features", schema=List[MeFeaturesResponse])
 
     def preferences(self) -> MePreferencesResponse:
-        response = self.client.get(url=f"{self.prefix}/preferences")
-        self.raise_for_status(response)
-        response_body = response.json()
-
-        return MePreferencesResponse.model_validate(response_body)
+        return self.fetch(url=f"{self.prefix}/preferences", schema=MePreferencesResponse)
 
     def update_preferences(
         self,
@@ -134,7 +232,7 @@ class CurrentUser(ApiWrapper):
             duration_format=duration_format,
             timeofday_format=time_format,
         )
-        payload = payload_schema.model_dump_json(exclude_none=True, exclude_unset=True)
+        payload = encode_json(payload_schema, exclude_none=True, exclude_unset=True)
 
         response = self.client.post(url=f"{self.prefix}/preferences", content=payload)
         self.raise_for_status(response)
@@ -149,24 +247,20 @@ class CurrentUser(ApiWrapper):
         Tested responses do not differ from requests with `include_sharing=false`
         that is why there is no `include_sharing` method argument.
         """
-        response = self.client.get(
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return self.fetch(
             url=f"{self.prefix}/time_entries/{time_entry_id}",
             params={"meta": meta},
+            schema=response_schema,
         )
-        self.raise_for_status(response)
-
-        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
-
-        response_body = response.json()
-        return response_schema.model_validate(response_body)
 
     def get_current_time_entry(self) -> Optional[MeTimeEntryResponse]:
         """Return empty response if there is no running TimeEntry."""
         response = self.client.get(url=f"{self.prefix}/time_entries/current")
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return MeTimeEntryResponse.model_validate(response_body) if response_body else None
+        return self.decode_current_time_entry(response)
 
     def get_time_entries(
         self,
@@ -175,13 +269,16 @@ class CurrentUser(ApiWrapper):
         before: Union[str, datetime, None] = None,
         start_date: Union[str, datetime, None] = None,
         end_date: Union[str, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+        lazy_datetimes: bool = False,
     ) -> List[Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]]:
         """Intentionally use the same schema for requests with `include_sharing=true`.
 
         Tested responses do not differ from requests with `include_sharing=false`
         that is why there is no `include_sharing` method argument.
+        Pass `lazy_datetimes=True` to parse datetimes only when they are accessed.
         """
-        payload_schema = MeTimeEntryQueryParams(
+        payload_schema = self.build_time_entries_params(
             meta=meta,
             since=since,
             before=before,
@@ -190,48 +287,334 @@ class CurrentUser(ApiWrapper):
         )
         payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
-        response = self.client.get(url=f"{self.prefix}/time_entries", params=payload)
-        self.raise_for_status(response)
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return self.fetch(
+            url=f"{self.prefix}/time_entries",
+            params=payload,
+            schema=List[defer_datetimes(select_fields(response_schema, fields), lazy_datetimes)],
+        )
+
+    def iter_time_entries(
+        self,
+        meta: bool = False,
+        since: Union[int, datetime, None] = None,
+        before: Union[str, datetime, None] = None,
+        start_date: Union[str, datetime, None] = None,
+        end_date: Union[str, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+        lazy_datetimes: bool = False,
+    ) -> Iterator[Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]]:
+        """Yield TimeEntries while response is being downloaded, memory usage stays flat."""
+        payload_schema = self.build_time_entries_params(
+            meta=meta,
+            since=since,
+            before=before,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
         response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
 
-        response_body = response.json()
-        return [response_schema.model_validate(time_entry) for time_entry in response_body]
+        return self.iter_list(
+            url=f"{self.prefix}/time_entries",
+            params=payload,
+            schema=defer_datetimes(select_fields(response_schema, fields), lazy_datetimes),
+        )
 
     def get_web_timer(self) -> MeWebTimerResponse:
-        response = self.client.get(url=f"{self.prefix}/web-timer")
-        self.raise_for_status(response)
-
-        response_body = response.json()
-        return MeWebTimerResponse.model_validate(response_body)
+        return self.fetch(url=f"{self.prefix}/web-timer", schema=MeWebTimerResponse)
 
     def get_projects(
         self,
         include_archived: Optional[bool] = None,
         since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[ProjectResponse]:
         payload_schema = MeProjectsQueryParams(include_archived=include_archived, since=since)
         payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
-        response = self.client.get(url=f"{self.prefix}/projects", params=payload)
-        self.raise_for_status(response)
+        return self.fetch(
+            url=f"{self.prefix}/projects",
+            params=payload,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def iter_projects(
+        self,
+        include_archived: Optional[bool] = None,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[ProjectResponse]:
+        payload_schema = MeProjectsQueryParams(include_archived=include_archived, since=since)
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
-        response_body = response.json()
-        return [ProjectResponse.model_validate(project) for project in response_body]
+        return self.iter_list(
+            url=f"{self.prefix}/projects",
+            params=payload,
+            schema=select_fields(ProjectResponse, fields),
+        )
 
     def get_paginated_projects(
         self,
         since: Union[int, datetime, None] = None,
         start_project_id: Optional[int] = None,
         per_page: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[ProjectResponse]:
         query_params_schema = MePaginatedProjectsQueryParams(
             since=since, start_project_id=start_project_id, per_page=per_page
         )
         query_params = query_params_schema.model_dump(mode="json", exclude_none=True)
 
-        response = self.client.get(url=f"{self.prefix}/projects/paginated", params=query_params)
+        return self.fetch(
+            url=f"{self.prefix}/projects/paginated",
+            params=query_params,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def iter_paginated_projects(
+        self,
+        since: Union[int, datetime, None] = None,
+        start_project_id: Optional[int] = None,
+        per_page: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: bool = False,
+    ) -> CursorIterator[ProjectResponse]:
+        """Iterate all paginated projects, see `CursorIterator`.
+
+        Persisted `cursor` of returned iterator can be passed as `start_project_id` to resume.
+        """
+        fetch_page = self.make_paginated_projects_fetcher(since, per_page, fields)
+
+        return CursorIterator(fetch_page, start_project_id, per_page, prefetch)
+
+
+class AsyncCurrentUser(BaseCurrentUser, AsyncApiWrapper):
+    async def logged(self) -> bool:
+        response = await self.client.get(url=f"{self.prefix}/logged")
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return [ProjectResponse.model_validate(project) for project in response_body]
+        # Returns 200 OK and empty response body
+        return response.is_success
+
+    async def me(self, with_related_data: bool = False) -> MeResponse:
+        response_schema = MeResponseWithRelatedData if with_related_data else MeResponse
+        return await self.fetch(
+            url=self.prefix,
+            params={"with_related_data": with_related_data},
+            schema=response_schema,
+        )
+
+    async def update_me(
+        self,
+        beginning_of_week: Optional[int] = None,
+        country_id: Optional[int] = None,
+        default_workspace_id: Optional[int] = None,
+        email: Optional[EmailStr] = None,
+        fullname: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> UpdateMeResponse:
+        """Update instance without validating if new value is equal to current one.
+
+        So API request will be sent anyway.
+        """
+        payload_schema = UpdateMeRequest(
+            beginning_of_week=beginning_of_week,
+            country_id=country_id,
+            default_workspace_id=default_workspace_id,
+            email=email,
+            fullname=fullname,
+            timezone=timezone,
+        )
+        payload = encode_json(payload_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.put(url=self.prefix, content=payload)
+        self.raise_for_status(response)
+
+        return self.decode(response, UpdateMeResponse)
+
+    async def change_password(self, current_password: str, new_password: str) -> bool:
+        """Validate and change user password.
+
+        API response does not indicate about successful password change,
+        that is why return if response is successful.
+        """
+        payload_schema = UpdateMePasswordRequest(
+            current_password=current_password, new_password=new_password
+        )
+        payload = encode_json(payload_schema)
+
+        response = await self.client.put(url=self.prefix, content=payload)
+        self.raise_for_status(response)
+
+        return response.is_success
+
+    async def features(self) -> List[MeFeaturesResponse]:
+        return await self.fetch(url=f"{self.prefix}/features", schema=List[MeFeaturesResponse])
+
+    async def preferences(self) -> MePreferencesResponse:
+        return await self.fetch(url=f"{self.prefix}/preferences", schema=MePreferencesResponse)
+
+    async def update_preferences(
+        self,
+        date_format: Optional[DateFormat] = None,
+        duration_format: Optional[DurationFormat] = None,
+        time_format: Optional[TimeFormat] = None,
+    ) -> bool:
+        """Update different formats using pre-defined Enums.
+
+        API documentation is not up to date, available fields to update are found manually.
+        """
+        payload_schema = UpdateMePreferencesRequest(
+            date_format=date_format,
+            duration_format=duration_format,
+            timeofday_format=time_format,
+        )
+        payload = encode_json(payload_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.post(url=f"{self.prefix}/preferences", content=payload)
+        self.raise_for_status(response)
+
+        return response.is_success
+
+    async def get_time_entry(
+        self, time_entry_id: int, meta: bool = False
+    ) -> Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]:
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return await self.fetch(
+            url=f"{self.prefix}/time_entries/{time_entry_id}",
+            params={"meta": meta},
+            schema=response_schema,
+        )
+
+    async def get_current_time_entry(self) -> Optional[MeTimeEntryResponse]:
+        """Return empty response if there is no running TimeEntry."""
+        response = await self.client.get(url=f"{self.prefix}/time_entries/current")
+        self.raise_for_status(response)
+
+        return self.decode_current_time_entry(response)
+
+    async def get_time_entries(
+        self,
+        meta: bool = False,
+        since: Union[int, datetime, None] = None,
+        before: Union[str, datetime, None] = None,
+        start_date: Union[str, datetime, None] = None,
+        end_date: Union[str, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+        lazy_datetimes: bool = False,
+    ) -> List[Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]]:
+        payload_schema = self.build_time_entries_params(
+            meta=meta,
+            since=since,
+            before=before,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return await self.fetch(
+            url=f"{self.prefix}/time_entries",
+            params=payload,
+            schema=List[defer_datetimes(select_fields(response_schema, fields), lazy_datetimes)],
+        )
+
+    def iter_time_entries(
+        self,
+        meta: bool = False,
+        since: Union[int, datetime, None] = None,
+        before: Union[str, datetime, None] = None,
+        start_date: Union[str, datetime, None] = None,
+        end_date: Union[str, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+        lazy_datetimes: bool = False,
+    ) -> AsyncIterator[Union[MeTimeEntryResponse, MeTimeEntryWithMetaResponse]]:
+        """Yield TimeEntries while response is being downloaded, memory usage stays flat."""
+        payload_schema = self.build_time_entries_params(
+            meta=meta,
+            since=since,
+            before=before,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        response_schema = MeTimeEntryWithMetaResponse if meta else MeTimeEntryResponse
+
+        return self.iter_list(
+            url=f"{self.prefix}/time_entries",
+            params=payload,
+            schema=defer_datetimes(select_fields(response_schema, fields), lazy_datetimes),
+        )
+
+    async def get_web_timer(self) -> MeWebTimerResponse:
+        return await self.fetch(url=f"{self.prefix}/web-timer", schema=MeWebTimerResponse)
+
+    async def get_projects(
+        self,
+        include_archived: Optional[bool] = None,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ProjectResponse]:
+        payload_schema = MeProjectsQueryParams(include_archived=include_archived, since=since)
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return await self.fetch(
+            url=f"{self.prefix}/projects",
+            params=payload,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def iter_projects(
+        self,
+        include_archived: Optional[bool] = None,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[ProjectResponse]:
+        payload_schema = MeProjectsQueryParams(include_archived=include_archived, since=since)
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return self.iter_list(
+            url=f"{self.prefix}/projects",
+            params=payload,
+            schema=select_fields(ProjectResponse, fields),
+        )
+
+    async def get_paginated_projects(
+        self,
+        since: Union[int, datetime, None] = None,
+        start_project_id: Optional[int] = None,
+        per_page: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ProjectResponse]:
+        query_params_schema = MePaginatedProjectsQueryParams(
+            since=since, start_project_id=start_project_id, per_page=per_page
+        )
+        query_params = query_params_schema.model_dump(mode="json", exclude_none=True)
+
+        return await self.fetch(
+            url=f"{self.prefix}/projects/paginated",
+            params=query_params,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def iter_paginated_projects(
+        self,
+        since: Union[int, datetime, None] = None,
+        start_project_id: Optional[int] = None,
+        per_page: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: bool = False,
+    ) -> AsyncCursorIterator[ProjectResponse]:
+        """Iterate all paginated projects, see `AsyncCursorIterator`.
+
+        Persisted `cursor` of returned iterator can be passed as `start_project_id` to resume.
+        """
+        fetch_page = self.make_paginated_projects_fetcher(since, per_page, fields)
+
+        return AsyncCursorIterator(fetch_page, start_project_id, per_page, prefetch)
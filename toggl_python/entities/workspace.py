@@ -1,8 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from math import ceil
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
 
-from toggl_python.api import ApiWrapper
+from toggl_python.adapters import encode_json, select_fields
+from toggl_python.api import ApiWrapper, AsyncApiWrapper, BaseApiWrapper
+from toggl_python.queries import PreparedQuery
 from toggl_python.schemas.base import (
     BulkEditMethodParams,
     BulkEditOperation,
@@ -24,30 +42,141 @@ from toggl_python.schemas.workspace import (
 if TYPE_CHECKING:
     from datetime import date, datetime
 
+    from httpx import Response
+
+
+DEFAULT_PAGE_WORKERS: int = 4
+# Sent by API for paginated lists, pages are requested sequentially without it
+TOTAL_COUNT_HEADER: str = "X-Total-Count"
+
 
-class Workspace(ApiWrapper):
+class BaseWorkspace(BaseApiWrapper):
     prefix: str = "/workspaces"
 
-    def get(self, workspace_id: int) -> WorkspaceResponse:
-        response = self.client.get(url=f"{self.prefix}/{workspace_id}")
-        self.raise_for_status(response)
+    @staticmethod
+    def build_projects_params(  # noqa: PLR0913 - Too many arguments in function definition (14 > 12)
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+    ) -> ProjectQueryParams:
+        """Validate query params shared by all Projects list methods."""
+        return ProjectQueryParams(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            page=page,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
 
-        response_body = response.json()
+    @staticmethod
+    def get_page_size(per_page: Optional[int], first_page_size: int) -> int:
+        """Trust the size of the first page, API may cap `per_page` or apply its default."""
+        if per_page is None:
+            return first_page_size
 
-        return WorkspaceResponse.model_validate(response_body)
+        return min(per_page, first_page_size)
 
-    def list(self, since: Union[int, datetime, None] = None) -> List[WorkspaceResponse]:
-        payload_schema = GetWorkspacesQueryParams(since=since)
-        params = payload_schema.model_dump(mode="json", exclude_none=True)
+    @staticmethod
+    def get_total_pages(response: Response, page_size: int) -> Optional[int]:
+        total_count = response.headers.get(TOTAL_COUNT_HEADER)
+        if not total_count or not page_size:
+            return None
 
-        response = self.client.get(url=self.prefix, params=params)
-        self.raise_for_status(response)
+        return ceil(int(total_count) / page_size)
+
+    def prepare_list(
+        self,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> PreparedQuery[List[WorkspaceResponse]]:
+        """Validate `list` params once for polling, see `PreparedQuery`."""
+        return PreparedQuery.from_schema(
+            fetch=self.fetch,
+            url=self.prefix,
+            params_schema=GetWorkspacesQueryParams(since=since),
+            schema=List[select_fields(WorkspaceResponse, fields)],
+        )
+
+    def prepare_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> PreparedQuery[List[ProjectResponse]]:
+        """Validate `get_projects` params once for polling, see `PreparedQuery`."""
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            page=page,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+
+        return PreparedQuery.from_schema(
+            fetch=self.fetch,
+            url=f"{self.prefix}/{workspace_id}/projects",
+            params_schema=payload_schema,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
 
-        response_body = response.json()
 
-        return [
-            WorkspaceResponse.model_validate(workspace_data) for workspace_data in response_body
-        ]
+class Workspace(BaseWorkspace, ApiWrapper):
+    def get(self, workspace_id: int) -> WorkspaceResponse:
+        return self.fetch(url=f"{self.prefix}/{workspace_id}", schema=WorkspaceResponse)
+
+    def list(
+        self,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[WorkspaceResponse]:
+        payload_schema = GetWorkspacesQueryParams(since=since)
+        params = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return self.fetch(
+            url=self.prefix, params=params, schema=List[select_fields(WorkspaceResponse, fields)]
+        )
 
     def update(
         self,
@@ -72,15 +201,12 @@ class Workspace(ApiWrapper):
             reports_collapse=reports_collapse,
             name=name,
         )
-        request_body = request_body_schema.model_dump(
-            mode="json", exclude_none=True, exclude_unset=True
-        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
 
-        response = self.client.put(url=f"{self.prefix}/{workspace_id}", json=request_body)
+        response = self.client.put(url=f"{self.prefix}/{workspace_id}", content=request_body)
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return WorkspaceResponse.model_validate(response_body)
+        return self.decode(response, WorkspaceResponse)
 
     def create_project(
         self,
@@ -118,27 +244,64 @@ class Workspace(ApiWrapper):
             name=name,
             start_date=start_date,
         )
-        request_body = request_body_schema.model_dump(
-            mode="json", exclude_none=True, exclude_unset=True
-        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
 
         response = self.client.post(
-            url=f"{self.prefix}/{workspace_id}/projects", json=request_body
+            url=f"{self.prefix}/{workspace_id}/projects", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return ProjectResponse.model_validate(response_body)
+        return self.decode(response, ProjectResponse)
 
     def get_project(self, workspace_id: int, project_id: int) -> ProjectResponse:
-        response = self.client.get(url=f"{self.prefix}/{workspace_id}/projects/{project_id}")
-        self.raise_for_status(response)
+        return self.fetch(
+            url=f"{self.prefix}/{workspace_id}/projects/{project_id}", schema=ProjectResponse
+        )
 
-        response_body = response.json()
+    def get_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ProjectResponse]:
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            page=page,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
-        return ProjectResponse.model_validate(response_body)
+        return self.fetch(
+            url=f"{self.prefix}/{workspace_id}/projects",
+            params=payload,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
 
-    def get_projects(  # noqa: PLR0913 - Too many arguments in function definition (15 > 12)
+    def iter_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
         self,
         workspace_id: int,
         active: Optional[bool] = None,
@@ -155,8 +318,10 @@ class Workspace(ApiWrapper):
         sort_order: Optional[str] = None,
         only_templates: Optional[bool] = None,
         only_me: Optional[bool] = None,
-    ) -> List[ProjectResponse]:
-        payload_schema = ProjectQueryParams(
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[ProjectResponse]:
+        """Yield Projects while response is being downloaded, memory usage stays flat."""
+        payload_schema = self.build_projects_params(
             active=active,
             billable=billable,
             user_ids=user_ids,
@@ -174,12 +339,123 @@ class Workspace(ApiWrapper):
         )
         payload = payload_schema.model_dump(mode="json", exclude_none=True)
 
-        response = self.client.get(url=f"{self.prefix}/{workspace_id}/projects", params=payload)
+        return self.iter_list(
+            url=f"{self.prefix}/{workspace_id}/projects",
+            params=payload,
+            schema=select_fields(ProjectResponse, fields),
+        )
+
+    def iter_all_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
+    ) -> Iterator[ProjectResponse]:
+        """Yield Projects of all pages in requested order.
+
+        If API sends total count of Projects, up to `max_workers` pages after the first one
+        are requested concurrently in threads, otherwise pages are requested one by one.
+        """
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        url = f"{self.prefix}/{workspace_id}/projects"
+        schema = select_fields(ProjectResponse, fields)
+
+        return self.iter_project_pages(url, payload, schema, per_page, max_workers)
+
+    def get_projects_page(
+        self, url: str, params: Dict[str, Any], schema: Type[ProjectResponse], page: int
+    ) -> List[ProjectResponse]:
+        response = self.client.get(url=url, params={**params, "page": page})
+        self.raise_for_status(response)
+
+        return self.decode(response, List[schema])
+
+    def iter_project_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        schema: Type[ProjectResponse],
+        per_page: Optional[int],
+        max_workers: int,
+    ) -> Iterator[ProjectResponse]:
+        response = self.client.get(url=url, params={**params, "page": 1})
         self.raise_for_status(response)
+        projects = self.decode(response, List[schema])
+        yield from projects
+
+        page_size = self.get_page_size(per_page, len(projects))
+        total_pages = self.get_total_pages(response, page_size)
+        if total_pages is not None:
+            yield from self.iter_concurrent_project_pages(
+                url, params, schema, total_pages, max_workers
+            )
+            return
+
+        page = 1
+        while projects and len(projects) >= page_size:
+            page += 1
+            projects = self.get_projects_page(url, params, schema, page)
+            yield from projects
+
+    def iter_concurrent_project_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        schema: Type[ProjectResponse],
+        total_pages: int,
+        max_workers: int,
+    ) -> Iterator[ProjectResponse]:
+        """Request up to `max_workers` pages after the first one ahead, yield them in order."""
+        pages = iter(range(2, total_pages + 1))
+        pending: Deque[Future[List[ProjectResponse]]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
 
-        response_body = response.json()
+            def submit() -> None:
+                page = next(pages, None)
+                if page is not None:
+                    pending.append(
+                        executor.submit(self.get_projects_page, url, params, schema, page)
+                    )
 
-        return [ProjectResponse.model_validate(project_data) for project_data in response_body]
+            try:
+                for _ in range(max_workers):
+                    submit()
+                while pending:
+                    projects = pending.popleft().result()
+                    submit()
+                    yield from projects
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def update_project(  # noqa: PLR0913 - Too many arguments in function definition
         self,
@@ -222,17 +498,14 @@ class Workspace(ApiWrapper):
             template=template,
             template_id=template_id,
         )
-        request_body = request_body_schema.model_dump(
-            mode="json", exclude_none=True, exclude_unset=True
-        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
 
         response = self.client.put(
-            url=f"{self.prefix}/{workspace_id}/projects/{project_id}", json=request_body
+            url=f"{self.prefix}/{workspace_id}/projects/{project_id}", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-        return ProjectResponse.model_validate(response_body)
+        return self.decode(response, ProjectResponse)
 
     def bulk_edit_projects(
         self,
@@ -249,18 +522,14 @@ class Workspace(ApiWrapper):
         validated_args_schema = BulkEditMethodParams(ids=project_ids, operations=operations)
         validated_args = validated_args_schema.model_dump(mode="json")
         ids = validated_args["ids"]
-        request_body = [
-            operation.model_dump(mode="json", exclude_none=True) for operation in operations
-        ]
+        request_body = encode_json(operations, List[BulkEditOperation], exclude_none=True)
 
         response = self.client.patch(
-            url=f"{self.prefix}/{workspace_id}/projects/{ids}", json=request_body
+            url=f"{self.prefix}/{workspace_id}/projects/{ids}", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-
-        return BulkEditResponse.model_validate(response_body)
+        return self.decode(response, BulkEditResponse)
 
     def delete_project(self, workspace_id: int, project_id: int) -> bool:
         response = self.client.delete(url=f"{self.prefix}/{workspace_id}/projects/{project_id}")
@@ -297,18 +566,14 @@ class Workspace(ApiWrapper):
             task_id=task_id,
             user_id=user_id,
         )
-        request_body = request_body_schema.model_dump(
-            mode="json", exclude_none=True, exclude_unset=True
-        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
 
         response = self.client.post(
-            url=f"{self.prefix}/{workspace_id}/time_entries", json=request_body
+            url=f"{self.prefix}/{workspace_id}/time_entries", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-
-        return MeTimeEntryResponse.model_validate(response_body)
+        return self.decode(response, MeTimeEntryResponse)
 
     def update_time_entry(  # noqa: PLR0913 - Too many arguments in function definition (13 > 12)
         self,
@@ -340,16 +605,14 @@ class Workspace(ApiWrapper):
             task_id=task_id,
             user_id=user_id,
         )
-        request_body = request_body_schema.model_dump(mode="json", exclude_none=True)
+        request_body = encode_json(request_body_schema, exclude_none=True)
 
         response = self.client.put(
-            url=f"{self.prefix}/{workspace_id}/time_entries/{time_entry_id}", json=request_body
+            url=f"{self.prefix}/{workspace_id}/time_entries/{time_entry_id}", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-
-        return MeTimeEntryResponse.model_validate(response_body)
+        return self.decode(response, MeTimeEntryResponse)
 
     def delete_time_entry(self, workspace_id: int, time_entry_id: int) -> bool:
         response = self.client.delete(
@@ -369,18 +632,14 @@ class Workspace(ApiWrapper):
         validated_args = validated_args_schema.model_dump(mode="json")
         ids = validated_args["ids"]
 
-        request_body = [
-            operation.model_dump(mode="json", exclude_none=True) for operation in operations
-        ]
+        request_body = encode_json(operations, List[BulkEditOperation], exclude_none=True)
 
         response = self.client.patch(
-            url=f"{self.prefix}/{workspace_id}/time_entries/{ids}", json=request_body
+            url=f"{self.prefix}/{workspace_id}/time_entries/{ids}", content=request_body
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
-
-        return BulkEditResponse.model_validate(response_body)
+        return self.decode(response, BulkEditResponse)
 
     def stop_time_entry(self, workspace_id: int, time_entry_id: int) -> MeTimeEntryResponse:
         response = self.client.patch(
@@ -388,6 +647,487 @@ class Workspace(ApiWrapper):
         )
         self.raise_for_status(response)
 
-        response_body = response.json()
+        return self.decode(response, MeTimeEntryResponse)
+
+
+class AsyncWorkspace(BaseWorkspace, AsyncApiWrapper):
+    async def get(self, workspace_id: int) -> WorkspaceResponse:
+        return await self.fetch(url=f"{self.prefix}/{workspace_id}", schema=WorkspaceResponse)
+
+    async def list(
+        self,
+        since: Union[int, datetime, None] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[WorkspaceResponse]:
+        payload_schema = GetWorkspacesQueryParams(since=since)
+        params = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return await self.fetch(
+            url=self.prefix, params=params, schema=List[select_fields(WorkspaceResponse, fields)]
+        )
+
+    async def update(
+        self,
+        workspace_id: int,
+        admins: Optional[List[int]] = None,
+        only_admins_may_create_tags: Optional[bool] = None,
+        only_admins_see_team_dashboard: Optional[bool] = None,
+        reports_collapse: Optional[bool] = None,
+        name: Optional[str] = None,
+    ) -> WorkspaceResponse:
+        """Allow to update Workspace instance fields which are available on free plan.
+
+        See `Workspace.update` for the list of fields which are not supported.
+        """
+        request_body_schema = UpdateWorkspaceRequest(
+            admins=admins,
+            only_admins_may_create_tags=only_admins_may_create_tags,
+            only_admins_see_team_dashboard=only_admins_see_team_dashboard,
+            reports_collapse=reports_collapse,
+            name=name,
+        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.put(url=f"{self.prefix}/{workspace_id}", content=request_body)
+        self.raise_for_status(response)
+
+        return self.decode(response, WorkspaceResponse)
+
+    async def create_project(
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        auto_estimates: Optional[bool] = None,
+        client_id: Optional[int] = None,
+        client_name: Optional[str] = None,
+        currency: Optional[str] = None,
+        end_date: Union[date, str, None] = None,
+        estimated_hours: Optional[int] = None,
+        is_private: Optional[bool] = None,
+        is_shared: Optional[bool] = None,
+        name: Optional[str] = None,
+        start_date: Union[date, str, None] = None,
+    ) -> ProjectResponse:
+        """Allow to create Project with fields which are available on free plan.
+
+        See `Workspace.create_project` for details.
+        """
+        request_body_schema = CreateProjectRequest(
+            active=active,
+            auto_estimates=auto_estimates,
+            client_id=client_id,
+            client_name=client_name,
+            currency=currency,
+            end_date=end_date,
+            estimated_hours=estimated_hours,
+            is_private=is_private,
+            is_shared=is_shared,
+            name=name,
+            start_date=start_date,
+        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.post(
+            url=f"{self.prefix}/{workspace_id}/projects", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, ProjectResponse)
+
+    async def get_project(self, workspace_id: int, project_id: int) -> ProjectResponse:
+        return await self.fetch(
+            url=f"{self.prefix}/{workspace_id}/projects/{project_id}", schema=ProjectResponse
+        )
+
+    async def get_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ProjectResponse]:
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            page=page,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return await self.fetch(
+            url=f"{self.prefix}/{workspace_id}/projects",
+            params=payload,
+            schema=List[select_fields(ProjectResponse, fields)],
+        )
+
+    def iter_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[ProjectResponse]:
+        """Yield Projects while response is being downloaded, memory usage stays flat."""
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            page=page,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        return self.iter_list(
+            url=f"{self.prefix}/{workspace_id}/projects",
+            params=payload,
+            schema=select_fields(ProjectResponse, fields),
+        )
+
+    def iter_all_projects(  # noqa: PLR0913 - Too many arguments in function definition (16 > 12)
+        self,
+        workspace_id: int,
+        active: Optional[bool] = None,
+        billable: Optional[bool] = None,
+        user_ids: Optional[List[int]] = None,
+        client_ids: Optional[List[int]] = None,
+        group_ids: Optional[List[int]] = None,
+        statuses: Optional[str] = None,
+        since: Union[int, datetime, None] = None,
+        name: Optional[str] = None,
+        per_page: Optional[int] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        only_templates: Optional[bool] = None,
+        only_me: Optional[bool] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
+    ) -> AsyncIterator[ProjectResponse]:
+        """Yield Projects of all pages in requested order.
+
+        If API sends total count of Projects, up to `max_workers` pages after the first one
+        are requested concurrently in tasks, otherwise pages are requested one by one.
+        """
+        payload_schema = self.build_projects_params(
+            active=active,
+            billable=billable,
+            user_ids=user_ids,
+            client_ids=client_ids,
+            group_ids=group_ids,
+            statuses=statuses,
+            since=since,
+            name=name,
+            per_page=per_page,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            only_templates=only_templates,
+            only_me=only_me,
+        )
+        payload = payload_schema.model_dump(mode="json", exclude_none=True)
+
+        url = f"{self.prefix}/{workspace_id}/projects"
+        schema = select_fields(ProjectResponse, fields)
+
+        return self.iter_project_pages(url, payload, schema, per_page, max_workers)
+
+    async def get_projects_page(
+        self, url: str, params: Dict[str, Any], schema: Type[ProjectResponse], page: int
+    ) -> List[ProjectResponse]:
+        response = await self.client.get(url=url, params={**params, "page": page})
+        self.raise_for_status(response)
+
+        return self.decode(response, List[schema])
+
+    async def iter_project_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        schema: Type[ProjectResponse],
+        per_page: Optional[int],
+        max_workers: int,
+    ) -> AsyncIterator[ProjectResponse]:
+        response = await self.client.get(url=url, params={**params, "page": 1})
+        self.raise_for_status(response)
+        projects = self.decode(response, List[schema])
+        for project in projects:
+            yield project
+
+        page_size = self.get_page_size(per_page, len(projects))
+        total_pages = self.get_total_pages(response, page_size)
+        if total_pages is not None:
+            pages = self.iter_concurrent_project_pages(
+                url, params, schema, total_pages, max_workers
+            )
+            async for project in pages:
+                yield project
+            return
+
+        page = 1
+        while projects and len(projects) >= page_size:
+            page += 1
+            projects = await self.get_projects_page(url, params, schema, page)
+            for project in projects:
+                yield project
+
+    async def iter_concurrent_project_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        schema: Type[ProjectResponse],
+        total_pages: int,
+        max_workers: int,
+    ) -> AsyncIterator[ProjectResponse]:
+        """Request up to `max_workers` pages after the first one ahead, yield them in order."""
+        pages = iter(range(2, total_pages + 1))
+        pending: Deque[asyncio.Task[List[ProjectResponse]]] = deque()
+
+        def submit() -> None:
+            page = next(pages, None)
+            if page is not None:
+                pending.append(
+                    asyncio.ensure_future(self.get_projects_page(url, params, schema, page))
+                )
+
+        try:
+            for _ in range(max_workers):
+                submit()
+            while pending:
+                projects = await pending.popleft()
+                submit()
+                for project in projects:
+                    yield project
+        finally:
+            for task in pending:
+                _ = task.cancel()
+            # Retrieve exceptions of discarded requests, so they are not logged as unhandled
+            _ = await asyncio.gather(*pending, return_exceptions=True)
+
+    async def update_project(  # noqa: PLR0913 - Too many arguments in function definition
+        self,
+        workspace_id: int,
+        project_id: int,
+        active: Optional[bool] = None,
+        auto_estimates: Optional[bool] = None,
+        client_id: Optional[int] = None,
+        client_name: Optional[str] = None,
+        currency: Optional[str] = None,
+        end_date: Union[date, str, None] = None,
+        estimated_hours: Optional[int] = None,
+        is_private: Optional[bool] = None,
+        is_shared: Optional[bool] = None,
+        name: Optional[str] = None,
+        start_date: Union[date, str, None] = None,
+        template: Optional[bool] = None,
+        template_id: Optional[int] = None,
+    ) -> ProjectResponse:
+        """Allow to update Project instance fields which are available on free plan.
+
+        See `Workspace.update_project` for details.
+        """
+        request_body_schema = CreateProjectRequest(
+            active=active,
+            auto_estimates=auto_estimates,
+            client_id=client_id,
+            client_name=client_name,
+            currency=currency,
+            end_date=end_date,
+            estimated_hours=estimated_hours,
+            is_private=is_private,
+            is_shared=is_shared,
+            name=name,
+            start_date=start_date,
+            template=template,
+            template_id=template_id,
+        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.put(
+            url=f"{self.prefix}/{workspace_id}/projects/{project_id}", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, ProjectResponse)
+
+    async def bulk_edit_projects(
+        self,
+        workspace_id: int,
+        project_ids: List[int],
+        operations: List[BulkEditOperation],
+    ) -> BulkEditResponse:
+        """Bulk edit Projects with limited fields set.
+
+        See `Workspace.bulk_edit_projects` for the list of fields which are not supported.
+        """
+        validated_args_schema = BulkEditMethodParams(ids=project_ids, operations=operations)
+        validated_args = validated_args_schema.model_dump(mode="json")
+        ids = validated_args["ids"]
+        request_body = encode_json(operations, List[BulkEditOperation], exclude_none=True)
+
+        response = await self.client.patch(
+            url=f"{self.prefix}/{workspace_id}/projects/{ids}", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, BulkEditResponse)
+
+    async def delete_project(self, workspace_id: int, project_id: int) -> bool:
+        response = await self.client.delete(
+            url=f"{self.prefix}/{workspace_id}/projects/{project_id}"
+        )
+        self.raise_for_status(response)
+
+        return response.is_success
+
+    async def create_time_entry(
+        self,
+        workspace_id: int,
+        start_datetime: Union[datetime, str],
+        created_with: str,
+        billable: Optional[bool] = None,
+        description: Optional[str] = None,
+        duration: Optional[int] = None,
+        stop: Optional[str] = None,
+        project_id: Optional[int] = None,
+        tag_ids: Optional[List[int]] = None,
+        tags: Optional[List[str]] = None,
+        task_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> MeTimeEntryResponse:
+        request_body_schema = TimeEntryCreateRequest(
+            created_with=created_with,
+            start=start_datetime,
+            workspace_id=workspace_id,
+            billable=billable,
+            description=description,
+            duration=duration,
+            stop=stop,
+            project_id=project_id,
+            tag_ids=tag_ids,
+            tags=tags,
+            task_id=task_id,
+            user_id=user_id,
+        )
+        request_body = encode_json(request_body_schema, exclude_none=True, exclude_unset=True)
+
+        response = await self.client.post(
+            url=f"{self.prefix}/{workspace_id}/time_entries", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, MeTimeEntryResponse)
+
+    async def update_time_entry(  # noqa: PLR0913 - Too many arguments in function definition (13 > 12)
+        self,
+        workspace_id: int,
+        time_entry_id: int,
+        billable: Optional[bool] = None,
+        description: Optional[str] = None,
+        duration: Optional[int] = None,
+        project_id: Optional[int] = None,
+        shared_with_user_ids: Optional[List[int]] = None,
+        start: Optional[datetime] = None,
+        stop: Optional[datetime] = None,
+        tag_ids: Optional[List[int]] = None,
+        tags: Optional[List[str]] = None,
+        task_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> MeTimeEntryResponse:
+        """Some params from docs are not listed because API don't use them to change object."""
+        request_body_schema = TimeEntryRequest(
+            billable=billable,
+            description=description,
+            duration=duration,
+            project_id=project_id,
+            shared_with_user_ids=shared_with_user_ids,
+            start=start,
+            stop=stop,
+            tag_ids=tag_ids,
+            tags=tags,
+            task_id=task_id,
+            user_id=user_id,
+        )
+        request_body = encode_json(request_body_schema, exclude_none=True)
+
+        response = await self.client.put(
+            url=f"{self.prefix}/{workspace_id}/time_entries/{time_entry_id}", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, MeTimeEntryResponse)
+
+    async def delete_time_entry(self, workspace_id: int, time_entry_id: int) -> bool:
+        response = await self.client.delete(
+            url=f"{self.prefix}/{workspace_id}/time_entries/{time_entry_id}"
+        )
+        self.raise_for_status(response)
+
+        return response.is_success
+
+    async def bulk_edit_time_entries(
+        self,
+        workspace_id: int,
+        time_entry_ids: List[int],
+        operations: List[BulkEditOperation],
+    ) -> BulkEditResponse:
+        validated_args_schema = BulkEditMethodParams(ids=time_entry_ids, operations=operations)
+        validated_args = validated_args_schema.model_dump(mode="json")
+        ids = validated_args["ids"]
+
+        request_body = encode_json(operations, List[BulkEditOperation], exclude_none=True)
+
+        response = await self.client.patch(
+            url=f"{self.prefix}/{workspace_id}/time_entries/{ids}", content=request_body
+        )
+        self.raise_for_status(response)
+
+        return self.decode(response, BulkEditResponse)
+
+    async def stop_time_entry(self, workspace_id: int, time_entry_id: int) -> MeTimeEntryResponse:
+        response = await self.client.patch(
+            url=f"{self.prefix}/{workspace_id}/time_entries/{time_entry_id}/stop"
+        )
+        self.raise_for_status(response)
 
-        return MeTimeEntryResponse.model_validate(response_body)
+        return self.decode(response, MeTimeEntryResponse)
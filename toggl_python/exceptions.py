@@ -1,6 +1,31 @@
+from __future__ import annotations
+
+from typing import Optional
+
+
 class TogglException(Exception):
     pass
 
 
 class BadRequest(TogglException):
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ClientError(BadRequest):
+    """Request is invalid and should not be retried without changes."""
+
+
+class TooManyRequests(ClientError):
+    """Request is throttled, `retry_after` contains seconds to wait if API provided them."""
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None
+    ) -> None:
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+
+class ServerError(BadRequest):
     pass
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+# Longer lists rarely repeat, so comparing them is not worth it
+MAX_LIST_LENGTH: int = 16
+SCALAR_TYPES: Tuple[type, ...] = (str, int, float, bool)
+# Fields whose values repeat across responses, unique ones (ids, timestamps) are not pooled
+DEFAULT_FIELDS: FrozenSet[str] = frozenset(
+    (
+        "username",
+        "fullname",
+        "currency",
+        "description",
+        "name",
+        "color",
+        "tags",
+        "tag_ids",
+        "client_name",
+        "project_name",
+    )
+)
+DEFAULT_MAX_SIZE: int = 100_000
+
+
+class InternPool:
+    """Share one object between equal values of repeated fields of decoded responses.
+
+    Only values of `fields` (attributes of models and named tuples, keys of dicts) are pooled,
+    values passed to `intern` directly are pooled whatever their field is.
+    Pooled lists are shared between models, so interned models must not be mutated.
+
+    Pooled values are kept until `clear` is called or the pool is garbage collected,
+    so a pool shared between wrappers retains them as long as any of these wrappers.
+    Once `max_size` values are pooled, new values are returned as is.
+    """
+
+    def __init__(
+        self, fields: Iterable[str] = DEFAULT_FIELDS, max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        self.fields = frozenset(fields)
+        self.max_size = max_size
+        self.hits = 0
+        self.saved_bytes = 0
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, value: T, field: Optional[str] = None) -> T:
+        """Return canonical equal value, containers and models are updated in place.
+
+        Nested values are pooled only if `field` they belong to is one of pool `fields`.
+        """
+        if isinstance(value, str):
+            return self._pool(value, value) if self._is_pooled(field) else value
+        if isinstance(value, BaseModel):
+            for name, item in value.__dict__.items():
+                value.__dict__[name] = self.intern(item, name)
+            return value
+        if isinstance(value, tuple):
+            return self._intern_tuple(value, field)
+        if isinstance(value, list):
+            return self._intern_list(value, field)
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self.intern(item, key)
+
+        return value
+
+    def _intern_tuple(self, value: T, field: Optional[str]) -> T:
+        if hasattr(value, "_fields"):
+            return type(value)._make(
+                self.intern(item, name) for name, item in zip(value._fields, value)
+            )
+
+        items = [self.intern(item, field) for item in value]
+        if self._is_pooled(field) and self._is_small_scalar_sequence(items):
+            return self._pool(self._make_key(tuple, items), tuple(items))
+
+        return tuple(items)
+
+    def _intern_list(self, value: List[Any], field: Optional[str]) -> List[Any]:
+        for index, item in enumerate(value):
+            value[index] = self.intern(item, field)
+
+        if self._is_pooled(field) and self._is_small_scalar_sequence(value):
+            return self._pool(self._make_key(list, value), value)
+
+        return value
+
+    def _is_pooled(self, field: Optional[str]) -> bool:
+        return field is None or field in self.fields
+
+    def _pool(self, key: Hashable, value: T) -> T:
+        with self._lock:
+            pooled_value = self._values.get(key)
+            if pooled_value is None:
+                if len(self._values) < self.max_size:
+                    self._values[key] = value
+                return value
+            if pooled_value is not value:
+                self.hits += 1
+                self.saved_bytes += sys.getsizeof(value)
+
+        return pooled_value
+
+    @staticmethod
+    def _make_key(container_type: type, items: List[Any]) -> Hashable:
+        # Types are a part of key, because `1`, `1.0` and `True` are equal
+        return container_type, tuple((type(item), item) for item in items)
+
+    @staticmethod
+    def _is_small_scalar_sequence(value: Any) -> bool:  # noqa: ANN401 - list or tuple
+        return len(value) <= MAX_LIST_LENGTH and all(type(item) in SCALAR_TYPES for item in value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    create_model,
+    field_validator,
+    model_serializer,
+)
+
+from toggl_python.adapters import UNION_TYPES, ModelT, T, get_type_adapter
+
+
+DATETIME_TYPES: Tuple[object, ...] = (datetime, AwareDatetime)
+# Toggl returns timestamps in UTC, so their keys are sliced without parsing
+UTC_SUFFIXES: Tuple[str, ...] = ("Z", "+00:00")
+RAW_PREFIX: str = "raw_"
+
+
+def is_datetime_annotation(annotation: Any) -> bool:  # noqa: ANN401 - any type hint
+    if get_origin(annotation) in UNION_TYPES:
+        arguments = [argument for argument in get_args(annotation) if argument is not type(None)]
+        return len(arguments) == 1 and is_datetime_annotation(arguments[0])
+
+    return annotation in DATETIME_TYPES
+
+
+def make_datetime_accessor(name: str, annotation: Any) -> cached_property:  # noqa: ANN401
+    raw_name = f"{RAW_PREFIX}{name}"
+
+    def accessor(self: BaseModel) -> Optional[datetime]:
+        return get_type_adapter(annotation).validate_python(getattr(self, raw_name))
+
+    accessor.__name__ = name
+
+    return cached_property(accessor)
+
+
+def format_datetime(cls: Type[BaseModel], value: Any) -> Any:  # noqa: ANN401, ARG001
+    """Keep raw fields as strings when dumped models with parsed datetimes are validated."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def make_datetimes_serializer(datetime_fields: Dict[str, Tuple[str, Any]]) -> Any:  # noqa: ANN401
+    """Dump parsed datetimes under their original keys, so lazy model round-trips like schema."""
+
+    def serialize_datetimes(
+        self: BaseModel, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        renamed = {
+            alias if info.by_alias else f"{RAW_PREFIX}{name}": name
+            for name, (alias, _) in datetime_fields.items()
+        }
+        result = {}
+        for key, value in handler(self).items():
+            name = renamed.get(key)
+            if name is None:
+                result[key] = value
+                continue
+
+            _, annotation = datetime_fields[name]
+            result[key if info.by_alias else name] = (
+                None
+                if value is None
+                else get_type_adapter(annotation).dump_python(getattr(self, name), mode=info.mode)
+            )
+
+        return result
+
+    return model_serializer(mode="wrap")(serialize_datetimes)
+
+
+def defer_annotation(annotation: Any) -> Any:  # noqa: ANN401 - any type hint
+    """Replace models in `List[...]` and `Optional[...]` hints by their lazy copies."""
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item_annotation,) = get_args(annotation)
+        return List[defer_annotation(item_annotation)]
+    if origin in UNION_TYPES:
+        return Union[tuple(defer_annotation(argument) for argument in get_args(annotation))]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return get_lazy_model(annotation)
+
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def get_lazy_model(schema: Type[ModelT]) -> Type[ModelT]:
+    type_hints = get_type_hints(schema)
+    field_definitions = {}
+    datetime_fields = {}
+    for name, field in schema.model_fields.items():
+        annotation = type_hints.get(name, field.annotation)
+        if is_datetime_annotation(annotation):
+            datetime_fields[name] = annotation
+            raw_annotation = Optional[str] if get_origin(annotation) in UNION_TYPES else str
+            field_definitions[f"{RAW_PREFIX}{name}"] = (
+                raw_annotation,
+                Field(default=field.default, alias=field.alias or name),
+            )
+        else:
+            field_definitions[name] = (defer_annotation(annotation), field)
+
+    validators = {}
+    if datetime_fields:
+        validators["format_datetimes"] = field_validator(
+            *(f"{RAW_PREFIX}{name}" for name in datetime_fields), mode="before"
+        )(format_datetime)
+        validators["serialize_datetimes"] = make_datetimes_serializer(
+            {
+                name: (schema.model_fields[name].alias or name, annotation)
+                for name, annotation in datetime_fields.items()
+            }
+        )
+
+    model = create_model(
+        f"{schema.__name__}Lazy",
+        __config__=schema.model_config,
+        __module__=schema.__module__,
+        __validators__=validators,
+        **field_definitions,
+    )
+    for name, annotation in datetime_fields.items():
+        accessor = make_datetime_accessor(name, annotation)
+        setattr(model, name, accessor)
+        accessor.__set_name__(model, name)
+
+    return model
+
+
+def defer_datetimes(schema: Type[ModelT], enabled: bool) -> Type[ModelT]:
+    """Return model keeping datetimes as raw ISO 8601 strings until they are accessed.
+
+    Raw value of `start` is kept in `raw_start`, `start` is parsed on the first access
+    and cached. Dumps keep `start` key with parsed value, like `schema` does.
+    Like `select_fields`, model validators of `schema` are not copied.
+    """
+    if not enabled:
+        return schema
+
+    return get_lazy_model(schema)
+
+
+def utc_sort_key(value: str) -> str:
+    """Return UTC timestamp without offset, such keys are ordered like their datetimes."""
+    for suffix in UTC_SUFFIXES:
+        if value.endswith(suffix):
+            key = value[: -len(suffix)]
+            break
+    else:
+        parsed_value = datetime.fromisoformat(value)
+        if parsed_value.tzinfo is not None:
+            parsed_value = parsed_value.astimezone(timezone.utc).replace(tzinfo=None)
+        key = parsed_value.isoformat()
+
+    # `10:00:00.500` and `10:00:00.5` must be equal keys
+    if "." in key:
+        key = key.rstrip("0").rstrip(".")
+
+    return key
+
+
+def datetime_key(name: str) -> Callable[[Any], Tuple[bool, str]]:
+    """Build sort key of lazy models by raw `name` datetime, missing values sort last."""
+    raw_name = f"{RAW_PREFIX}{name}"
+
+    def key(item: Any) -> Tuple[bool, str]:  # noqa: ANN401 - any lazy model
+        value = getattr(item, raw_name)
+        return (True, "") if value is None else (False, utc_sort_key(value))
+
+    return key
+
+
+def sort_by_datetime(items: Iterable[T], name: str, reverse: bool = False) -> List[T]:
+    """Sort lazy models by datetime field without creating `datetime` objects."""
+    return sorted(items, key=datetime_key(name), reverse=reverse)
+
+
+def filter_by_datetime(
+    items: Iterable[T],
+    name: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[T]:
+    """Keep lazy models with `name` datetime within inclusive bounds, missing values are skipped.
+
+    Naive bounds are treated as UTC.
+    """
+    raw_name = f"{RAW_PREFIX}{name}"
+    since_key = None if since is None else utc_sort_key(since.isoformat())
+    until_key = None if until is None else utc_sort_key(until.isoformat())
+
+    result = []
+    for item in items:
+        value = getattr(item, raw_name)
+        if value is None:
+            continue
+        key = utc_sort_key(value)
+        if (since_key is None or key >= since_key) and (until_key is None or key <= until_key):
+            result.append(item)
+
+    return result
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Type, TypeVar
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+T = TypeVar("T")
+
+# API rejects `since`, `start_date` and `end_date` older than 3 months
+MAX_PARAM_AGE: timedelta = timedelta(days=90)
+LIMITED_PARAMS = ("since", "start_date", "end_date")
+
+
+class PreparedQuery(Generic[T]):
+    """GET request with validated and serialized params, which is executed many times.
+
+    Params schema is validated once in `prepare_*` methods. Every call only compares
+    current time with precomputed moment when the oldest datetime param becomes too old.
+    Call returns coroutine for async wrappers.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        url: str,
+        params: Dict[str, Any],
+        schema: Type[T],
+        expires_at: Optional[float] = None,
+    ) -> None:
+        self.fetch = fetch
+        self.url = url
+        self.params = params
+        self.schema = schema
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_schema(
+        cls,
+        fetch: Callable[..., Any],
+        url: str,
+        params_schema: BaseModel,
+        schema: Type[T],
+    ) -> PreparedQuery[T]:
+        limited_values = [
+            value
+            for value in (getattr(params_schema, name, None) for name in LIMITED_PARAMS)
+            if value is not None
+        ]
+        expires_at = (
+            min(value.timestamp() for value in limited_values) + MAX_PARAM_AGE.total_seconds()
+            if limited_values
+            else None
+        )
+
+        return cls(
+            fetch=fetch,
+            url=url,
+            params=params_schema.model_dump(mode="json", exclude_none=True),
+            schema=schema,
+            expires_at=expires_at,
+        )
+
+    def check_expiration(self) -> None:
+        if self.expires_at is not None and time.time() > self.expires_at:
+            error_message = "Prepared query params must not be older than 3 months"
+            raise ValueError(error_message)
+
+    def __call__(self) -> Any:  # noqa: ANN401 - `T` or awaitable `T`
+        self.check_expiration()
+
+        return self.fetch(url=self.url, params=self.params, schema=self.schema)
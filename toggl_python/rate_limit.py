@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Union
+
+from httpx import AsyncBaseTransport, BaseTransport, Request
+
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+    from toggl_python.auth import BasicAuth, TokenAuth
+
+# Toggl API uses Leaky Bucket, recommended rate is 1 request per second per API token
+DEFAULT_RATE: float = 1.0
+DEFAULT_BURST: int = 1
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Callers reserve a token and sleep outside of the lock, so one bucket can be shared
+    between threads and event loops without blocking each other while waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            error_message = "Rate must be positive and burst must be at least 1"
+            raise ValueError(error_message)
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    auth: Union[BasicAuth, TokenAuth], rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+) -> RateLimiter:
+    """Return limiter shared by every wrapper which uses the same credentials.
+
+    Limiter is created on first call, later calls must pass the same `rate` and `burst`.
+    Registry is keyed on a hash of credentials, so it does not keep them in memory.
+    """
+    authorized_request = next(auth.auth_flow(Request("GET", "https://api.track.toggl.com")))
+    key = hashlib.sha256(authorized_request.headers["Authorization"].encode()).hexdigest()
+
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(rate=rate, burst=burst)
+
+        limiter = _limiters[key]
+
+    if limiter.rate != rate or limiter.burst != burst:
+        error_message = (
+            f"Rate limiter of these credentials is already created with rate={limiter.rate} "
+            f"and burst={limiter.burst}, pass the same values or an explicit RateLimiter"
+        )
+        raise ValueError(error_message)
+
+    return limiter
+
+
+class RateLimitTransport(BaseTransport):
+    def __init__(self, transport: BaseTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: Request) -> Response:
+        self.limiter.acquire()
+
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await self.limiter.acquire_async()
+
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
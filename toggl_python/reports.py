@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic_core import from_json
+
+from toggl_python.schemas.report_time_entry import (
+    ReportTimeEntryItem,
+    SearchReportTimeEntriesResponse,
+)
+
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+# Stored in integer columns instead of `None`, Toggl ids are always positive
+MISSING: int = -1
+
+
+class ReportOutput(str, Enum):
+    # Validated pydantic models
+    models = "models"
+    # Compact tuples with epoch seconds, see `ReportRow`
+    rows = "rows"
+    # One array per field with a row per time entry, see `ReportColumns`
+    columns = "columns"
+
+
+@lru_cache(maxsize=None)
+def get_timezone(utc_offset: int) -> timezone:
+    return timezone(timedelta(seconds=utc_offset))
+
+
+def parse_timestamp(value: str) -> Tuple[int, int]:
+    """Split ISO 8601 datetime into epoch seconds and UTC offset in seconds."""
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    parsed_value = datetime.fromisoformat(value)
+    utc_offset = parsed_value.utcoffset()
+    if utc_offset is None:
+        error_message = f"Timezone is missing in {value}"
+        raise ValueError(error_message)
+
+    return int(parsed_value.timestamp()), int(utc_offset.total_seconds())
+
+
+def format_timestamp(epoch: int, utc_offset: int) -> datetime:
+    return datetime.fromtimestamp(epoch, tz=get_timezone(utc_offset))
+
+
+class ReportTimeEntryRow(NamedTuple):
+    """Compact `ReportTimeEntryItem`, datetimes are stored as epoch seconds.
+
+    `start` and `stop` share `utc_offset`, `at` is shown in `at_utc_offset` as `at_tz`.
+    """
+
+    id: int
+    seconds: int
+    start: int
+    stop: int
+    at: int
+    utc_offset: int
+    at_utc_offset: int
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> ReportTimeEntryRow:
+        start, utc_offset = parse_timestamp(item["start"])
+        stop, _ = parse_timestamp(item["stop"])
+        at, _ = parse_timestamp(item["at"])
+        _, at_utc_offset = parse_timestamp(item["at_tz"])
+
+        return cls(
+            id=item["id"],
+            seconds=item["seconds"],
+            start=start,
+            stop=stop,
+            at=at,
+            utc_offset=utc_offset,
+            at_utc_offset=at_utc_offset,
+        )
+
+    def to_model(self) -> ReportTimeEntryItem:
+        return ReportTimeEntryItem(
+            id=self.id,
+            seconds=self.seconds,
+            start=format_timestamp(self.start, self.utc_offset),
+            stop=format_timestamp(self.stop, self.utc_offset),
+            at=format_timestamp(self.at, 0),
+            at_tz=format_timestamp(self.at, self.at_utc_offset),
+        )
+
+
+class ReportRow(NamedTuple):
+    """Compact `SearchReportTimeEntriesResponse`, takes a fraction of pydantic model memory."""
+
+    row_number: int
+    user_id: int
+    username: str
+    project_id: Optional[int]
+    task_id: Optional[int]
+    description: Optional[str]
+    billable: bool
+    billable_amount_in_cents: Optional[int]
+    hourly_rate_in_cents: Optional[int]
+    currency: str
+    tag_ids: Tuple[int, ...]
+    time_entries: Tuple[ReportTimeEntryRow, ...]
+
+    @classmethod
+    def from_json(cls, group: Dict[str, Any]) -> ReportRow:
+        return cls(
+            row_number=group["row_number"],
+            user_id=group["user_id"],
+            username=group["username"],
+            project_id=group["project_id"],
+            task_id=group["task_id"],
+            description=group["description"],
+            billable=group["billable"],
+            billable_amount_in_cents=group["billable_amount_in_cents"],
+            hourly_rate_in_cents=group["hourly_rate_in_cents"],
+            currency=group["currency"],
+            tag_ids=tuple(group["tag_ids"]),
+            time_entries=tuple(
+                ReportTimeEntryRow.from_json(item) for item in group["time_entries"]
+            ),
+        )
+
+    def to_model(self) -> SearchReportTimeEntriesResponse:
+        return SearchReportTimeEntriesResponse(
+            row_number=self.row_number,
+            user_id=self.user_id,
+            username=self.username,
+            project_id=self.project_id,
+            task_id=self.task_id,
+            description=self.description,
+            billable=self.billable,
+            billable_amount_in_cents=self.billable_amount_in_cents,
+            hourly_rate_in_cents=self.hourly_rate_in_cents,
+            currency=self.currency,
+            tag_ids=list(self.tag_ids),
+            time_entries=[item.to_model() for item in self.time_entries],
+        )
+
+
+def parse_report_rows(content: bytes) -> List[ReportRow]:
+    """Build rows straight from parsed JSON, skipping pydantic models altogether."""
+    return [ReportRow.from_json(group) for group in from_json(content)]
+
+
+class StringTable:
+    """Store every distinct string once, columns keep its index instead."""
+
+    def __init__(self) -> None:
+        self.strings: List[str] = []
+        self._indexes: Dict[str, int] = {}
+
+    def index(self, value: Optional[str]) -> int:
+        if value is None:
+            return MISSING
+
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.strings)
+            self.strings.append(value)
+
+        return index
+
+    def get(self, index: int) -> Optional[str]:
+        return None if index == MISSING else self.strings[index]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class ReportColumns:
+    """Report flattened to struct of arrays, one row per time entry.
+
+    Group fields are repeated for each entry. Missing ids are stored as `MISSING`,
+    strings as indexes in `descriptions`, `usernames` and `currencies` tables.
+    """
+
+    INT_COLUMNS: Tuple[str, ...] = (
+        "id",
+        "row_number",
+        "user_id",
+        "project_id",
+        "task_id",
+        "seconds",
+        "start",
+        "stop",
+        "at",
+        "utc_offset",
+        "description",
+        "username",
+        "currency",
+    )
+
+    def __init__(self) -> None:
+        self.id = array("q")
+        self.row_number = array("q")
+        self.user_id = array("q")
+        self.project_id = array("q")
+        self.task_id = array("q")
+        self.seconds = array("q")
+        self.start = array("q")
+        self.stop = array("q")
+        self.at = array("q")
+        self.utc_offset = array("q")
+        self.billable = array("b")
+        self.description = array("q")
+        self.username = array("q")
+        self.currency = array("q")
+        self.descriptions = StringTable()
+        self.usernames = StringTable()
+        self.currencies = StringTable()
+
+    @classmethod
+    def from_json(cls, content: bytes) -> ReportColumns:
+        columns = cls()
+        columns.extend_json(content)
+
+        return columns
+
+    def extend_json(self, content: bytes) -> None:
+        """Append time entries of the next page of the report."""
+        self.extend(from_json(content))
+
+    def extend(self, groups: Iterable[Dict[str, Any]]) -> None:
+        for group in groups:
+            project_id = group["project_id"]
+            task_id = group["task_id"]
+            description = self.descriptions.index(group["description"])
+            username = self.usernames.index(group["username"])
+            currency = self.currencies.index(group["currency"])
+            for item in group["time_entries"]:
+                entry = ReportTimeEntryRow.from_json(item)
+                self.id.append(entry.id)
+                self.row_number.append(group["row_number"])
+                self.user_id.append(group["user_id"])
+                self.project_id.append(MISSING if project_id is None else project_id)
+                self.task_id.append(MISSING if task_id is None else task_id)
+                self.seconds.append(entry.seconds)
+                self.start.append(entry.start)
+                self.stop.append(entry.stop)
+                self.at.append(entry.at)
+                self.utc_offset.append(entry.utc_offset)
+                self.billable.append(group["billable"])
+                self.description.append(description)
+                self.username.append(username)
+                self.currency.append(currency)
+
+    def to_numpy(self) -> Dict[str, ndarray]:
+        """Copy columns to NumPy arrays, NumPy is an optional dependency.
+
+        Arrays do not share memory with columns, so columns can still be extended later.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            error_message = "NumPy is required for `to_numpy`, install it with `pip install numpy`"
+            raise ImportError(error_message) from None
+
+        result = {name: np.array(getattr(self, name), dtype=np.int64) for name in self.INT_COLUMNS}
+        result["billable"] = np.array(self.billable, dtype=bool)
+
+        return result
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+
+SearchResult = Union[List[SearchReportTimeEntriesResponse], List[ReportRow], ReportColumns]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Callable, FrozenSet, Optional
+
+from httpx import AsyncBaseTransport, BaseTransport, TransportError
+
+
+if TYPE_CHECKING:
+    from httpx import Request, Response
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES: FrozenSet[int] = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+def parse_retry_after(response: Response) -> Optional[float]:
+    """Return seconds to wait from `Retry-After` header, which is either seconds or HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max((retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """Retry transient failures with exponential backoff and full jitter.
+
+    Only idempotent methods are retried by default. POST requests are retried
+    only if `retry_post` is set, e.g. for read-only `ReportTimeEntry.search`.
+    Responses asking to wait longer than `max_retry_after` seconds are not retried,
+    so `TooManyRequests` with `retry_after` is raised instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 60.0,
+        retry_post: bool = False,
+        statuses: FrozenSet[int] = RETRY_STATUSES,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.methods = (IDEMPOTENT_METHODS | {"POST"}) if retry_post else IDEMPOTENT_METHODS
+        self.statuses = statuses
+        self.jitter = jitter
+
+    def is_retryable(self, request: Request, attempt: int) -> bool:
+        return attempt < self.max_retries and request.method in self.methods
+
+    def is_retryable_response(self, request: Request, response: Response, attempt: int) -> bool:
+        if response.status_code not in self.statuses or not self.is_retryable(request, attempt):
+            return False
+
+        retry_after = parse_retry_after(response)
+
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def get_delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Prefer server provided `Retry-After`, otherwise sleep random time within backoff."""
+        if response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+
+        return backoff * self.jitter()
+
+
+class RetryTransport(BaseTransport):
+    def __init__(self, transport: BaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    def handle_request(self, request: Request) -> Response:
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except TransportError:
+                if not self.policy.is_retryable(request, attempt):
+                    raise
+                time.sleep(self.policy.get_delay(attempt))
+            else:
+                if not self.policy.is_retryable_response(request, response, attempt):
+                    return response
+                response.close()
+                time.sleep(self.policy.get_delay(attempt, response))
+
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport, policy: RetryPolicy) -> None:
+        self.transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: Request) -> Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except TransportError:
+                if not self.policy.is_retryable(request, attempt):
+                    raise
+                await asyncio.sleep(self.policy.get_delay(attempt))
+            else:
+                if not self.policy.is_retryable_response(request, response, attempt):
+                    return response
+                await response.aclose()
+                await asyncio.sleep(self.policy.get_delay(attempt, response))
+
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
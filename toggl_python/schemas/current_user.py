@@ -1,31 +1,29 @@
 from __future__ import annotations
 
-from enum import Enum
-
-from toggl_python.schemas.base import BaseSchema
-
-
-try:
-    import zoneinfo
-except ImportError:
-    from backports import zoneinfo
 from datetime import datetime
-from typing import Dict, List, Optional
+from enum import Enum
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Type
 
 from pydantic import (
     EmailStr,
     SecretStr,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
     field_serializer,
     field_validator,
+    model_serializer,
     model_validator,
 )
 from pydantic.fields import Field
 from pydantic_core import Url
 
-# Move application import `toggl_python.schemas.project.ProjectResponse` into a type-checking block
-from toggl_python.schemas.project import ProjectResponse  # noqa: TCH001
-from toggl_python.schemas.time_entry import MeTimeEntryResponse  # noqa: TCH001
-from toggl_python.schemas.workspace import WorkspaceResponse  # noqa: TCH001
+from toggl_python.adapters import get_type_adapter
+from toggl_python.schemas.base import BaseSchema
+from toggl_python.schemas.project import ProjectResponse
+from toggl_python.schemas.time_entry import MeTimeEntryResponse
+from toggl_python.schemas.workspace import WorkspaceResponse
+from toggl_python.timezones import get_available_timezones
 
 
 class DateFormat(str, Enum):
@@ -91,7 +89,7 @@ class UpdateMeRequest(BaseSchema):
     @field_validator("timezone")
     @classmethod
     def check_if_timezone_exists(cls, value: Optional[str]) -> Optional[str]:
-        if not value or value in zoneinfo.available_timezones():
+        if not value or value in get_available_timezones():
             return value
 
         error_message = f"Specified timezone {value} is invalid"
@@ -103,11 +101,63 @@ class UpdateMeResponse(MeResponseBase):
 
 
 class MeResponseWithRelatedData(MeResponse):
+    """Related collections are kept as parsed JSON and validated on first access.
+
+    Most callers need only a part of them, e.g. `workspaces` to bootstrap.
+    """
+
     clients: Optional[List] = None
-    projects: Optional[List[ProjectResponse]] = None
+    raw_projects: Optional[List[Dict[str, Any]]] = Field(default=None, alias="projects")
     tags: Optional[List] = None
-    time_entries: Optional[List[MeTimeEntryResponse]] = None
-    workspaces: List[WorkspaceResponse]  # Default workspace is created after signup,
+    raw_time_entries: Optional[List[Dict[str, Any]]] = Field(default=None, alias="time_entries")
+    # Default workspace is created after signup
+    raw_workspaces: List[Dict[str, Any]] = Field(alias="workspaces")
+
+    @cached_property
+    def projects(self) -> Optional[List[ProjectResponse]]:
+        if self.raw_projects is None:
+            return None
+
+        return get_type_adapter(List[ProjectResponse]).validate_python(self.raw_projects)
+
+    @cached_property
+    def time_entries(self) -> Optional[List[MeTimeEntryResponse]]:
+        if self.raw_time_entries is None:
+            return None
+
+        return get_type_adapter(List[MeTimeEntryResponse]).validate_python(self.raw_time_entries)
+
+    @cached_property
+    def workspaces(self) -> List[WorkspaceResponse]:
+        return get_type_adapter(List[WorkspaceResponse]).validate_python(self.raw_workspaces)
+
+    @model_serializer(mode="wrap")
+    def serialize_related_data(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        """Dump validated collections under API keys, as if they were regular fields."""
+        result = {}
+        for key, value in handler(self).items():
+            name = key[len("raw_") :] if key.startswith("raw_") else key
+            if name not in RELATED_DATA_SCHEMAS or value is None:
+                result[name] = value
+                continue
+
+            result[name] = get_type_adapter(List[RELATED_DATA_SCHEMAS[name]]).dump_python(
+                getattr(self, name),
+                mode=info.mode,
+                by_alias=info.by_alias,
+                exclude_none=info.exclude_none,
+            )
+
+        return result
+
+
+RELATED_DATA_SCHEMAS: Dict[str, Type[BaseSchema]] = {
+    "projects": ProjectResponse,
+    "time_entries": MeTimeEntryResponse,
+    "workspaces": WorkspaceResponse,
+}
 
 
 class UpdateMePasswordRequest(BaseSchema):
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
+
+from httpx import AsyncHTTPTransport, HTTPTransport, Limits, Timeout
+
+from toggl_python.adapters import DEFAULT_SAMPLE_RATE, ValidationMode
+from toggl_python.api import DEFAULT_LIMITS, ROOT_URL, get_environment_proxy
+from toggl_python.entities.report_time_entry import AsyncReportTimeEntry, ReportTimeEntry
+from toggl_python.entities.user import AsyncCurrentUser, CurrentUser
+from toggl_python.entities.workspace import AsyncWorkspace, Workspace
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from httpx import AsyncBaseTransport, BaseTransport
+    from typing_extensions import Self
+
+    from toggl_python.api import ApiWrapper, AsyncApiWrapper
+    from toggl_python.auth import BasicAuth, TokenAuth
+    from toggl_python.cache import ValidatorCache
+    from toggl_python.interning import InternPool
+    from toggl_python.rate_limit import RateLimiter
+    from toggl_python.retry import RetryPolicy
+    from toggl_python.transfer import TransferStats
+
+    ApiWrapperT = TypeVar("ApiWrapperT", bound=ApiWrapper)
+    AsyncApiWrapperT = TypeVar("AsyncApiWrapperT", bound=AsyncApiWrapper)
+
+
+class TogglSession:
+    """Own one connection pool and hand out entities bound to it.
+
+    `ROOT_URL` and `REPORT_ROOT_URL` are served by the same host, so every entity
+    reuses the same (HTTP/2 multiplexed) connection instead of opening its own.
+    Entities must not be closed separately - close the session instead.
+
+    `limits` sizes the shared pool, so raise `max_connections` and
+    `max_keepalive_connections` for concurrent fan-out workloads.
+    """
+
+    def __init__(
+        self,
+        auth: Union[BasicAuth, TokenAuth],
+        transport: Optional[BaseTransport] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry: Optional[RetryPolicy] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        limits: Optional[Limits] = None,
+        timeout: Union[float, Timeout, None] = None,
+        on_transfer: Optional[Callable[[TransferStats], None]] = None,
+        validate_responses: Union[ValidationMode, str] = ValidationMode.full,
+        validation_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        self.auth = auth
+        self.transport = transport or HTTPTransport(
+            http2=True, limits=limits or DEFAULT_LIMITS, proxy=get_environment_proxy(ROOT_URL)
+        )
+        self.rate_limit = rate_limit
+        self.retry = retry
+        self.validator_cache = validator_cache
+        self.timeout = timeout
+        self.on_transfer = on_transfer
+        self.validate_responses = validate_responses
+        self.validation_sample_rate = validation_sample_rate
+        self.intern_pool = intern_pool
+        self._entities: Dict[Type[ApiWrapper], ApiWrapper] = {}
+
+    def _bind(self, entity_class: Type[ApiWrapperT]) -> ApiWrapperT:
+        if entity_class not in self._entities:
+            self._entities[entity_class] = entity_class(
+                self.auth,
+                transport=self.transport,
+                rate_limit=self.rate_limit,
+                retry=self.retry,
+                validator_cache=self.validator_cache,
+                timeout=self.timeout,
+                on_transfer=self.on_transfer,
+                validate_responses=self.validate_responses,
+                validation_sample_rate=self.validation_sample_rate,
+                intern_pool=self.intern_pool,
+            )
+
+        return self._entities[entity_class]
+
+    @property
+    def current_user(self) -> CurrentUser:
+        return self._bind(CurrentUser)
+
+    @property
+    def workspace(self) -> Workspace:
+        return self._bind(Workspace)
+
+    @property
+    def report_time_entry(self) -> ReportTimeEntry:
+        return self._bind(ReportTimeEntry)
+
+    def warmup(self, validate_auth: bool = False) -> None:
+        """Connect to every distinct API origin in parallel before the first real request.
+
+        With `validate_auth` the main origin is warmed up by `CurrentUser.logged`,
+        so invalid credentials raise `ClientError` here instead of on user action.
+        """
+        tasks: Dict[Tuple[str, str, Optional[int]], Callable[[], object]] = {}
+        if validate_auth:
+            tasks[self.current_user.origin] = self.current_user.logged
+        for entity in (self.current_user, self.workspace, self.report_time_entry):
+            tasks.setdefault(entity.origin, entity.warmup)
+
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(task) for task in tasks.values()]
+            for future in futures:
+                _ = future.result()
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class AsyncTogglSession:
+    """Non-blocking twin of `TogglSession`."""
+
+    def __init__(
+        self,
+        auth: Union[BasicAuth, TokenAuth],
+        transport: Optional[AsyncBaseTransport] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry: Optional[RetryPolicy] = None,
+        validator_cache: Optional[ValidatorCache] = None,
+        limits: Optional[Limits] = None,
+        timeout: Union[float, Timeout, None] = None,
+        on_transfer: Optional[Callable[[TransferStats], None]] = None,
+        validate_responses: Union[ValidationMode, str] = ValidationMode.full,
+        validation_sample_rate: int = DEFAULT_SAMPLE_RATE,
+        intern_pool: Optional[InternPool] = None,
+    ) -> None:
+        self.auth = auth
+        self.transport = transport or AsyncHTTPTransport(
+            http2=True, limits=limits or DEFAULT_LIMITS, proxy=get_environment_proxy(ROOT_URL)
+        )
+        self.rate_limit = rate_limit
+        self.retry = retry
+        self.validator_cache = validator_cache
+        self.timeout = timeout
+        self.on_transfer = on_transfer
+        self.validate_responses = validate_responses
+        self.validation_sample_rate = validation_sample_rate
+        self.intern_pool = intern_pool
+        self._entities: Dict[Type[AsyncApiWrapper], AsyncApiWrapper] = {}
+
+    def _bind(self, entity_class: Type[AsyncApiWrapperT]) -> AsyncApiWrapperT:
+        if entity_class not in self._entities:
+            self._entities[entity_class] = entity_class(
+                self.auth,
+                transport=self.transport,
+                rate_limit=self.rate_limit,
+                retry=self.retry,
+                validator_cache=self.validator_cache,
+                timeout=self.timeout,
+                on_transfer=self.on_transfer,
+                validate_responses=self.validate_responses,
+                validation_sample_rate=self.validation_sample_rate,
+                intern_pool=self.intern_pool,
+            )
+
+        return self._entities[entity_class]
+
+    @property
+    def current_user(self) -> AsyncCurrentUser:
+        return self._bind(AsyncCurrentUser)
+
+    @property
+    def workspace(self) -> AsyncWorkspace:
+        return self._bind(AsyncWorkspace)
+
+    @property
+    def report_time_entry(self) -> AsyncReportTimeEntry:
+        return self._bind(AsyncReportTimeEntry)
+
+    async def warmup(self, validate_auth: bool = False) -> None:
+        tasks: Dict[Tuple[str, str, Optional[int]], Callable[[], Awaitable[object]]] = {}
+        if validate_auth:
+            tasks[self.current_user.origin] = self.current_user.logged
+        for entity in (self.current_user, self.workspace, self.report_time_entry):
+            tasks.setdefault(entity.origin, entity.warmup)
+
+        _ = await asyncio.gather(*(task() for task in tasks.values()))
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from enum import Enum
+from typing import Any, List, Optional, Sequence, Set, Tuple, Union
+
+from toggl_python.reports import ReportRow
+from toggl_python.schemas.report_time_entry import SearchReportTimeEntriesResponse
+
+
+ReportGroup = Union[SearchReportTimeEntriesResponse, ReportRow]
+DateRange = Tuple[date, date]
+
+
+class ShardSize(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+    # Start with months and split in halves until each shard fits in one page
+    auto = "auto"
+
+
+def parse_date(value: Union[date, str]) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def get_shard_end(start: date, size: ShardSize) -> date:
+    if size == ShardSize.day:
+        return start
+    if size == ShardSize.week:
+        return start + timedelta(days=6 - start.weekday())
+
+    next_month = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return next_month - timedelta(days=1)
+
+
+def split_date_range(
+    start_date: Union[date, str], end_date: Union[date, str], size: Union[ShardSize, str]
+) -> List[DateRange]:
+    """Split inclusive date range by calendar days, ISO weeks or months."""
+    start, end = parse_date(start_date), parse_date(end_date)
+    if start > end:
+        error_message = "Start date must not be later than end date"
+        raise ValueError(error_message)
+
+    size = ShardSize(size)
+    if size == ShardSize.auto:
+        size = ShardSize.month
+
+    date_ranges = []
+    while start <= end:
+        shard_end = min(get_shard_end(start, size), end)
+        date_ranges.append((start, shard_end))
+        start = shard_end + timedelta(days=1)
+
+    return date_ranges
+
+
+def bisect_date_range(date_range: DateRange) -> List[DateRange]:
+    start, end = date_range
+    middle = start + (end - start) // 2
+
+    return [(start, middle), (middle + timedelta(days=1), end)]
+
+
+def get_kept_amount(
+    amount: Optional[int], time_entries: Sequence[Any], kept_time_entries: Sequence[Any]
+) -> Optional[int]:
+    """Reduce row amount by the share of seconds of dropped duplicate time entries."""
+    if amount is None or len(kept_time_entries) == len(time_entries):
+        return amount
+
+    total_seconds = sum(time_entry.seconds for time_entry in time_entries)
+    if not total_seconds:
+        return round(amount * len(kept_time_entries) / len(time_entries))
+
+    kept_seconds = sum(time_entry.seconds for time_entry in kept_time_entries)
+    return round(amount * kept_seconds / total_seconds)
+
+
+def merge_shards(shards: Sequence[Sequence[ReportGroup]]) -> List[ReportGroup]:
+    """Concatenate results of date range shards ordered by date.
+
+    Time entries already returned by a previous shard are dropped, rows left without
+    time entries are skipped. Rows are renumbered from 1.
+    """
+    seen_ids: Set[int] = set()
+    result: List[ReportGroup] = []
+    for shard in shards:
+        for group in shard:
+            time_entries = []
+            for time_entry in group.time_entries:
+                if time_entry.id not in seen_ids:
+                    seen_ids.add(time_entry.id)
+                    time_entries.append(time_entry)
+            if not time_entries:
+                continue
+
+            update = {
+                "row_number": len(result) + 1,
+                "billable_amount_in_cents": get_kept_amount(
+                    group.billable_amount_in_cents, group.time_entries, time_entries
+                ),
+            }
+            if isinstance(group, ReportRow):
+                result.append(group._replace(time_entries=tuple(time_entries), **update))
+            else:
+                result.append(group.model_copy(update={"time_entries": time_entries, **update}))
+
+    return result
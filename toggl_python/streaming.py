@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+
+# Only these bytes change nesting outside of strings, everything else is skipped by regex
+STRUCTURAL_BYTES = re.compile(rb'["\[\]{},]')
+STRING_BYTES = re.compile(rb'["\\]')
+WHITESPACE = b" \t\r\n"
+
+
+class JsonArraySplitter:
+    """Split top-level JSON array into raw elements while body is being downloaded.
+
+    Elements are not parsed, so each one can be validated by pydantic-core directly.
+    Only the current incomplete element is buffered, so memory does not grow with body size.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+        self._element_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._is_finished = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Return elements completed by this chunk."""
+        if self._is_finished:
+            self._check_trailing_data(chunk)
+            return []
+
+        self._buffer += chunk
+        elements: List[bytes] = []
+        if self._depth == 0 and not self._find_array_start():
+            return elements
+
+        position = self._position
+        while position < len(self._buffer) and not self._is_finished:
+            if self._in_string:
+                position = self._skip_string(position)
+            else:
+                position = self._scan_structure(position, elements)
+
+        if self._is_finished:
+            self._check_trailing_data(self._buffer[position:])
+            self._buffer.clear()
+            return elements
+
+        # Drop already returned elements, keep only the incomplete one
+        offset = self._element_start or 0
+        del self._buffer[:offset]
+        self._element_start = 0
+        self._position = position - offset
+
+        return elements
+
+    def close(self) -> None:
+        """Make sure that the whole array has been received."""
+        if not self._is_finished:
+            error_message = "Response body is not a complete JSON array"
+            raise ValueError(error_message)
+
+    def _skip_string(self, position: int) -> int:
+        match = STRING_BYTES.search(self._buffer, position)
+        if match is None:
+            return len(self._buffer)
+
+        position = match.start()
+        # Skip escaped character, even if it is in the next chunk
+        if self._buffer[position] == ord("\\"):
+            return position + 2
+
+        self._in_string = False
+
+        return position + 1
+
+    def _scan_structure(self, position: int, elements: List[bytes]) -> int:
+        match = STRUCTURAL_BYTES.search(self._buffer, position)
+        if match is None:
+            return len(self._buffer)
+
+        position = match.start()
+        byte = self._buffer[position]
+        if byte == ord('"'):
+            self._in_string = True
+        elif byte in b"[{":
+            self._depth += 1
+        elif byte in b"]}":
+            self._depth -= 1
+            if self._depth == 0:
+                self._append_element(elements, position)
+                self._is_finished = True
+        elif self._depth == 1:
+            self._append_element(elements, position)
+            self._element_start = position + 1
+
+        return position + 1
+
+    def _find_array_start(self) -> bool:
+        start = len(self._buffer) - len(self._buffer.lstrip(WHITESPACE))
+        if start == len(self._buffer):
+            self._buffer.clear()
+            return False
+        if self._buffer[start] != ord("["):
+            error_message = "Response body is not a JSON array"
+            raise ValueError(error_message)
+
+        self._depth = 1
+        self._element_start = start + 1
+        self._position = start + 1
+
+        return True
+
+    def _append_element(self, elements: List[bytes], end: int) -> None:
+        element = bytes(self._buffer[self._element_start : end].strip(WHITESPACE))
+        if element:
+            elements.append(element)
+
+    @staticmethod
+    def _check_trailing_data(data: bytes) -> None:
+        if data.strip(WHITESPACE):
+            error_message = "Unexpected data after JSON array"
+            raise ValueError(error_message)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, TypeVar, Union
+
+
+try:
+    import zoneinfo
+except ImportError:
+    from backports import zoneinfo
+
+
+T = TypeVar("T")
+
+# UTC offsets and their transitions are aligned to 15 minutes in tz database since 1970s,
+# so all timestamps within the same quarter of an hour share a local date
+QUARTER_SECONDS: int = 15 * 60
+
+
+@lru_cache(maxsize=None)
+def get_available_timezones() -> FrozenSet[str]:
+    """Load timezone names once, `available_timezones` walks tzdata files on every call."""
+    return frozenset(zoneinfo.available_timezones())
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> zoneinfo.ZoneInfo:
+    if name not in get_available_timezones():
+        error_message = f"Specified timezone {name} is invalid"
+        raise ValueError(error_message)
+
+    return zoneinfo.ZoneInfo(name)
+
+
+def to_local_datetimes(
+    values: Iterable[Union[datetime, int]], timezone_name: str
+) -> List[datetime]:
+    """Convert aware datetimes or epoch seconds (e.g. `ReportRow` fields) to user timezone."""
+    zone = get_zone(timezone_name)
+
+    return [
+        datetime.fromtimestamp(value, tz=zone)
+        if isinstance(value, int)
+        else value.astimezone(zone)
+        for value in values
+    ]
+
+
+def to_local_dates(epochs: Iterable[int], timezone_name: str) -> List[date]:
+    """Return local date of every epoch, dates are computed once per quarter of an hour.
+
+    Accepts any iterable of ints, e.g. `ReportColumns.start` array.
+    """
+    zone = get_zone(timezone_name)
+    dates: Dict[int, date] = {}
+    result = []
+    for epoch in epochs:
+        quarter = epoch // QUARTER_SECONDS
+        local_date = dates.get(quarter)
+        if local_date is None:
+            local_date = datetime.fromtimestamp(quarter * QUARTER_SECONDS, tz=zone).date()
+            dates[quarter] = local_date
+        result.append(local_date)
+
+    return result
+
+
+def bucket_by_day(
+    items: Iterable[T], timezone_name: str, key: Callable[[T], int]
+) -> Dict[date, List[T]]:
+    """Group items by local date of epoch returned by `key`, e.g. `lambda row: row.start`."""
+    items = list(items)
+    buckets: Dict[date, List[T]] = {}
+    for item, local_date in zip(items, to_local_dates(map(key, items), timezone_name)):
+        buckets.setdefault(local_date, []).append(item)
+
+    return buckets
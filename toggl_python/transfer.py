@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+
+class TransferStats(NamedTuple):
+    """Size of one response body on the wire and after decompression."""
+
+    method: str
+    url: str
+    content_encoding: Optional[str]
+    wire_bytes: int
+    decoded_bytes: int
+
+    @classmethod
+    def from_response(cls, response: Response) -> TransferStats:
+        """Must be called after response body is read."""
+        return cls(
+            method=response.request.method,
+            url=str(response.request.url),
+            content_encoding=response.headers.get("Content-Encoding"),
+            wire_bytes=response.num_bytes_downloaded,
+            decoded_bytes=len(response.content),
+        )
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.decoded_bytes - self.wire_bytes
+
+    @property
+    def compression_ratio(self) -> float:
+        if not self.wire_bytes:
+            return 1.0
+
+        return self.decoded_bytes / self.wire_bytes